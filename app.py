@@ -1,17 +1,73 @@
 import tkinter as tk
 from tkinter import ttk
-from tkcalendar import Calendar
 import datetime
+import os
+import threading
+import time
+import zlib
 
+import app_config
+import instrumentation
 import report_store
-from tabs import PersonalTab, SharedTab, WeeklyTab, SpareTab
+import undo_log
+from store_worker import StoreWorker
+
+
+# 카테고리별 달력 표시 색 (config의 calendar.categories에 없으면 카테고리 이름으로 고정 선택)
+MARKER_COLORS = ["#FFD6D6", "#FFE8C2", "#FFF6B8", "#D9F5C9", "#CDEBFF", "#DCD6FF", "#F5D6F0", "#D6F0EC"]
+MARKER_DEFAULT_COLOR = "#E0E0E0"
+
+
+# (속성 이름, 탭 제목, tabs 모듈의 클래스 이름) — 탭은 처음 선택될 때 만든다
+TAB_SPECS = [
+    ("personal_tab", "개인업무", "PersonalTab"),
+    ("shared_tab", "공통업무", "SharedTab"),
+    ("weekly_tab", "개인주간업무보고", "WeeklyTab"),
+    ("spare_tab", "예비", "SpareTab"),
+]
+
+
+class StartupTimer:
+    """시작 단계별 경과 시간 기록 (REPORT_STARTUP_TIMING=1 또는 main.py --timing이면 출력)"""
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self.start = time.perf_counter()
+        self.marks = []
+
+    def mark(self, label):
+        self.marks.append((label, time.perf_counter()))
+
+    def report(self):
+        if not self.enabled:
+            return
+        print("시작 시간 (ms)")
+        prev = self.start
+        for label, t in sorted(self.marks, key=lambda m: m[1]):
+            print(f"  {label:<20} {(t - self.start) * 1000:8.1f}  (+{(t - prev) * 1000:.1f})")
+            prev = t
 
 
 class ReportApp:
-    def __init__(self):
-        self.store = report_store.ReportStore()
+    # config.json 수정 시각 확인 주기 (ms)
+    CONFIG_POLL_MS = 2000
+
+    def __init__(self, timing=None, instrument=None):
+        if timing is None:
+            timing = os.environ.get("REPORT_STARTUP_TIMING") == "1"
+        self.timer = StartupTimer(timing)
+        # 계측은 켠 경우에만 (REPORT_INSTRUMENT=1, --instrument, config의 instrumentation.enabled)
+        instrumentation.configure(app_config.load_config(), instrument)
+
+        # 저장소는 창을 만드는 동안 백그라운드에서 읽는다 (self.store는 읽기가 끝날 때까지 기다림)
+        self._store = None
+        self._store_loader = threading.Thread(target=self._load_store, daemon=True)
+        self._store_loader.start()
+
         self.root = tk.Tk()
         self.root.geometry("1200x500")
+        # 조회/저장은 작업 스레드에서 하고 결과만 root.after로 받아 그린다 (입력 처리가 멈추지 않도록)
+        self.worker = StoreWorker(self.root)
+        self.timer.mark("window")
 
         # top toolbar (above tabs and calendar)
         self.toolbar = tk.Frame(self.root)
@@ -22,6 +78,9 @@ class ReportApp:
         self.left_frame = tk.Frame(self.root)
         self.left_frame.pack(side="left", fill="both", expand=True)
 
+        # tkcalendar는 무거워서 창을 만든 뒤에 불러온다
+        from tkcalendar import Calendar
+        self.timer.mark("import tkcalendar")
         self.cal = Calendar(
             self.left_frame,
             selectmode="day",
@@ -52,7 +111,6 @@ class ReportApp:
                 self.cal.calevent_create(d, "week", "thisweek")
             except Exception:
                 self.cal.calevent_create(d.strftime("%Y-%m-%d"), "week", "thisweek")
-        self.cal.tag_config("thisweek", background="#E6E6E6")
 
         # next week (Mon-Fri) - light blue
         next_monday = monday + datetime.timedelta(days=7)
@@ -62,7 +120,6 @@ class ReportApp:
                 self.cal.calevent_create(d, "week_next", "nextweek")
             except Exception:
                 self.cal.calevent_create(d.strftime("%Y-%m-%d"), "week_next", "nextweek")
-        self.cal.tag_config("nextweek", background="#7FBFFF", foreground="#7FBFFF")
 
         # week after next (Mon-Fri) - deeper blue
         nextnext_monday = monday + datetime.timedelta(days=14)
@@ -72,37 +129,42 @@ class ReportApp:
                 self.cal.calevent_create(d, "week_nextnext", "nextnextweek")
             except Exception:
                 self.cal.calevent_create(d.strftime("%Y-%m-%d"), "week_nextnext", "nextnextweek")
-        self.cal.tag_config("nextnextweek", background="#3F8BFF", foreground="#3F8BFF")
 
         # tag for today (yellow text, adjusted for contrast)
         try:
             self.cal.calevent_create(today, "today", "today")
         except Exception:
             self.cal.calevent_create(today_str, "today", "today")
-        self.cal.tag_config("today", foreground="#FFAA00")
 
-        # make selected day visually distinct: red text only (no background change)
-        try:
-            self.cal.configure(selectforeground="#FF0000")
-        except Exception:
-            pass
+        # 강조 색은 config.json의 calendar 항목에서 (바뀌면 바로 다시 적용)
+        self._marker_tags = set()
+        self._category_colors = {}
+        self._apply_calendar_config(app_config.load_config())
         self.cal.bind("<<CalendarSelected>>", self.on_date_select)
 
+        # 보고서가 있는 날 카테고리별 표시: (날짜, 카테고리) -> calevent id
+        self._markers = {}
+        self._markers_pending = False
+        self._unsubscribe_store = None
+        self.cal.bind("<<CalendarMonthChanged>>", lambda e: self.refresh_markers())
+
+        self.timer.mark("calendar")
+
         # Notebook (tabs) for the right side
         self.notebook = ttk.Notebook(self.root)
         self.notebook.pack(side="right", fill="both", expand=True)
 
-        # Initialize tab instances (named to match tab labels)
-        self.personal_tab = PersonalTab(self.notebook, self.store)
-        self.shared_tab = SharedTab(self.notebook, self.store)
-        self.weekly_tab = WeeklyTab(self.notebook, self.store)
-        self.spare_tab = SpareTab(self.notebook, self.store)
-
-        # Add tabs to notebook (labels kept in Korean)
-        self.notebook.add(self.personal_tab.get_frame(), text="개인업무")
-        self.notebook.add(self.shared_tab.get_frame(), text="공통업무")
-        self.notebook.add(self.weekly_tab.get_frame(), text="개인주간업무보고")
-        self.notebook.add(self.spare_tab.get_frame(), text="예비")
+        # 탭 자리만 먼저 만들고 (labels kept in Korean), 내용은 처음 선택될 때 만든다
+        self.current_date = datetime.date.today().strftime("%Y-%m-%d")
+        # 탭 속성 이름 -> 그 탭에 마지막으로 넘긴 날짜 (숨은 탭은 선택될 때 맞춘다)
+        self._tab_dates = {}
+        self._tab_pages = []
+        for attr, label, _cls in TAB_SPECS:
+            setattr(self, attr, None)
+            page = tk.Frame(self.notebook)
+            self.notebook.add(page, text=label)
+            self._tab_pages.append(page)
+        self.notebook.bind("<<NotebookTabChanged>>", lambda e: self._ensure_tab(self.notebook.index("current")))
 
         # keyboard shortcuts: 't' and Ctrl+T
         try:
@@ -110,26 +172,204 @@ class ReportApp:
             self.root.bind('<Control-t>', lambda e: self.go_to_today())
         except Exception:
             pass
+        # 되돌리기/다시 실행: Ctrl+Z, Ctrl+Y (Ctrl+Shift+Z)
+        self.root.bind('<Control-z>', self.undo_last)
+        self.root.bind('<Control-y>', self.redo_last)
+        self.root.bind('<Control-Z>', self.redo_last)
+
+        # config.json이 바뀌면 재시작 없이 적용
+        app_config.subscribe(lambda cfg: self.root.after(0, self._apply_calendar_config, cfg), "calendar")
+        app_config.subscribe(lambda cfg: self.root.after(0, self._reopen_store, cfg), ("data_dir", "storage"))
+        self.root.after(self.CONFIG_POLL_MS, self._poll_config)
 
-        # initialize tabs with today's date so shared/personal both have data loaded
+        # 첫 화면이 뜬 다음 저장소가 필요한 나머지를 채운다
+        self.root.after(1, self._finish_startup)
+
+    def _load_store(self):
         try:
-            today = datetime.date.today().strftime("%Y-%m-%d")
-            self.personal_tab.set_date(today)
-            self.shared_tab.set_date(today)
-        except Exception:
-            pass
+            t0 = time.perf_counter()
+            store = report_store.open_store()
+            instrumentation.record("store.open", (time.perf_counter() - t0) * 1000)
+            store.enable_undo(**undo_log.undo_options(app_config.load_config()))
+            if instrumentation.enabled():
+                instrumentation.instrument_store(store)
+            self._store = store
+        except Exception as e:
+            print(f"저장소 로드 실패: {e}")
+        self.timer.mark("store loaded")
 
-    def on_date_select(self, event):
-        date = self.cal.get_date()
-        # update both personal and shared tabs with selected date
+    @property
+    def store(self):
+        if self._store is None:
+            self._store_loader.join()
+            if self._store is None:
+                # 백그라운드 로드가 실패했으면 여기서 다시 열어 오류를 그대로 드러낸다
+                self._store = report_store.open_store()
+        return self._store
+
+    def _finish_startup(self):
+        self.timer.mark("first frame")
+        # initialize the visible tab with today's date
+        self._ensure_tab(self.notebook.index("current"))
+        self.timer.mark("first tab")
+        self._unsubscribe_store = self.store.subscribe(self.worker.main_thread(self._on_store_change))
+        self.refresh_markers()
+        self.timer.mark("markers")
+        self.timer.report()
+
+    def _ensure_tab(self, index, force=False):
+        """index 번째 탭을 아직 만들지 않았으면 만들고, 그 탭의 날짜가 선택 날짜와 다르면 넘긴다
+        (force면 같은 날짜여도 다시 넘긴다)"""
+        attr, _label, cls_name = TAB_SPECS[index]
+        tab = getattr(self, attr)
+        if tab is None:
+            import tabs
+            tab = getattr(tabs, cls_name)(self._tab_pages[index], self.store, worker=self.worker)
+            tab.get_frame().pack(fill="both", expand=True)
+            setattr(self, attr, tab)
+        if hasattr(tab, "set_date") and (force or self._tab_dates.get(attr) != self.current_date):
+            self._tab_dates[attr] = self.current_date
+            try:
+                tab.set_date(self.current_date)
+            except Exception:
+                pass
+        return tab
+
+    def _poll_config(self):
         try:
-            self.personal_tab.set_date(date)
+            app_config.check()
+        finally:
+            self.root.after(self.CONFIG_POLL_MS, self._poll_config)
+
+    def _apply_calendar_config(self, config):
+        """주 강조/오늘/선택 색과 카테고리 표시 색을 config에 맞춘다"""
+        cal_cfg = app_config.calendar_config(config)
+        for tag in ("thisweek", "nextweek", "nextnextweek", "today"):
+            options = cal_cfg.get(tag)
+            if isinstance(options, dict) and options:
+                try:
+                    self.cal.tag_config(tag, **options)
+                except Exception as e:
+                    print(f"달력 색 설정 실패 ({tag}): {e}")
+        # make selected day visually distinct: text color only (no background change)
+        try:
+            self.cal.configure(selectforeground=cal_cfg.get("selectforeground") or "#FF0000")
         except Exception:
             pass
+        categories = cal_cfg.get("categories")
+        self._category_colors = categories if isinstance(categories, dict) else {}
+        for tag in self._marker_tags:
+            self._config_marker_tag(tag[len("cat:"):])
+
+    def _reopen_store(self, config):
+        """data_dir/storage 설정이 바뀌면 지금 저장소를 기록하고 새 위치의 저장소로 바꾼다"""
+        old = self.store
+        try:
+            # 남은 변경을 기록하고 저장 스레드/종료 시 저장 등록까지 정리 (예전 위치에 다시 쓰지 않도록)
+            old.save_to_json()
+            old.close()
+        except Exception as e:
+            print(f"저장 실패: {e}")
+        self._store = report_store.open_store(config)
+        self._store.enable_undo(**undo_log.undo_options(config))
+        if instrumentation.enabled():
+            instrumentation.instrument_store(self._store)
+        if self._unsubscribe_store is not None:
+            self._unsubscribe_store()
+        self._unsubscribe_store = self._store.subscribe(self.worker.main_thread(self._on_store_change))
+        for attr, _label, _cls in TAB_SPECS:
+            tab = getattr(self, attr)
+            if tab is None:
+                continue
+            if hasattr(tab, "set_store"):
+                tab.set_store(self._store)
+            else:
+                tab.store = self._store
+        # 보이는 탭만 바로 다시 읽고 나머지는 선택될 때
+        self._tab_dates = {}
+        self._ensure_tab(self.notebook.index("current"))
+        self.refresh_markers()
+
+    def _config_marker_tag(self, category):
+        color = self._category_colors.get(category)
+        if not color:
+            if category:
+                color = MARKER_COLORS[zlib.crc32(category.encode("utf-8")) % len(MARKER_COLORS)]
+            else:
+                color = MARKER_DEFAULT_COLOR
+        self.cal.tag_config(f"cat:{category}", background=color, foreground="black")
+
+    def _marker_tag(self, category):
+        tag = f"cat:{category}"
+        if tag not in self._marker_tags:
+            self._config_marker_tag(category)
+            self._marker_tags.add(tag)
+        return tag
+
+    def _displayed_range(self):
+        """달력 화면이 보여주는 기간 ('YYYY-MM-DD', 'YYYY-MM-DD'). 알 수 없으면 None"""
         try:
-            self.shared_tab.set_date(date)
+            month, year = self.cal.get_displayed_month()
         except Exception:
-            pass
+            return None
+        first = datetime.date(year, month, 1)
+        # 달력 화면은 1일이 있는 주부터 6주를 보여준다
+        lo = first - datetime.timedelta(days=7)
+        hi = first + datetime.timedelta(days=42)
+        return lo.strftime("%Y-%m-%d"), hi.strftime("%Y-%m-%d")
+
+    def _on_store_change(self, event):
+        """보고서 변경 알림: 보이는 달에 걸친 변경이면 달력 표시를 한 번만 (idle 때) 다시 맞춘다"""
+        if self._markers_pending:
+            return
+        shown = self._displayed_range()
+        if shown is not None and event.touches(start=shown[0], end=shown[1]):
+            self._markers_pending = True
+            self.root.after_idle(self._refresh_markers_pending)
+
+    def _refresh_markers_pending(self):
+        self._markers_pending = False
+        self.refresh_markers()
+
+    def refresh_markers(self):
+        """보이는 달(앞뒤 주 포함)의 보고서를 작업 스레드에서 한 번에 조회해 카테고리 표시를 맞춘다
+        이미 있는 표시는 그대로 두고, 없어진 것만 지우고 새로 생긴 것만 만든다.
+        """
+        shown = self._displayed_range()
+        if shown is None:
+            return
+        store = self.store
+        self.worker.submit(lambda: self._marker_keys(store, *shown), on_done=self._apply_markers, key="markers")
+
+    @staticmethod
+    def _marker_keys(store, lo, hi):
+        wanted = set()
+        for day, entries in store.find_reports_in_range(lo, hi).items():
+            for _ow, _orig, _idx, r in entries:
+                wanted.add((day, r.category))
+        return wanted
+
+    @instrumentation.handler
+    def _apply_markers(self, wanted):
+        for key in [k for k in self._markers if k not in wanted]:
+            try:
+                self.cal.calevent_remove(self._markers.pop(key))
+            except Exception:
+                pass
+        for key in sorted(wanted - self._markers.keys()):
+            day, category = key
+            try:
+                ev_id = self.cal.calevent_create(datetime.datetime.strptime(day, "%Y-%m-%d").date(),
+                                                 category or "업무", self._marker_tag(category))
+            except Exception:
+                continue
+            self._markers[key] = ev_id
+
+    @instrumentation.handler
+    def on_date_select(self, event):
+        self.current_date = self.cal.get_date()
+        # 보이는 탭만 바로 바꾼다 (나머지는 선택될 때 _ensure_tab에서 current_date를 받는다)
+        self._ensure_tab(self.notebook.index("current"), force=True)
 
     def go_to_today(self):
         today = datetime.date.today()
@@ -142,16 +382,41 @@ class ReportApp:
             except Exception:
                 pass
         # trigger tab update
-        try:
-            self.personal_tab.set_date(today.strftime("%Y-%m-%d"))
-            self.shared_tab.set_date(today.strftime("%Y-%m-%d"))
-        except Exception:
-            pass
+        self.current_date = today.strftime("%Y-%m-%d")
+        self._ensure_tab(self.notebook.index("current"), force=True)
+
+    @staticmethod
+    def _typing(event):
+        """입력칸에서 누른 단축키는 글자 편집용으로 둔다"""
+        return isinstance(getattr(event, "widget", None), (tk.Entry, tk.Text, ttk.Entry))
+
+    def undo_last(self, event=None):
+        """마지막 보고서 변경 되돌리기 (탭 목록과 달력은 변경 알림으로 갱신)"""
+        log = self.store.undo
+        if self._typing(event) or log is None:
+            return
+        if log.undo() is not None:
+            self.worker.submit(self.store.save_to_json)
+
+    def redo_last(self, event=None):
+        log = self.store.undo
+        if self._typing(event) or log is None:
+            return
+        if log.redo() is not None:
+            self.worker.submit(self.store.save_to_json)
 
     def run(self):
         self.root.mainloop()
-        # 프로그램 종료 시 JSON 저장
+        # 진행 중인 작업이 끝나기를 기다린 뒤 (남은 조회는 버림) 종료 시 JSON 저장
+        self.worker.close()
+        # 백그라운드 저장 대기분까지 즉시 기록하고 닫는다
         self.store.save_to_json()
+        self.store.close()
+        if instrumentation.enabled():
+            try:
+                instrumentation.export(app_config.data_dir() / "instrumentation.json")
+            except Exception as e:
+                print(f"계측 결과 저장 실패: {e}")
 
     # Deprecated methods kept for backward compatibility if needed
     def save_report(self):
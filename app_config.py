@@ -0,0 +1,209 @@
+import json
+import os
+import threading
+from pathlib import Path
+
+
+SCRIPT_DIR = Path(__file__).parent
+
+DEFAULT_CONFIG = {
+    "name": "작성자",
+    "data_dir": "data",
+    "weekly_report_dir": {
+        "json_dir": "./data/weekly_report_json",
+        "xlsx_dir": "./data/weekly_report_xlsx"
+    },
+    "calendar": {
+        "thisweek": {"background": "#E6E6E6"},
+        "nextweek": {"background": "#7FBFFF"},
+        "nextnextweek": {"background": "#3F8BFF"},
+        "today": {"foreground": "#FFAA00"},
+        "selectforeground": "#FF0000",
+        "categories": {}
+    },
+    "xlsx_template": {},
+    "storage": {"backend": "json", "journal": False, "save_delay": 1.0},
+    "instrumentation": {"enabled": False, "frame_budget_ms": 16},
+    "undo": {"max_steps": 100, "max_kb": 1024, "persist": False}
+}
+
+# 예전 버전이 기본값으로 만들던 config.json의 주 강조 색 (글자색 = 배경색이라 날짜가 보이지 않음)
+_BASELINE_WEEK_COLORS = {
+    "thisweek": {"background": "#FFFFFF", "foreground": "#FFFFFF"},
+    "nextweek": {"background": "#167FFF", "foreground": "#167FFF"},
+    "nextnextweek": {"background": "#167FFF", "foreground": "#167FFF"},
+}
+
+
+class ConfigService:
+    """config.json을 한 번 읽어 두고, 파일 수정 시각(mtime)이 바뀌었을 때만 다시 읽는다
+
+    data/config.json이 있으면 그것을, 없으면 루트 config.json을 쓴다. 둘 다 없으면 루트에 기본값을 만든다.
+    check()로 바뀐 것을 확인하면 subscribe()한 콜백에 새 config를 넘긴다
+    (key를 주면 그 항목이 바뀐 경우만, key 목록이면 그중 하나라도 바뀌었을 때 한 번).
+    get()이 돌려주는 dict는 공유되므로 읽기만 한다.
+    """
+
+    def __init__(self, paths=None):
+        # prefer config.json inside the data folder if present (user requested)
+        self.paths = [Path(p) for p in paths] if paths else [SCRIPT_DIR / "data" / "config.json",
+                                                             SCRIPT_DIR / "config.json"]
+        self._lock = threading.RLock()
+        self._config = None
+        self._path = None
+        self._mtime = None
+        self._subscribers = []
+
+    @property
+    def path(self):
+        """지금 쓰고 있는 config 파일 (없으면 None)"""
+        return self._path
+
+    def get(self):
+        with self._lock:
+            if self._config is None:
+                self._config, self._path, self._mtime = self._read()
+            return self._config
+
+    def check(self):
+        """파일이 바뀌었으면 다시 읽고 구독자에게 알림. 바뀌었으면 True"""
+        with self._lock:
+            if self._config is None:
+                self.get()
+                return False
+            path = self._active_path()
+            if path == self._path and self._stat(path) == self._mtime:
+                return False
+            old = self._config
+            self._config, self._path, self._mtime = self._read()
+            new = self._config
+            subscribers = list(self._subscribers)
+        for callback, key in subscribers:
+            if key is not None and all(old.get(k) == new.get(k) for k in key):
+                continue
+            try:
+                callback(new)
+            except Exception as e:
+                print(f"설정 변경 적용 실패: {e}")
+        return True
+
+    def subscribe(self, callback, key=None):
+        """config가 바뀌면 callback(config) 호출. key를 주면 그 항목이 바뀐 경우만. 해제 함수 반환
+        key는 목록도 된다 (여러 항목이 함께 바뀌어도 한 번만 호출).
+        """
+        if isinstance(key, str):
+            key = (key,)
+        entry = (callback, tuple(key) if key is not None else None)
+        with self._lock:
+            self._subscribers.append(entry)
+
+        def unsubscribe():
+            with self._lock:
+                if entry in self._subscribers:
+                    self._subscribers.remove(entry)
+        return unsubscribe
+
+    def _active_path(self):
+        for path in self.paths:
+            if path.exists():
+                return path
+        return None
+
+    @staticmethod
+    def _stat(path):
+        try:
+            return os.stat(path).st_mtime_ns if path is not None else None
+        except OSError:
+            return None
+
+    def _read(self):
+        path = self._active_path()
+        if path is None:
+            # neither config exists -> create default root config.json
+            path = self.paths[-1]
+            try:
+                with open(path, 'w', encoding='utf-8') as f:
+                    json.dump(DEFAULT_CONFIG, f, ensure_ascii=False, indent=2)
+            except Exception:
+                return json.loads(json.dumps(DEFAULT_CONFIG)), None, None
+        mtime = self._stat(path)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                cfg = json.load(f)
+        except Exception as e:
+            print(f"config 로드 실패: {e}")
+            # 편집 중인 파일을 읽다 실패하면 이전 설정을 유지 (다음 check에서 다시 시도)
+            if self._config is not None:
+                return self._config, path, None
+            return {}, path, mtime
+        return (cfg if isinstance(cfg, dict) else {}), path, mtime
+
+
+_service = ConfigService()
+
+
+def service():
+    return _service
+
+
+def load_config():
+    """config.json 읽기 (data/config.json 우선, 없으면 루트 config.json, 캐시됨)
+    둘 다 없으면 루트에 기본 config.json을 만든다.
+    """
+    return _service.get()
+
+
+def subscribe(callback, key=None):
+    return _service.subscribe(callback, key)
+
+
+def check():
+    return _service.check()
+
+
+def data_dir(config=None):
+    """보고서 데이터 폴더 (config의 data_dir, 기본값 data)"""
+    if config is None:
+        config = load_config()
+    return SCRIPT_DIR / (config.get("data_dir") or "data")
+
+
+def weekly_report_dir(config, kind):
+    """주간보고 출력 폴더 (config의 weekly_report_dir.json_dir / xlsx_dir, kind: 'json'|'xlsx')"""
+    dirs = config.get("weekly_report_dir") or {}
+    path = dirs.get(f"{kind}_dir") if isinstance(dirs, dict) else None
+    path = Path(path or DEFAULT_CONFIG["weekly_report_dir"][f"{kind}_dir"])
+    return path if path.is_absolute() else SCRIPT_DIR / path
+
+
+def storage_config(config):
+    storage_cfg = config.get("storage") or {}
+    return storage_cfg if isinstance(storage_cfg, dict) else {}
+
+
+def calendar_config(config):
+    """calendar 항목 (기본값 위에 config 값을 덮어씀)
+    예전 기본 config.json의 주 강조 색은 지금 기본값으로 바꾸고, 글자색이 배경색과 같으면
+    (날짜가 보이지 않으므로) 그 글자색은 쓰지 않는다.
+    """
+    defaults = DEFAULT_CONFIG["calendar"]
+    merged = json.loads(json.dumps(defaults))
+    custom = config.get("calendar") or {}
+    if isinstance(custom, dict):
+        for key, value in custom.items():
+            if isinstance(value, dict) and isinstance(merged.get(key), dict):
+                if _BASELINE_WEEK_COLORS.get(key) == value:
+                    continue
+                merged[key] = dict(value)
+                if _same_color(value.get("foreground"), value.get("background")):
+                    merged[key].pop("foreground")
+                    default_fg = defaults[key].get("foreground")
+                    if default_fg and not _same_color(default_fg, value.get("background")):
+                        merged[key]["foreground"] = default_fg
+            else:
+                merged[key] = value
+    return merged
+
+
+def _same_color(a, b):
+    return isinstance(a, str) and isinstance(b, str) and a.strip().lower() == b.strip().lower()
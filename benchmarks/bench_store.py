@@ -0,0 +1,256 @@
+"""ReportStore 벤치마크
+
+    python benchmarks/bench_store.py                        # 기본 크기로 재고 기준값과 비교
+    python benchmarks/bench_store.py --sizes 1000 50000 --backend sqlite
+    python benchmarks/bench_store.py --update-baseline      # 이번 결과를 기준값으로 저장
+
+크기마다 가상 이력(synthetic.py)을 임시 폴더에 만들고 연산별 지연 시간 백분위(p50/p95/p99, ms)와
+최대 메모리(tracemalloc, KB)를 잰다. 기준값(baselines.json)보다 tolerance배 넘게 느려지거나
+메모리를 더 쓰면 표시하고 종료 코드 1을 돌려준다. 기준값은 잰 컴퓨터에 따라 다르므로
+비교는 같은 컴퓨터에서 저장한 기준값끼리 한다.
+"""
+import argparse
+import gc
+import json
+import random
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(BENCH_DIR.parent))
+
+import synthetic  # noqa: E402
+from report_store import ReportStore  # noqa: E402
+
+
+DEFAULT_SIZES = [1000, 5000, 20000]
+DEFAULT_BASELINE = BENCH_DIR / "baselines.json"
+DEFAULT_TOLERANCE = 1.5
+# 이보다 짧은 차이(ms)는 측정 오차로 보고 비교하지 않는다
+NOISE_FLOOR_MS = 0.05
+NOISE_FLOOR_KB = 64
+
+QUERY_SAMPLES = 500
+MUTATION_SAMPLES = 200
+IO_REPEATS = 5
+
+
+def open_backend(backend, folder):
+    """임시 폴더에 backend 저장소를 연다 (자동 저장 없음)"""
+    folder = Path(folder)
+    json_file = folder / "data.json"
+    if backend == "sqlite":
+        from sqlite_store import SqliteReportStore
+        return SqliteReportStore(folder / "reports.db", json_file=json_file, config={})
+    if backend == "sharded":
+        from sharded_store import ShardedReportStore
+        return ShardedReportStore(folder / "shards", json_file=json_file, config={}, save_delay=0)
+    if backend == "snapshot":
+        from snapshot_store import SnapshotReportStore
+        return SnapshotReportStore(folder / "data.snap", json_file=json_file, config={}, save_delay=0)
+    return ReportStore(json_file, journal=False, save_delay=0, config={})
+
+
+def close_store(store):
+    """저장 스레드/종료 시 저장 등록까지 정리 (반복해서 여는 저장소가 쌓이지 않도록)"""
+    store.close()
+
+
+def percentiles(samples):
+    """ms 단위 표본 -> {p50, p95, p99, max, n} (nearest-rank)"""
+    ordered = sorted(samples)
+    n = len(ordered)
+
+    def rank(p):
+        return round(ordered[min(n - 1, max(0, int(p * n + 0.999999) - 1))], 4)
+    return {"p50": rank(0.50), "p95": rank(0.95), "p99": rank(0.99), "max": round(ordered[-1], 4), "n": n}
+
+
+def _timed(func, *args, **kwargs):
+    t0 = time.perf_counter()
+    func(*args, **kwargs)
+    return (time.perf_counter() - t0) * 1000
+
+
+def _peak_kb(func):
+    """func 실행 중 최대 메모리 (KB, tracemalloc 기준)"""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = func()
+        _current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, round(peak / 1024)
+
+
+def run_size(backend, size, seed=0):
+    """size건 이력으로 연산별 결과 {op: {p50, p95, p99, max, n[, peak_kb]}}"""
+    folder = tempfile.mkdtemp(prefix="bench_store_")
+    rng = random.Random(seed)
+    results = {}
+    try:
+        store = open_backend(backend, folder)
+        synthetic.populate(store, size, seed=seed)
+        close_store(store)
+
+        # load: 저장된 파일에서 새 저장소를 여는 데까지 (load_from_json 포함)
+        samples = []
+        for _ in range(IO_REPEATS):
+            gc.collect()
+            t0 = time.perf_counter()
+            store = open_backend(backend, folder)
+            samples.append((time.perf_counter() - t0) * 1000)
+            close_store(store)
+        results["load_from_json"] = percentiles(samples)
+        store, results["load_from_json"]["peak_kb"] = _peak_kb(lambda: open_backend(backend, folder))
+
+        dates = synthetic.random_dates(QUERY_SAMPLES, seed=seed + 1)
+        results["find_reports_for_date"] = percentiles([_timed(store.find_reports_for_date, d) for d in dates])
+        results["list_categories"] = percentiles([_timed(store.list_categories) for _ in range(QUERY_SAMPLES)])
+        results["list_categories_by_frequency"] = percentiles(
+            [_timed(store.list_categories, by_frequency=True) for _ in range(QUERY_SAMPLES)])
+
+        new_items = list(synthetic.generate(MUTATION_SAMPLES, seed=seed + 2))
+        results["add_report"] = percentiles(
+            [_timed(store.add_report, date, report, owner) for owner, date, report in new_items])
+
+        samples = []
+        for d in synthetic.random_dates(MUTATION_SAMPLES * 3, seed=seed + 3):
+            if len(samples) >= MUTATION_SAMPLES:
+                break
+            found = store.find_reports_for_date(d)
+            if not found:
+                continue
+            owner, orig_date, index, report = found[0]
+            target = dates[rng.randrange(len(dates))]
+            samples.append(_timed(store.move_report, orig_date, target, index, report, owner))
+        results["move_report"] = percentiles(samples)
+
+        # save: 매번 한 건을 바꾼 뒤 저장 (바뀐 것만 쓰는 저장소도 실제로 쓰도록)
+        items = list(synthetic.generate(IO_REPEATS + 1, seed=seed + 4))
+        samples = []
+        for owner, date, report in items[:-1]:
+            store.add_report(date, report, owner)
+            samples.append(_timed(store.save_to_json))
+        results["save_to_json"] = percentiles(samples)
+        owner, date, report = items[-1]
+        store.add_report(date, report, owner)
+        _, results["save_to_json"]["peak_kb"] = _peak_kb(store.save_to_json)
+        close_store(store)
+    finally:
+        shutil.rmtree(folder, ignore_errors=True)
+    return results
+
+
+def compare(current, baseline, tolerance):
+    """기준값보다 나빠진 항목 [(op, 지표, 기준, 현재)]"""
+    regressions = []
+    for op, stats in current.items():
+        base = baseline.get(op)
+        if not base:
+            continue
+        for metric in ("p50", "p95"):
+            if metric in base and stats[metric] > base[metric] * tolerance \
+                    and stats[metric] - base[metric] > NOISE_FLOOR_MS:
+                regressions.append((op, metric, base[metric], stats[metric]))
+        if "peak_kb" in base and "peak_kb" in stats and stats["peak_kb"] > base["peak_kb"] * tolerance \
+                and stats["peak_kb"] - base["peak_kb"] > NOISE_FLOOR_KB:
+            regressions.append((op, "peak_kb", base["peak_kb"], stats["peak_kb"]))
+    return regressions
+
+
+def print_table(backend, size, results, regressions):
+    flagged = {(op, metric) for op, metric, _b, _c in regressions}
+    print(f"\n[{backend}] {size}건")
+    print(f"  {'연산':<30}{'p50':>10}{'p95':>10}{'p99':>10}{'max':>10}{'peak KB':>10}")
+    for op, stats in results.items():
+        cells = []
+        for metric in ("p50", "p95", "p99", "max"):
+            mark = "!" if (op, metric) in flagged else ""
+            cells.append(f"{stats[metric]:.3f}{mark}".rjust(10))
+        peak = stats.get("peak_kb")
+        peak_text = "" if peak is None else f"{peak}{'!' if (op, 'peak_kb') in flagged else ''}"
+        print(f"  {op:<30}{''.join(cells)}{peak_text:>10}")
+
+
+def print_scaling(backend, sizes, all_results):
+    """크기가 커질 때 연산별 p50이 몇 배가 되는지 (보고서 수 증가 배율과 비교)"""
+    if len(sizes) < 2:
+        return
+    small, large = sizes[0], sizes[-1]
+    print(f"\n[{backend}] {small}건 -> {large}건 (x{large / small:g}) p50 증가 배율")
+    for op in all_results[small]:
+        before = all_results[small][op]["p50"]
+        after = all_results[large][op]["p50"]
+        ratio = after / before if before else float("inf")
+        print(f"  {op:<30}x{ratio:.1f}")
+
+
+def load_baselines(path):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        return data if isinstance(data, dict) else {}
+    except FileNotFoundError:
+        return {}
+    except Exception as e:
+        print(f"기준값 로드 실패: {e}")
+        return {}
+
+
+def save_baselines(path, baselines):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(baselines, f, ensure_ascii=False, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="ReportStore 연산별 지연 시간/메모리 벤치마크")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="보고서 수 (여러 개)")
+    parser.add_argument("--backend", default="json", choices=("json", "sqlite", "sharded", "snapshot"))
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--baseline", default=str(DEFAULT_BASELINE), help="기준값 파일")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="기준값 대비 이 배수를 넘으면 회귀로 표시")
+    parser.add_argument("--update-baseline", action="store_true", help="이번 결과를 기준값으로 저장")
+    parser.add_argument("--json", help="결과를 이 파일에 JSON으로 저장")
+    args = parser.parse_args(argv)
+
+    baselines = load_baselines(args.baseline)
+    backend_base = baselines.get(args.backend, {})
+    sizes = sorted(set(args.sizes))
+    all_results = {}
+    regressions = []
+    for size in sizes:
+        results = run_size(args.backend, size, args.seed)
+        all_results[size] = results
+        found = compare(results, backend_base.get(str(size), {}), args.tolerance)
+        regressions.extend((size,) + r for r in found)
+        print_table(args.backend, size, results, found)
+    print_scaling(args.backend, sizes, all_results)
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({args.backend: {str(s): r for s, r in all_results.items()}}, f, ensure_ascii=False, indent=2)
+    if args.update_baseline:
+        baselines.setdefault(args.backend, {}).update({str(s): r for s, r in all_results.items()})
+        save_baselines(args.baseline, baselines)
+        print(f"\n기준값 저장: {args.baseline}")
+        return 0
+    if regressions:
+        print("\n기준값보다 나빠진 항목:")
+        for size, op, metric, base, current in regressions:
+            print(f"  {size}건 {op} {metric}: {base} -> {current}")
+        return 1
+    if not backend_base:
+        print("\n비교할 기준값이 없습니다 (--update-baseline으로 저장)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,92 @@
+"""벤치마크용 가상 보고서 이력 생성
+
+몇 년치 개인/공통 보고서를 만든다. 평일에 몰리고, 대부분 하루짜리지만 며칠~몇 주에 걸친
+보고서도 섞이며, 카테고리는 몇 개가 자주 쓰이고 나머지는 드물게 쓰인다 (Zipf 분포).
+같은 seed면 항상 같은 이력이 나온다.
+"""
+import random
+from datetime import date, timedelta
+
+
+CATEGORIES = [
+    "회의", "개발", "문서", "교육", "출장", "고객지원", "코드리뷰", "기획", "테스트", "배포",
+    "장애대응", "면담", "보고", "구매", "채용", "세미나", "외근", "휴가", "연구", "설계",
+    "유지보수", "데이터분석", "보안점검", "예산", "행사", "워크숍", "인프라", "품질관리", "마케팅", "기타",
+]
+
+SUBJECTS = ["주간 회의", "신규 기능", "고객 요청", "분기 계획", "성능 개선", "장애 원인 분석",
+            "업무 인수인계", "예산 검토", "보안 점검", "교육 자료", "릴리스 준비", "데이터 정리"]
+ACTIONS = ["진행", "검토", "정리", "작성", "논의", "완료", "보완", "공유", "준비", "확인"]
+DETAILS = ["관련 부서와 일정 조율", "이슈 목록 업데이트", "다음 주 후속 작업 정의", "결과 보고서 초안 작성",
+           "요구사항 재확인", "테스트 케이스 추가", "담당자 배정", "참고 자료 수집", "피드백 반영"]
+LOCATIONS = ["", "", "", "본사 3층 회의실", "본사 5층 대회의실", "판교 사무소", "고객사", "온라인", "세미나실 A"]
+NAMES = ["김민준", "이서연", "박지호", "최수아", "정도윤", "강하은", "조예준", "윤지우", "장서준", "임하린",
+         "한주원", "오채원", "서지안", "신유나", "권현우"]
+
+
+def _category(rng):
+    # 앞쪽 카테고리일수록 자주 쓰인다
+    weights = [1.0 / (i + 1) for i in range(len(CATEGORIES))]
+    return rng.choices(CATEGORIES, weights)[0]
+
+
+def _span(rng):
+    roll = rng.random()
+    if roll < 0.75:
+        return 0
+    if roll < 0.95:
+        return rng.randint(1, 4)
+    return rng.randint(5, 20)
+
+
+def _content(rng):
+    lines = [f"{rng.choice(SUBJECTS)} {rng.choice(ACTIONS)}"]
+    for _ in range(rng.randint(0, 3)):
+        lines.append(f"- {rng.choice(DETAILS)}")
+    return "\n".join(lines)
+
+
+def _day(rng, first, days):
+    while True:
+        d = first + timedelta(days=rng.randrange(days))
+        # 주말 보고서는 드물다
+        if d.weekday() < 5 or rng.random() < 0.1:
+            return d
+
+
+def generate(count, years=3, seed=0, end=None):
+    """(owner, date, report dict)를 count건 생성 (end 이전 years년 범위)"""
+    rng = random.Random(seed)
+    end = end or date(2026, 12, 31)
+    first = end.replace(year=end.year - years) + timedelta(days=1)
+    days = (end - first).days + 1
+    for _ in range(count):
+        start = _day(rng, first, days)
+        finish = start + timedelta(days=_span(rng))
+        owner = "personal" if rng.random() < 0.7 else "shared"
+        attendees = ", ".join(rng.sample(NAMES, rng.randint(0, 4)))
+        yield owner, start.isoformat(), {
+            "content": _content(rng),
+            "category": _category(rng),
+            "location": rng.choice(LOCATIONS),
+            "attendees": attendees,
+            "start_date": start.isoformat(),
+            "end_date": finish.isoformat(),
+        }
+
+
+def populate(store, count, years=3, seed=0):
+    """store에 가상 이력을 넣고 저장 (add_reports 후 save_to_json + flush)"""
+    store.add_reports(generate(count, years, seed))
+    store.save_to_json()
+    store.flush()
+    return store
+
+
+def random_dates(count, years=3, seed=1, end=None):
+    """조회용 날짜 문자열 (보고서와 같은 기간에서 고르게)"""
+    rng = random.Random(seed)
+    end = end or date(2026, 12, 31)
+    first = end.replace(year=end.year - years) + timedelta(days=1)
+    days = (end - first).days + 1
+    return [(first + timedelta(days=rng.randrange(days))).isoformat() for _ in range(count)]
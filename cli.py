@@ -0,0 +1,121 @@
+"""화면 없이 쓰는 명령줄 도구
+
+    python cli.py import history.ics [--owner personal] [--format ics]
+    python cli.py export reports.csv [--owner shared] [--start 2026-01-01] [--end 2026-12-31]
+    python main.py import ...      (main.py에 명령을 주면 GUI 대신 이쪽으로)
+
+형식은 확장자(.csv / .ics / .jsonl)로 정하며, 파일 대신 '-'를 주면 표준 입출력을 쓴다 (--format 필요).
+가져오기는 batch건씩 묶어 저장소에 넣고 끝에 한 번만 저장한다.
+"""
+import argparse
+import sys
+
+import report_io
+from report_store import open_store
+
+
+DEFAULT_BATCH = 1000
+
+
+def _open(path, mode):
+    if path == "-":
+        stream = sys.stdin if "r" in mode else sys.stdout
+        return stream, False
+    return open(path, mode, encoding="utf-8", newline=""), True
+
+
+def _format_of(args, parser):
+    fmt = args.format or report_io.guess_format(args.file)
+    if fmt is None:
+        parser.error("형식을 알 수 없습니다. --format csv|ics|jsonl 을 지정하세요")
+    return fmt
+
+
+def import_reports(store, records, batch=DEFAULT_BATCH):
+    """(owner, date, report dict) 스트림을 batch건씩 추가. 이미 있는 id는 건너뜀. (추가, 건너뜀) 반환"""
+    added = skipped = 0
+    chunk = []
+    chunk_ids = set()
+    for owner, date, report in records:
+        report_id = report.get("id")
+        if report_id and (report_id in chunk_ids or store.locate_by_id(report_id) is not None):
+            skipped += 1
+            continue
+        chunk.append((owner, date, report))
+        if report_id:
+            chunk_ids.add(report_id)
+        if len(chunk) >= batch:
+            added += store.add_reports(chunk)
+            chunk = []
+            chunk_ids = set()
+    if chunk:
+        added += store.add_reports(chunk)
+    return added, skipped
+
+
+def cmd_import(args, parser):
+    fmt = _format_of(args, parser)
+    store = open_store()
+    f, close = _open(args.file, "r")
+    try:
+        records = report_io.READERS[fmt](f, owner=args.owner)
+        added, skipped = import_reports(store, records, args.batch)
+    finally:
+        if close:
+            f.close()
+        # 일괄 추가한 변경을 한 번에 기록
+        store.save_to_json()
+        store.close()
+    print(f"{added}건 가져옴" + (f", 이미 있는 {skipped}건 건너뜀" if skipped else ""), file=sys.stderr)
+    return 0
+
+
+def cmd_export(args, parser):
+    fmt = _format_of(args, parser)
+    store = open_store()
+    rows = store.iter_reports(owner=args.owner, start=args.start, end=args.end, rules=not args.no_rules)
+    f, close = _open(args.file, "w")
+    try:
+        count = report_io.WRITERS[fmt](f, rows)
+    finally:
+        if close:
+            f.close()
+        else:
+            f.flush()
+        store.close()
+    print(f"{count}건 내보냄", file=sys.stderr)
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="weekly_reporter", description="보고서 가져오기/내보내기")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_import = sub.add_parser("import", help="CSV/ICS/JSON Lines 파일에서 보고서 가져오기")
+    p_import.add_argument("file", help="가져올 파일 ('-'면 표준 입력)")
+    p_import.add_argument("--format", choices=report_io.FORMATS)
+    p_import.add_argument("--owner", default="personal", choices=("personal", "shared"),
+                          help="파일에 owner가 없을 때 쓸 값")
+    p_import.add_argument("--batch", type=int, default=DEFAULT_BATCH, help="한 번에 추가할 건수")
+    p_import.set_defaults(func=cmd_import)
+
+    p_export = sub.add_parser("export", help="보고서를 CSV/ICS/JSON Lines로 내보내기")
+    p_export.add_argument("file", help="저장할 파일 ('-'면 표준 출력)")
+    p_export.add_argument("--format", choices=report_io.FORMATS)
+    p_export.add_argument("--owner", choices=("personal", "shared"), default=None)
+    p_export.add_argument("--start", help="이 날짜(YYYY-MM-DD) 이후와 겹치는 보고서만")
+    p_export.add_argument("--end", help="이 날짜(YYYY-MM-DD) 이전과 겹치는 보고서만")
+    p_export.add_argument("--no-rules", action="store_true",
+                          help="반복 규칙 항목은 빼고 저장된 보고서만 (기본은 기간 안의 항목을 풀어서 포함)")
+    p_export.set_defaults(func=cmd_export)
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    return args.func(args, parser)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
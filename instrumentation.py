@@ -0,0 +1,250 @@
+"""저장소 메서드와 Tk 이벤트 처리 시간 계측 (기본은 꺼져 있음)
+
+REPORT_INSTRUMENT=1, main.py --instrument 또는 config.json의 instrumentation.enabled로 켠다.
+켜지면 호출 수, 지연 시간 분포(구간별 횟수), 오류 수를 이름별로 모으고,
+Tk 처리 함수가 한 프레임 시간(frame_budget_ms)을 넘기면 기록해 둔다.
+cProfile 수집은 예비 탭에서 켜고 끌 수 있고, 결과는 export()로 파일에 저장한다.
+"""
+import cProfile
+import functools
+import io
+import json
+import os
+import pstats
+import threading
+import time
+from collections import deque
+from datetime import datetime
+
+
+# 지연 시간 구간 상한 (ms). 마지막 구간은 그보다 긴 호출
+BUCKETS_MS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 16, 25, 50, 100, 250, 500, 1000, 2500)
+DEFAULT_FRAME_BUDGET_MS = 16
+SLOW_LOG_SIZE = 200
+
+# 계측할 ReportStore 메서드 (모든 저장소 종류에 있는 것)
+STORE_METHODS = (
+    "list_reports", "list_reports_for", "find_reports_for_date", "find_reports_in_range", "search",
+    "add_report", "add_reports", "get_report", "update_report", "move_report", "delete_report",
+    "get_by_id", "locate_by_id", "update_by_id", "move_by_id", "delete_by_id",
+    "week_summary", "has_reports", "list_categories", "category_counts", "delete_category",
+    "save_to_json", "load_from_json", "flush",
+)
+
+
+class _Stat:
+    __slots__ = ("count", "errors", "total", "max", "buckets")
+
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.buckets = [0] * (len(BUCKETS_MS) + 1)
+
+    def add(self, ms, error):
+        self.count += 1
+        self.errors += error
+        self.total += ms
+        if ms > self.max:
+            self.max = ms
+        for i, bound in enumerate(BUCKETS_MS):
+            if ms <= bound:
+                self.buckets[i] += 1
+                return
+        self.buckets[-1] += 1
+
+    def percentile(self, p):
+        """구간 상한으로 어림한 백분위 (최댓값을 넘지 않음)"""
+        rank = p * self.count
+        seen = 0
+        for i, n in enumerate(self.buckets):
+            seen += n
+            if n and seen >= rank:
+                return min(BUCKETS_MS[i], round(self.max, 3)) if i < len(BUCKETS_MS) else round(self.max, 3)
+        return round(self.max, 3)
+
+    def to_dict(self):
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "total_ms": round(self.total, 3),
+            "mean_ms": round(self.total / self.count, 3) if self.count else 0,
+            "p50_ms": self.percentile(0.5),
+            "p95_ms": self.percentile(0.95),
+            "max_ms": round(self.max, 3),
+            "histogram": {(f"<={b}" if i < len(BUCKETS_MS) else f">{BUCKETS_MS[-1]}"): n
+                          for i, (b, n) in enumerate(zip(BUCKETS_MS + (None,), self.buckets)) if n},
+        }
+
+
+class Recorder:
+    def __init__(self):
+        self.enabled = False
+        self.frame_budget_ms = DEFAULT_FRAME_BUDGET_MS
+        self._lock = threading.Lock()
+        self._stats = {}
+        self.slow_calls = deque(maxlen=SLOW_LOG_SIZE)
+        self._profiler = None
+        self.started_at = datetime.now()
+
+    def record(self, name, ms, error=False):
+        with self._lock:
+            stat = self._stats.get(name)
+            if stat is None:
+                stat = self._stats[name] = _Stat()
+            stat.add(ms, error)
+
+    def record_handler(self, name, ms, error=False):
+        self.record(name, ms, error)
+        if ms > self.frame_budget_ms:
+            self.slow_calls.append((datetime.now().strftime("%H:%M:%S"), name, round(ms, 1)))
+            print(f"느린 처리: {name} {ms:.1f}ms (기준 {self.frame_budget_ms}ms)")
+
+    def reset(self):
+        with self._lock:
+            self._stats = {}
+            self.slow_calls.clear()
+            self.started_at = datetime.now()
+
+    def stats(self):
+        """{이름: 통계 dict}"""
+        with self._lock:
+            return {name: stat.to_dict() for name, stat in sorted(self._stats.items())}
+
+
+_recorder = Recorder()
+
+
+def recorder():
+    return _recorder
+
+
+def configure(config=None, enabled=None):
+    """config의 instrumentation 항목/REPORT_INSTRUMENT 환경변수로 켜고 끈다 (enabled가 주어지면 그 값)"""
+    options = (config or {}).get("instrumentation") or {}
+    if not isinstance(options, dict):
+        options = {}
+    if enabled is None:
+        enabled = os.environ.get("REPORT_INSTRUMENT") == "1" or bool(options.get("enabled"))
+    _recorder.enabled = enabled
+    _recorder.frame_budget_ms = options.get("frame_budget_ms", DEFAULT_FRAME_BUDGET_MS)
+    return enabled
+
+
+def enabled():
+    return _recorder.enabled
+
+
+def set_enabled(flag):
+    _recorder.enabled = bool(flag)
+
+
+def record(name, ms, error=False):
+    if _recorder.enabled:
+        _recorder.record(name, ms, error)
+
+
+def handler(func):
+    """Tk 이벤트 처리 메서드 계측. 꺼져 있으면 바로 원래 함수를 부른다
+    (command=/bind로 넘긴 메서드도 재지정 없이 잡히도록 클래스 정의에 붙인다)"""
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        if not _recorder.enabled:
+            return func(self, *args, **kwargs)
+        name = f"{type(self).__name__}.{func.__name__}"
+        error = False
+        t0 = time.perf_counter()
+        try:
+            return func(self, *args, **kwargs)
+        except Exception:
+            error = True
+            raise
+        finally:
+            _recorder.record_handler(name, (time.perf_counter() - t0) * 1000, error)
+    return wrapper
+
+
+def instrument_store(store):
+    """store 인스턴스의 공개 메서드를 계측 래퍼로 바꾼다 (같은 store에 두 번 해도 한 번만)"""
+    if getattr(store, "_instrumented", False):
+        return store
+    for name in STORE_METHODS:
+        method = getattr(store, name, None)
+        if method is not None:
+            setattr(store, name, _timed_method(f"store.{name}", method))
+    store._instrumented = True
+    return store
+
+
+def _timed_method(name, method):
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        if not _recorder.enabled:
+            return method(*args, **kwargs)
+        error = False
+        t0 = time.perf_counter()
+        try:
+            return method(*args, **kwargs)
+        except Exception:
+            error = True
+            raise
+        finally:
+            _recorder.record(name, (time.perf_counter() - t0) * 1000, error)
+    return wrapper
+
+
+# --- cProfile ---
+def profiling():
+    return _recorder._profiler is not None
+
+
+def start_profile():
+    """cProfile 수집 시작 (부른 스레드 = Tk 메인 스레드만 수집)"""
+    if _recorder._profiler is not None:
+        return
+    profiler = cProfile.Profile()
+    profiler.enable()
+    _recorder._profiler = profiler
+
+
+def stop_profile(path):
+    """cProfile 수집을 멈추고 path(.prof)와 누적 시간 순 요약(.txt)을 저장. 요약 글자 반환"""
+    profiler, _recorder._profiler = _recorder._profiler, None
+    if profiler is None:
+        return ""
+    profiler.disable()
+    path = str(path)
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    profiler.dump_stats(path)
+    out = io.StringIO()
+    pstats.Stats(profiler, stream=out).sort_stats("cumulative").print_stats(30)
+    summary = out.getvalue()
+    with open(os.path.splitext(path)[0] + ".txt", 'w', encoding='utf-8') as f:
+        f.write(summary)
+    return summary
+
+
+# --- export ---
+def summary_lines(limit=20):
+    """총 시간이 긴 순으로 한 줄 요약"""
+    stats = _recorder.stats()
+    ordered = sorted(stats.items(), key=lambda item: -item[1]["total_ms"])[:limit]
+    return [f"{name:<36} {s['count']:>6}회  p50 {s['p50_ms']:>6}ms  p95 {s['p95_ms']:>6}ms  최대 {s['max_ms']:>8}ms"
+            for name, s in ordered]
+
+
+def export(path):
+    """계측 결과를 JSON 파일로 저장하고 경로를 반환"""
+    data = {
+        "started_at": _recorder.started_at.isoformat(timespec="seconds"),
+        "exported_at": datetime.now().isoformat(timespec="seconds"),
+        "frame_budget_ms": _recorder.frame_budget_ms,
+        "buckets_ms": list(BUCKETS_MS),
+        "stats": _recorder.stats(),
+        "slow_calls": [{"time": t, "name": n, "ms": ms} for t, n, ms in _recorder.slow_calls],
+    }
+    os.makedirs(os.path.dirname(str(path)) or ".", exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    return path
@@ -0,0 +1,172 @@
+"""주간보고 JSON 일괄 생성
+
+    python json_export.py 2026-01-01 2026-12-31 [--config data/config.json ...] [--workers 4] [--out DIR]
+
+기간과 겹치는 ISO 주마다 weekly_report_dir.json_dir에 {year}-W{week}.json을 만든다.
+저장소 스냅샷을 한 번만 파일로 떠서 모든 작업 프로세스가 읽기 전용으로 열고,
+각 주의 결과는 스냅샷만으로 정해지므로 작업자 수와 관계없이 결과 파일이 같다.
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime as _dt, timedelta
+from pathlib import Path
+
+from report_store import ReportStore, load_config, open_store, weekly_report_dir
+from xlsx_export import iter_week_reports
+
+
+FILE_NAME = "{year}-W{week:02d}.json"
+
+# 작업 프로세스마다 한 번 여는 읽기 전용 저장소
+_worker_store = None
+_worker_config = None
+
+
+def weeks_in_range(start, end):
+    """start~end(date)와 겹치는 주의 월요일 목록"""
+    monday = start - timedelta(days=start.weekday())
+    weeks = []
+    while monday <= end:
+        weeks.append(monday)
+        monday += timedelta(days=7)
+    return weeks
+
+
+def week_report(store, monday, config):
+    """한 주의 보고서 dict (집계 + 그 주에 걸친 보고서 목록)"""
+    year, week, _ = monday.isocalendar()
+    summary = store.week_summary(year, week)
+    reports = []
+    for owner, report in iter_week_reports(store, monday):
+        item = {"owner": owner}
+        item.update(report.to_dict())
+        reports.append(item)
+    return {
+        "name": config.get("name", ""),
+        "year": year,
+        "week": week,
+        "start": summary["start"],
+        "end": summary["end"],
+        "summary": {k: summary[k] for k in ("reports", "by_owner", "categories", "days", "days_covered")},
+        "reports": reports,
+    }
+
+
+def write_week(store, monday, config, out_dir):
+    year, week, _ = monday.isocalendar()
+    path = Path(out_dir) / FILE_NAME.format(year=year, week=week)
+    data = week_report(store, monday, config)
+    tmp = path.with_suffix(".json.tmp")
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    os.replace(tmp, path)
+    return str(path)
+
+
+def take_snapshot(store, start, end, path):
+    """start~end 주들과 겹치는 보고서만 {owner: {date: [report dict]}}로 path에 저장
+    저장소 종류(json/sqlite/sharded/snapshot)와 관계없이 범위 조회로 뜬다.
+    """
+    found = store.find_reports_in_range(start.strftime("%Y-%m-%d"), end.strftime("%Y-%m-%d"))
+    picked = {}
+    for entries in found.values():
+        for owner, orig_date, idx, report in entries:
+            picked.setdefault(owner, {}).setdefault(orig_date, {})[report.id] = (idx, report)
+    data = {"personal": {}, "shared": {}}
+    for owner, dates in picked.items():
+        data[owner] = {d: [r.to_dict() for _idx, r in sorted(items.values(), key=lambda item: item[0])]
+                       for d, items in sorted(dates.items())}
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False)
+
+
+def _init_worker(snapshot_file, config):
+    global _worker_store, _worker_config
+    _worker_store = ReportStore(json_file=snapshot_file, config=config, read_only=True)
+    _worker_config = config
+
+
+def _export_chunk(mondays, out_dir):
+    return [write_week(_worker_store, m, _worker_config, out_dir) for m in mondays]
+
+
+def export_range(start, end, config=None, store=None, out_dir=None, workers=None):
+    """start~end('YYYY-MM-DD' 또는 date)와 겹치는 모든 주의 JSON을 만들고 파일 경로 목록(주 순서) 반환
+    workers: 프로세스 수 (기본 CPU 수, 1이면 현재 프로세스에서 순서대로)
+    """
+    if isinstance(start, str):
+        start = _dt.strptime(start, "%Y-%m-%d").date()
+    if isinstance(end, str):
+        end = _dt.strptime(end, "%Y-%m-%d").date()
+    if config is None:
+        config = getattr(store, "config", None) or load_config()
+    mondays = weeks_in_range(start, end)
+    if not mondays:
+        return []
+    out_dir = Path(out_dir) if out_dir else weekly_report_dir(config, "json")
+    out_dir.mkdir(parents=True, exist_ok=True)
+    workers = workers or os.cpu_count() or 1
+    workers = max(1, min(workers, len(mondays)))
+
+    with tempfile.TemporaryDirectory(prefix="weekly_export_") as tmp:
+        snapshot_file = os.path.join(tmp, "snapshot.json")
+        if store is None:
+            # 여기서 연 저장소는 스냅샷만 뜨고 바로 닫는다
+            store = open_store(config, save_delay=0)
+            try:
+                take_snapshot(store, mondays[0], mondays[-1] + timedelta(days=6), snapshot_file)
+            finally:
+                store.close()
+        else:
+            take_snapshot(store, mondays[0], mondays[-1] + timedelta(days=6), snapshot_file)
+        if workers == 1:
+            _init_worker(snapshot_file, config)
+            return _export_chunk(mondays, str(out_dir))
+        # 주를 고르게 나눠 작업자마다 한 덩어리씩 (결과는 주 순서대로 다시 모은다)
+        chunks = [mondays[i::workers] for i in range(workers)]
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(snapshot_file, config)) as pool:
+            results = list(pool.map(_export_chunk, chunks, [str(out_dir)] * len(chunks)))
+    paths = {}
+    for chunk, chunk_paths in zip(chunks, results):
+        paths.update(zip(chunk, chunk_paths))
+    return [paths[m] for m in mondays]
+
+
+def _read_config(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        cfg = json.load(f)
+    return cfg if isinstance(cfg, dict) else {}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="기간의 주간보고 JSON 일괄 생성")
+    parser.add_argument("start", help="시작일 YYYY-MM-DD")
+    parser.add_argument("end", help="종료일 YYYY-MM-DD")
+    parser.add_argument("--config", action="append", default=[],
+                        help="사람별 config.json (여러 번 지정 가능, 기본: 현재 config)")
+    parser.add_argument("--workers", type=int, default=None, help="작업 프로세스 수")
+    parser.add_argument("--out", default=None, help="출력 폴더 (기본: config의 weekly_report_dir.json_dir)")
+    args = parser.parse_args(argv)
+
+    configs = [_read_config(p) for p in args.config] or [load_config()]
+    for config in configs:
+        store = open_store(config, save_delay=0)
+        out_dir = args.out
+        if out_dir and len(configs) > 1:
+            out_dir = os.path.join(out_dir, config.get("name") or "report")
+        try:
+            paths = export_range(args.start, args.end, config=config, store=store, out_dir=out_dir,
+                                 workers=args.workers)
+        finally:
+            store.close()
+        print(f"{config.get('name', '')}: {len(paths)}개 주 저장 -> {Path(paths[0]).parent if paths else '-'}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,10 +1,18 @@
-from app import ReportApp
+import sys
 
 
 def main():
-    app = ReportApp()
+    # import/export 명령이 있으면 화면 없이 명령줄 도구로 실행 (tkinter를 불러오지 않음)
+    if len(sys.argv) > 1 and sys.argv[1] in ("import", "export"):
+        import cli
+        return cli.main(sys.argv[1:])
+    from app import ReportApp
+    # --timing: 시작 단계별 시간 출력, --instrument: 저장소/화면 처리 시간 계측
+    app = ReportApp(timing="--timing" in sys.argv[1:] or None,
+                    instrument="--instrument" in sys.argv[1:] or None)
     app.run()
+    return 0
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(main())
\ No newline at end of file
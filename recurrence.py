@@ -0,0 +1,63 @@
+"""반복 보고서 규칙의 날짜 계산 (date ordinal 기준)
+
+규칙은 첫 번째 항목의 시작일(first)과 주기만 가지고, 조회한 기간의 항목 시작일만 그때 계산한다.
+- weekly: 7일마다, biweekly: 14일마다
+- monthly: 매월 같은 날 (그 날이 없는 달, 예: 31일 규칙의 4월은 건너뜀)
+"""
+from datetime import date as _date
+
+
+FREQUENCIES = ("weekly", "biweekly", "monthly")
+
+FREQUENCY_LABELS = {"weekly": "매주", "biweekly": "격주", "monthly": "매월"}
+
+_STEPS = {"weekly": 7, "biweekly": 14}
+
+
+def check_frequency(freq):
+    if freq not in FREQUENCIES:
+        raise ValueError(f"알 수 없는 반복 주기: {freq!r} ({', '.join(FREQUENCIES)})")
+    return freq
+
+
+def occurrence_starts(freq, first, lo, hi):
+    """first부터 freq 주기로 반복되는 시작일 중 [lo, hi]에 드는 것을 차례로"""
+    lo = max(lo, first)
+    if hi < lo:
+        return
+    step = _STEPS.get(freq)
+    if step is not None:
+        # lo 이상인 첫 시작일부터
+        s = first + -(-(lo - first) // step) * step
+        while s <= hi:
+            yield s
+            s += step
+        return
+    day = _date.fromordinal(first).day
+    d = _date.fromordinal(lo)
+    year, month = d.year, d.month
+    while True:
+        try:
+            s = _date(year, month, day).toordinal()
+        except ValueError:
+            s = None
+        if s is not None:
+            if s > hi:
+                return
+            if s >= lo:
+                yield s
+        elif _date(year, month, 1).toordinal() > hi:
+            return
+        month += 1
+        if month > 12:
+            year, month = year + 1, 1
+
+
+def occurs_on(freq, first, ordinal):
+    """ordinal이 first부터 freq 주기로 반복되는 시작일인지"""
+    if ordinal < first:
+        return False
+    step = _STEPS.get(freq)
+    if step is not None:
+        return (ordinal - first) % step == 0
+    return _date.fromordinal(ordinal).day == _date.fromordinal(first).day
@@ -0,0 +1,253 @@
+"""보고서 가져오기/내보내기 형식 (CSV, iCalendar, JSON Lines)
+
+읽기 함수는 파일을 한 줄(한 일정)씩 읽어 (owner, date, report dict)를 하나씩 내보내고,
+쓰기 함수는 (owner, date, report)를 받는 대로 바로 파일에 쓴다. 어느 쪽도 전체를 메모리에 모으지 않는다.
+"""
+import csv
+import json
+import sys
+import uuid
+from datetime import datetime as _dt, timedelta, timezone
+
+
+FORMATS = ("csv", "ics", "jsonl")
+
+CSV_FIELDS = ["owner", "date", "start_date", "end_date", "category", "location", "attendees", "content", "id"]
+
+# ICS UID -> 보고서 id (같은 일정을 다시 가져와도 같은 id가 되도록)
+_ICS_NAMESPACE = uuid.UUID("6f1c1d4e-4d0f-4c8a-9a59-2f0d8f6b0c11")
+# 내보낸 일정의 UID = 보고서 id + 이 접미사 (보고서 id에도 '@'가 들어갈 수 있다)
+_ICS_UID_SUFFIX = "@weekly-reporter"
+
+
+def guess_format(path):
+    """파일 확장자로 형식 추정 (.csv / .ics / .jsonl, .ndjson)"""
+    suffix = str(path).lower().rsplit(".", 1)[-1]
+    if suffix in ("jsonl", "ndjson"):
+        return "jsonl"
+    if suffix in ("csv", "ics"):
+        return suffix
+    return None
+
+
+def _record(data, owner):
+    """가져온 dict -> (owner, date, report dict). 시작일이 없으면 None"""
+    start = (data.get("start_date") or data.get("date") or "").strip()
+    if not start:
+        return None
+    report = {
+        "content": data.get("content") or "",
+        "category": data.get("category") or "",
+        "location": data.get("location") or "",
+        "attendees": data.get("attendees") or "",
+        "start_date": start,
+        "end_date": (data.get("end_date") or "").strip() or start,
+    }
+    if data.get("id"):
+        report["id"] = data["id"]
+    return (data.get("owner") or owner), (data.get("date") or start).strip(), report
+
+
+# --- JSON Lines ---
+def read_jsonl(f, owner="personal"):
+    for lineno, line in enumerate(f, 1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            data = json.loads(line)
+        except ValueError as e:
+            print(f"{lineno}번째 줄 건너뜀: {e}", file=sys.stderr)
+            continue
+        record = _record(data, owner) if isinstance(data, dict) else None
+        if record is not None:
+            yield record
+
+
+def write_jsonl(f, rows):
+    count = 0
+    for owner, date, report in rows:
+        item = {"owner": owner, "date": date}
+        item.update(report.to_dict())
+        f.write(json.dumps(item, ensure_ascii=False) + "\n")
+        count += 1
+    return count
+
+
+# --- CSV ---
+def read_csv(f, owner="personal"):
+    for data in csv.DictReader(f):
+        record = _record({k: (v or "") for k, v in data.items() if k}, owner)
+        if record is not None:
+            yield record
+
+
+def write_csv(f, rows):
+    writer = csv.DictWriter(f, fieldnames=CSV_FIELDS)
+    writer.writeheader()
+    count = 0
+    for owner, date, report in rows:
+        item = {"owner": owner, "date": date}
+        item.update(report.to_dict())
+        writer.writerow(item)
+        count += 1
+    return count
+
+
+# --- iCalendar ---
+def _ics_escape(text):
+    return (text.replace("\\", "\\\\").replace(";", "\\;").replace(",", "\\,")
+            .replace("\r\n", "\\n").replace("\n", "\\n"))
+
+
+def _ics_unescape(text):
+    out = []
+    i = 0
+    while i < len(text):
+        ch = text[i]
+        if ch == "\\" and i + 1 < len(text):
+            nxt = text[i + 1]
+            out.append("\n" if nxt in "nN" else nxt)
+            i += 2
+            continue
+        out.append(ch)
+        i += 1
+    return "".join(out)
+
+
+def _ics_fold(line):
+    """75바이트마다 줄을 접는다 (RFC 5545)"""
+    data = line.encode("utf-8")
+    if len(data) <= 75:
+        return line + "\r\n"
+    parts = []
+    current = ""
+    size = 0
+    for ch in line:
+        n = len(ch.encode("utf-8"))
+        if size + n > (75 if not parts else 74):
+            parts.append(current)
+            current, size = "", 0
+        current += ch
+        size += n
+    parts.append(current)
+    return "\r\n ".join(parts) + "\r\n"
+
+
+def _ics_lines(f):
+    """접힌 줄을 펼친 논리 줄 단위로"""
+    pending = None
+    for raw in f:
+        line = raw.rstrip("\r\n")
+        if line[:1] in (" ", "\t") and pending is not None:
+            pending += line[1:]
+            continue
+        if pending is not None:
+            yield pending
+        pending = line
+    if pending is not None:
+        yield pending
+
+
+def _ics_date(value, params, is_end=False):
+    """DTSTART/DTEND 값 -> 'YYYY-MM-DD'. 날짜 값의 DTEND는 다음날(미포함)이므로 하루 뺀다"""
+    value = value.strip()
+    try:
+        day = _dt.strptime(value[:8], "%Y%m%d").date()
+    except ValueError:
+        return ""
+    if is_end and ("VALUE=DATE" in params.upper() or len(value) == 8):
+        day -= timedelta(days=1)
+    return day.strftime("%Y-%m-%d")
+
+
+def read_ics(f, owner="personal"):
+    event = None
+    for line in _ics_lines(f):
+        name, _, value = line.partition(":")
+        prop, _, params = name.partition(";")
+        prop = prop.upper()
+        if prop == "BEGIN" and value.upper() == "VEVENT":
+            event = {"attendees": []}
+        elif event is None:
+            continue
+        elif prop == "END" and value.upper() == "VEVENT":
+            record = _ics_record(event, owner)
+            event = None
+            if record is not None:
+                yield record
+        elif prop == "DTSTART":
+            event["start_date"] = _ics_date(value, params)
+        elif prop == "DTEND":
+            event["end_date"] = _ics_date(value, params, is_end=True)
+        elif prop in ("SUMMARY", "DESCRIPTION", "LOCATION", "UID", "X-REPORT-OWNER", "X-REPORT-ATTENDEES"):
+            event[prop] = _ics_unescape(value)
+        elif prop == "CATEGORIES":
+            event["category"] = _ics_unescape(value).split(",")[0].strip()
+        elif prop == "ATTENDEE":
+            cn = [p[3:].strip('"') for p in params.split(";") if p.upper().startswith("CN=")]
+            event["attendees"].append(cn[0] if cn else value.replace("mailto:", "").replace("MAILTO:", ""))
+
+
+def _ics_record(event, owner):
+    summary = event.get("SUMMARY", "")
+    description = event.get("DESCRIPTION", "")
+    # 내보낸 파일은 SUMMARY가 DESCRIPTION 첫 줄이므로 DESCRIPTION만 쓴다
+    if description and (not summary or description.splitlines()[0] == summary):
+        content = description
+    else:
+        content = "\n".join(t for t in (summary, description) if t)
+    data = {
+        "owner": event.get("X-REPORT-OWNER") or owner,
+        "start_date": event.get("start_date", ""),
+        "end_date": event.get("end_date", ""),
+        "content": content,
+        "category": event.get("category", ""),
+        "location": event.get("LOCATION", ""),
+        "attendees": event.get("X-REPORT-ATTENDEES") or ", ".join(event["attendees"]),
+    }
+    if event.get("UID"):
+        uid = event["UID"]
+        if uid.endswith(_ICS_UID_SUFFIX):
+            data["id"] = uid[:-len(_ICS_UID_SUFFIX)]
+        else:
+            data["id"] = uuid.uuid5(_ICS_NAMESPACE, uid).hex
+    return _record(data, owner)
+
+
+def write_ics(f, rows):
+    f.write("BEGIN:VCALENDAR\r\nVERSION:2.0\r\nPRODID:-//weekly-reporter//KO\r\nCALSCALE:GREGORIAN\r\n")
+    stamp = _dt.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    count = 0
+    for owner, date, report in rows:
+        if report.start is None:
+            continue
+        start = _dt.strptime(report.start_date, "%Y-%m-%d").date()
+        end = _dt.strptime(report.end_date, "%Y-%m-%d").date() + timedelta(days=1)
+        lines = report.content.splitlines()
+        props = [
+            "BEGIN:VEVENT",
+            f"UID:{report.id}{_ICS_UID_SUFFIX}",
+            f"DTSTAMP:{stamp}",
+            f"DTSTART;VALUE=DATE:{start:%Y%m%d}",
+            f"DTEND;VALUE=DATE:{end:%Y%m%d}",
+            f"SUMMARY:{_ics_escape(lines[0] if lines else '')}",
+        ]
+        if report.content:
+            props.append(f"DESCRIPTION:{_ics_escape(report.content)}")
+        if report.location:
+            props.append(f"LOCATION:{_ics_escape(report.location)}")
+        if report.category:
+            props.append(f"CATEGORIES:{_ics_escape(report.category)}")
+        if report.attendees:
+            props.append(f"X-REPORT-ATTENDEES:{_ics_escape(report.attendees)}")
+        props.append(f"X-REPORT-OWNER:{owner}")
+        props.append("END:VEVENT")
+        f.write("".join(_ics_fold(p) for p in props))
+        count += 1
+    f.write("END:VCALENDAR\r\n")
+    return count
+
+
+READERS = {"csv": read_csv, "ics": read_ics, "jsonl": read_jsonl}
+WRITERS = {"csv": write_csv, "ics": write_ics, "jsonl": write_jsonl}
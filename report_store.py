@@ -1,63 +1,548 @@
+import atexit
+import contextlib
+import functools
 import json
+import os
+import sys
+import threading
+import time
+import uuid
+from bisect import bisect_left, bisect_right
+from datetime import date as _date, datetime as _dt
 from pathlib import Path
 
+import recurrence
+from search_index import NgramIndex, report_text
+from weekly_rollup import WeeklyRollup, iso_week_monday, rollup_from_buckets, week_monday
+# config 관련 함수는 app_config에 있고, 기존 import 경로를 위해 여기서도 내보낸다
+from app_config import (  # noqa: F401
+    SCRIPT_DIR, DEFAULT_CONFIG, load_config, data_dir, weekly_report_dir, storage_config,
+)
+
+
+def open_store(config=None, **kwargs):
+    """config.json의 storage.backend에 맞는 저장소 생성 ('json' 기본, 'sqlite', 'sharded', 'snapshot')"""
+    if config is None:
+        config = load_config()
+    backend = storage_config(config).get("backend", "json")
+    if backend == "sqlite":
+        from sqlite_store import SqliteReportStore
+        return SqliteReportStore(config=config, **kwargs)
+    if backend == "sharded":
+        from sharded_store import ShardedReportStore
+        return ShardedReportStore(config=config, **kwargs)
+    if backend == "snapshot":
+        from snapshot_store import SnapshotReportStore
+        return SnapshotReportStore(config=config, **kwargs)
+    return ReportStore(config=config, **kwargs)
+
+
+def _to_ordinal(date_str):
+    """'YYYY-MM-DD' 문자열을 date ordinal(int)로 변환, 실패 시 None"""
+    try:
+        return _dt.strptime(date_str, "%Y-%m-%d").date().toordinal()
+    except Exception:
+        return None
+
+
+def new_report_id():
+    return uuid.uuid4().hex
+
+
+def _legacy_report_id(owner, date, index):
+    """id 없이 저장된 예전 보고서용 id: 같은 파일을 다시 읽어도 같은 값이 나오도록
+    위치에서 결정적으로 만든다 (journal 재생이 id를 참조하므로)"""
+    return uuid.uuid5(uuid.NAMESPACE_URL, f"weekly_reporter:{owner}/{date}/{index}").hex
+
+
+def _in_range(report, lo, hi):
+    """report 기간이 [lo, hi] (ordinal, None이면 제한 없음)와 겹치는지"""
+    if lo is None and hi is None:
+        return True
+    if report.start is None:
+        return False
+    return (lo is None or report.end >= lo) and (hi is None or report.start <= hi)
+
+
+def _from_ordinal(ordinal):
+    return _date.fromordinal(ordinal).strftime("%Y-%m-%d")
+
+
+class Report:
+    """보고서 한 건 (날짜는 date ordinal, 카테고리는 intern된 문자열로 보관)
+
+    JSON/탭 코드와의 호환을 위해 dict처럼 읽을 수 있다
+    (report.get("start_date"), report["content"], dict(report) 등).
+    저장소 안의 Report는 교체만 하고 제자리에서 수정하지 않는다.
+    id는 한 번 정해지면 수정/이동해도 바뀌지 않는 고유 식별자.
+    """
+    __slots__ = ("id", "content", "category", "location", "attendees", "start", "end", "_raw_dates")
+
+    FIELDS = ("content", "category", "location", "attendees", "start_date", "end_date", "id")
+
+    def __init__(self, content="", category="", location="", attendees="", start=None, end=None, raw_dates=None,
+                 report_id=None):
+        self.id = report_id or new_report_id()
+        self.content = content
+        self.category = sys.intern(category)
+        self.location = location
+        self.attendees = attendees
+        self.start = start
+        self.end = end
+        # 해석할 수 없는 날짜 문자열은 저장 시 그대로 돌려주기 위해 보관
+        self._raw_dates = raw_dates
+
+    @classmethod
+    def from_dict(cls, data, date=None, report_id=None):
+        """dict(JSON 형식) -> Report. start_date가 비어 있으면 저장 키(date)를 사용
+        data에 id가 없으면 report_id (기존 보고서를 교체할 때), 그것도 없으면 새 id를 쓴다.
+        """
+        if isinstance(data, Report):
+            return data
+        start_text = data.get("start_date") or date or ""
+        end_text = data.get("end_date") or start_text
+        start = _to_ordinal(start_text)
+        end = _to_ordinal(end_text)
+        raw = None
+        if start is None or end is None:
+            start = end = None
+            raw = (data.get("start_date", ""), data.get("end_date", ""))
+        return cls(
+            content=data.get("content", "") or "",
+            category=data.get("category", "") or "",
+            location=data.get("location", "") or "",
+            attendees=data.get("attendees", "") or "",
+            start=start,
+            end=end,
+            raw_dates=raw,
+            report_id=data.get("id") or report_id,
+        )
+
+    @property
+    def start_date(self):
+        if self.start is None:
+            return self._raw_dates[0] if self._raw_dates else ""
+        return _from_ordinal(self.start)
+
+    @property
+    def end_date(self):
+        if self.end is None:
+            return self._raw_dates[1] if self._raw_dates else ""
+        return _from_ordinal(self.end)
+
+    def to_dict(self):
+        return {k: getattr(self, k) for k in self.FIELDS}
+
+    # --- dict 호환 뷰 ---
+    def get(self, key, default=None):
+        if key in self.FIELDS:
+            return getattr(self, key)
+        return default
+
+    def __getitem__(self, key):
+        if key in self.FIELDS:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __contains__(self, key):
+        return key in self.FIELDS
+
+    def keys(self):
+        return list(self.FIELDS)
+
+    def items(self):
+        return [(k, getattr(self, k)) for k in self.FIELDS]
+
+    def __eq__(self, other):
+        if isinstance(other, Report):
+            other = other.to_dict()
+        if isinstance(other, dict):
+            return self.to_dict() == other
+        return NotImplemented
+
+    __hash__ = object.__hash__
+
+    def __repr__(self):
+        return f"Report({self.to_dict()!r})"
+
+
+def _report_with_id(report, date, report_id):
+    """report(dict 또는 Report)를 report_id의 새 Report로 복사 (넘겨받은 Report는 건드리지 않는다)"""
+    data = dict(report)
+    data["id"] = report_id
+    return Report.from_dict(data, date)
+
+
+class Rule:
+    """반복 보고서 규칙 (주간회의처럼 같은 내용이 주기마다 반복되는 보고서)
+
+    template은 첫 번째 항목 (시작일~종료일이 한 항목의 기간), until은 마지막 항목 시작일의 상한,
+    exceptions는 빠진 항목의 시작일 (ordinal). 항목은 저장하지 않고 조회한 기간에서만 만든다.
+    항목 id는 '규칙id@YYYY-MM-DD'. Report처럼 제자리에서 고치지 않고 교체만 한다.
+    """
+    __slots__ = ("id", "owner", "freq", "template", "until", "exceptions")
+
+    def __init__(self, freq, template, owner="personal", until=None, exceptions=(), rule_id=None):
+        if template.start is None or template.end < template.start:
+            raise ValueError(f"반복 규칙의 기간이 올바르지 않습니다: {template.start_date!r} ~ {template.end_date!r}")
+        self.id = rule_id or new_report_id()
+        self.owner = owner
+        self.freq = recurrence.check_frequency(freq)
+        self.template = template
+        self.until = until
+        self.exceptions = frozenset(exceptions)
+
+    @classmethod
+    def from_dict(cls, data):
+        until = data.get("until") or None
+        if until is not None:
+            until = _to_ordinal(until)
+            if until is None:
+                raise ValueError(f"반복 규칙의 종료일이 올바르지 않습니다: {data.get('until')!r}")
+        exceptions = (_to_ordinal(d) for d in data.get("exceptions", ()))
+        template = {k: data.get(k, "") for k in ("content", "category", "location", "attendees",
+                                                 "start_date", "end_date")}
+        return cls(data.get("freq"), Report.from_dict(template), data.get("owner", "personal"), until,
+                   [o for o in exceptions if o is not None], data.get("id"))
+
+    def to_dict(self):
+        data = self.template.to_dict()
+        data.update(id=self.id, owner=self.owner, freq=self.freq,
+                    until=_from_ordinal(self.until) if self.until is not None else "",
+                    exceptions=[_from_ordinal(o) for o in sorted(self.exceptions)])
+        return data
+
+    def replace(self, **changes):
+        """바뀐 값만 준 새 Rule (id 유지)"""
+        values = {"freq": self.freq, "template": self.template, "owner": self.owner,
+                  "until": self.until, "exceptions": self.exceptions}
+        values.update(changes)
+        return Rule(rule_id=self.id, **values)
+
+    @property
+    def span(self):
+        return self.template.end - self.template.start
+
+    def starts(self, lo, hi):
+        """기간이 [lo, hi]와 겹치는 항목의 시작일 (빠진 항목 제외)"""
+        if self.until is not None:
+            hi = min(hi, self.until)
+        for s in recurrence.occurrence_starts(self.freq, self.template.start, lo - self.span, hi):
+            if s not in self.exceptions:
+                yield s
+
+    def occurs_on(self, ordinal, skipped=False):
+        """ordinal에 시작하는 항목이 있는지 (skipped=True면 빠진 항목도 포함)"""
+        if self.until is not None and ordinal > self.until:
+            return False
+        if not skipped and ordinal in self.exceptions:
+            return False
+        return recurrence.occurs_on(self.freq, self.template.start, ordinal)
+
+    def occurrence(self, ordinal):
+        """ordinal에 시작하는 항목 Report"""
+        t = self.template
+        return Report(t.content, t.category, t.location, t.attendees, ordinal, ordinal + self.span,
+                      report_id=f"{self.id}@{_from_ordinal(ordinal)}")
+
+    def period_report(self):
+        """규칙 전체 기간을 덮는 Report (변경 알림용, 끝이 없으면 date.max까지)"""
+        t = self.template
+        last = self.until if self.until is not None else _date.max.toordinal() - self.span
+        return Report(t.content, t.category, t.location, t.attendees, t.start, last + self.span,
+                      report_id=self.id)
+
+    def __repr__(self):
+        return f"Rule({self.to_dict()!r})"
+
+
+class ChangeEvent:
+    """저장소 변경 알림 (ReportStore.subscribe의 callback에 전달)
+
+    kind: 'added' | 'updated' | 'moved' | 'deleted' | 'rule'
+    ('rule'은 반복 규칙 추가/수정/삭제: report는 규칙 전체 기간을 덮는 Report, id는 규칙 id)
+    owner/date: 변경 후 보고서의 owner와 저장 키 (deleted면 지워진 보고서의 것)
+    start/end: 변경 후 보고서 기간 'YYYY-MM-DD' (날짜가 아니면 저장 키)
+    report: 변경 후 Report (deleted면 지워진 Report)
+    old_*: updated/moved의 변경 전 값 (없으면 None)
+    """
+    __slots__ = ("kind", "report_id", "report", "owner", "date", "start", "end",
+                 "old_report", "old_owner", "old_date", "old_start", "old_end")
+
+    def __init__(self, kind, owner, date, report, old_owner=None, old_date=None, old_report=None):
+        self.kind = kind
+        self.report_id = report.id
+        self.report = report
+        self.old_report = old_report
+        self.owner = owner
+        self.date = date
+        self.start, self.end = self._period(date, report)
+        self.old_owner = old_owner
+        self.old_date = old_date
+        self.old_start, self.old_end = self._period(old_date, old_report) if old_report is not None else (None, None)
+
+    @staticmethod
+    def _period(date, report):
+        if report.start is None:
+            return date, date
+        return report.start_date, report.end_date
+
+    def owners(self):
+        return {o for o in (self.owner, self.old_owner) if o is not None}
+
+    def date_range(self):
+        """변경 전후 기간을 모두 덮는 (시작, 끝)"""
+        starts = [d for d in (self.start, self.old_start) if d]
+        ends = [d for d in (self.end, self.old_end) if d]
+        return min(starts), max(ends)
+
+    def touches(self, owner=None, start=None, end=None):
+        """owner의 [start, end] ('YYYY-MM-DD', end가 없으면 start 하루) 기간에 영향이 있는지"""
+        if owner is not None and owner not in self.owners():
+            return False
+        if start is None:
+            return True
+        end = end or start
+        for lo, hi in ((self.start, self.end), (self.old_start, self.old_end)):
+            if lo is not None and lo <= end and hi >= start:
+                return True
+        return False
+
+    def __repr__(self):
+        return f"ChangeEvent({self.kind!r}, {self.owner!r}, {self.date!r}, {self.start!r}~{self.end!r})"
+
+
+class _IntervalIndex:
+    """(start, end) 날짜 구간 인덱스 (date ordinal 기준)
+
+    구간을 시작일 순으로 정렬된 배열에 보관하고 가장 긴 구간 길이(max_span)를
+    함께 기억한다. 날짜 d를 포함하는 구간은 시작일이 [d - max_span, d] 범위에
+    있어야 하므로 bisect 두 번으로 후보 범위를 좁힐 수 있다.
+    길이별 구간 수를 세어 두므로 가장 긴 구간이 지워지면 max_span도 줄어든다.
+    """
+
+    def __init__(self):
+        self._keys = []    # 정렬된 (start, seq) 목록
+        self._ends = []    # _keys와 같은 순서의 end ordinal
+        self._values = []  # _keys와 같은 순서의 값
+        self._max_span = 0
+        self._spans = {}   # 구간 길이 -> 그 길이의 구간 수
+        self._seq = 0
+
+    def __len__(self):
+        return len(self._keys)
+
+    def add(self, start, end, value):
+        """구간을 추가하고 제거할 때 사용할 key를 반환"""
+        self._seq += 1
+        key = (start, self._seq)
+        pos = bisect_right(self._keys, key)
+        self._keys.insert(pos, key)
+        self._ends.insert(pos, end)
+        self._values.insert(pos, value)
+        span = end - start
+        self._spans[span] = self._spans.get(span, 0) + 1
+        if span > self._max_span:
+            self._max_span = span
+        return key
+
+    def remove(self, key):
+        pos = bisect_left(self._keys, key)
+        if pos < len(self._keys) and self._keys[pos] == key:
+            span = self._ends[pos] - key[0]
+            del self._keys[pos]
+            del self._ends[pos]
+            del self._values[pos]
+            left = self._spans[span] - 1
+            if left:
+                self._spans[span] = left
+            else:
+                del self._spans[span]
+                if span == self._max_span:
+                    self._max_span = max(self._spans, default=0)
+
+    def overlapping(self, lo, hi):
+        """[lo, hi] 구간과 겹치는 값들을 시작일 순으로 반환"""
+        left = bisect_left(self._keys, (lo - self._max_span,))
+        right = bisect_left(self._keys, (hi + 1,))
+        ends = self._ends
+        values = self._values
+        return [values[i] for i in range(left, right) if ends[i] >= lo]
+
+
+class _StoreLock:
+    """저장소 잠금 (RLock). 가장 바깥 잠금을 풀 때 잠근 동안 모인 변경 알림을 잠금 밖에서 보낸다
+    take()는 잠금을 쥔 채로 불려 보낼 것을 꺼내고, deliver(꺼낸 것)는 잠금을 푼 뒤에 불린다.
+    """
+
+    def __init__(self, take, deliver):
+        self._lock = threading.RLock()
+        self._depth = 0   # 잠금을 쥔 스레드만 바꾼다
+        self._take = take
+        self._deliver = deliver
+
+    def acquire(self, blocking=True, timeout=-1):
+        if self._lock.acquire(blocking, timeout):
+            self._depth += 1
+            return True
+        return False
+
+    def release(self):
+        self._depth -= 1
+        pending = self._take() if self._depth == 0 else None
+        self._lock.release()
+        if pending:
+            self._deliver(pending)
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.release()
+        return False
+
+
+def _synchronized(method):
+    """저장 스레드가 보고서 목록을 복사하는 동안 변경이 끼어들지 않도록 잠금"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+class _DebouncedSaver:
+    """저장 요청을 모아 두었다가 delay초 동안 추가 요청이 없으면 백그라운드에서 write() 호출"""
+
+    def __init__(self, write, delay):
+        self._write = write
+        self.delay = delay
+        self._cond = threading.Condition()
+        self._requested_at = None
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="ReportStoreSaver", daemon=True)
+        self._thread.start()
+
+    def request(self):
+        with self._cond:
+            self._requested_at = time.monotonic()
+            self._cond.notify()
+
+    def cancel(self):
+        """대기 중인 요청을 취소하고, 요청이 있었는지 반환"""
+        with self._cond:
+            pending = self._requested_at is not None
+            self._requested_at = None
+            return pending
+
+    def close(self):
+        """남은 요청은 버리고 (먼저 flush할 것) 저장 스레드가 끝날 때까지 기다린다"""
+        with self._cond:
+            self._closed = True
+            self._requested_at = None
+            self._cond.notify()
+        self._thread.join()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while self._requested_at is None and not self._closed:
+                    self._cond.wait()
+                if self._requested_at is None:
+                    return
+                remaining = self._requested_at + self.delay - time.monotonic()
+                if remaining > 0 and not self._closed:
+                    self._cond.wait(remaining)
+                    continue
+                self._requested_at = None
+            try:
+                self._write()
+            except Exception as e:
+                print(f"백그라운드 저장 실패: {e}")
+
 
 class ReportStore:
-    def __init__(self, json_file=None):
+    # journal 모드에서 이만큼 기록이 쌓이면 백그라운드에서 스냅샷(data.json)으로 압축
+    JOURNAL_COMPACT_EVERY = 500
+
+    # save_to_json 요청 후 이 시간(초) 동안 추가 변경이 없으면 백그라운드에서 저장
+    DEFAULT_SAVE_DELAY = 1.0
+
+    # iter_reports에 기간 끝이 없을 때 종료일 없는 반복 규칙을 오늘부터 이 날수까지만 만든다
+    RULE_HORIZON_DAYS = 366
+
+    def __init__(self, json_file=None, journal=None, save_delay=None, config=None, read_only=False):
         # store reports separated by owner ('personal' / 'shared')
-        # { owner: { date_str: [ {content, category, location, attendees, start_date, end_date}, ... ] } }
+        # { owner: { date_str: [ Report, ... ] } }  (JSON에는 Report.to_dict() 형태로 저장)
         self._reports = {"personal": {}, "shared": {}}
+        # owner별 날짜 구간 인덱스와 id(report) -> (owner, index key) 매핑
+        self._index = {}
+        self._index_keys = {}
+        # category -> 사용 중인 보고서 수 (목록이 바뀔 때만 정렬 캐시를 비움)
+        self._category_counts = {}
+        self._sorted_categories = None
+        # report id -> (owner, date, report)
+        self._by_id = {}
+        # ISO 주별 집계 (주간 화면용, 변경된 보고서가 걸친 주만 갱신)
+        self._weekly = WeeklyRollup()
+        # 변경 알림 구독자 [(callback, owner, immediate)]와 잠금을 풀면 보낼 알림
+        self._listeners = []
+        self._pending_events = []
+        # 되돌리기 기록 (enable_undo로 켠 경우 UndoLog)
+        self.undo = None
 
         # JSON 파일 경로 설정
         if json_file is None:
-            script_dir = Path(__file__).parent
-            # prefer config.json inside the data folder if present (user requested)
-            default_dir = "data"
-            cfg_in_data = script_dir / default_dir / "config.json"
-            cfg_root = script_dir / "config.json"
-            output_dir = default_dir
-            try:
-                import json as _json
-                # prefer config inside data folder
-                if cfg_in_data.exists():
-                    with open(cfg_in_data, 'r', encoding='utf-8') as _f:
-                        cfg = _json.load(_f)
-                        if isinstance(cfg, dict) and cfg.get("data_dir"):
-                            output_dir = cfg.get("data_dir")
-                elif cfg_root.exists():
-                    with open(cfg_root, 'r', encoding='utf-8') as _f:
-                        cfg = _json.load(_f)
-                        if isinstance(cfg, dict) and cfg.get("data_dir"):
-                            output_dir = cfg.get("data_dir")
-                else:
-                    # neither config exists -> create default root config.json
-                    default_cfg = {
-                        "name": "작성자",
-                        "data_dir": "data",
-                        "weekly_report_dir": {
-                            "json_dir": "./data/weekly_report_json",
-                            "xlsx_dir": "./data/weekly_report_xlsx"
-                        },
-                        "calendar": {
-                            "thisweek": {"background": "#FFFFFF", "foreground": "#FFFFFF"},
-                            "nextweek": {"background": "#167FFF", "foreground": "#167FFF"},
-                            "nextnextweek": {"background": "#167FFF", "foreground": "#167FFF"},
-                            "today": {"foreground": "#FFAA00"},
-                            "selectforeground": "#FF0000"
-                        },
-                        "xlsx_template": {}
-                    }
-                    try:
-                        with open(cfg_root, 'w', encoding='utf-8') as _f:
-                            _json.dump(default_cfg, _f, ensure_ascii=False, indent=2)
-                    except Exception:
-                        pass
-            except Exception:
-                pass
-            json_file = script_dir / output_dir / "data.json"
+            if config is None:
+                config = load_config()
+            json_file = data_dir(config) / "data.json"
+        self.config = config or {}
 
         self.json_file = Path(json_file)
         self.json_file.parent.mkdir(parents=True, exist_ok=True)
+        # read_only: 파일을 읽기만 하는 저장소 (일괄 내보내기 작업자 등). 저장하지 않고 검색 색인도 만들지 않는다
+        self.read_only = read_only
+        if read_only:
+            journal = False
+            save_delay = 0
+
+        # 반복 규칙 {rule id: Rule}: 바뀔 때마다 dict를 통째로 교체하고 data.rules.json에 바로 기록
+        self.rules_file = self._rules_file_path()
+        self._load_rules()
+
+        # 내용/장소/참석자 검색용 n-gram 색인 (종료 시 저장, 시작 시 바뀐 보고서만 다시 색인)
+        self.search_index_file = self.json_file.with_name("search_index.json")
+        self._search = NgramIndex()
+        self._search_dirty = False
+        self._bulk_loading = False
+        # data.json을 쓸 때마다 새로 정하는 값. 색인과 함께 저장해 열 때 색인이 최신인지 바로 안다
+        self._data_generation = None
+
+        # write-ahead journal: 변경 1건 = data.journal 한 줄, 스냅샷은 백그라운드 압축
+        if journal is None:
+            journal = bool(storage_config(self.config).get("journal"))
+        self.journal = journal
+        self.journal_file = self.json_file.with_suffix(".journal")
+        self._journal_seq = 0
+        self._journal_count = 0
+        self._pending_ops = []
+        self._replaying = False
+        self._compactor = None
+        self._closed = False
+
+        # _lock: 보고서 목록 변경/복사 (풀 때 변경 알림을 보냄), _io_lock: 파일 쓰기 순서 보장
+        self._lock = _StoreLock(self._take_events, self._dispatch)
+        self._io_lock = threading.RLock()
+        if save_delay is None:
+            save_delay = storage_config(self.config).get("save_delay", self.DEFAULT_SAVE_DELAY)
+        self._saver = None
+        if save_delay and save_delay > 0:
+            self._saver = _DebouncedSaver(self._write_out, save_delay)
+            # 프로그램이 flush() 없이 끝나더라도 마지막 변경은 기록
+            # (계측 등으로 self.flush가 바뀌어도 close()에서 지울 수 있게 등록한 것을 보관)
+            self._atexit_flush = self.flush
+            atexit.register(self._atexit_flush)
 
         # 기존 JSON 파일이 있으면 로드
         self.load_from_json()
@@ -69,106 +554,1025 @@ class ReportStore:
     def list_reports_for(self, date, owner="personal"):
         return list(self._reports.get(owner, {}).get(date, []))
 
+    @_synchronized
     def find_reports_for_date(self, date_str, owner=None):
         """주어진 날짜(date_str)가 포함되는 모든 보고서를
-        (owner, orig_date, index, report) 형태로 반환
+        (owner, orig_date, index, report) 형태로 반환 (반복 규칙 항목은 index가 -1)
         date_str: 'YYYY-MM-DD'
         owner: 'personal'|'shared' 또는 None (둘 다 검색)
         """
         results = []
-        try:
-            from datetime import datetime as _dt
-            target = _dt.strptime(date_str, "%Y-%m-%d").date()
-        except Exception:
+        target = _to_ordinal(date_str)
+        if target is None:
             return results
 
         owners = [owner] if owner else list(self._reports.keys())
         for ow in owners:
-            reports_map = self._reports.get(ow, {})
+            index = self._index.get(ow)
+            if index is None:
+                continue
+            for orig_date, r in index.overlapping(target, target):
+                idx = self._position(ow, orig_date, r)
+                if idx is not None:
+                    results.append((ow, orig_date, idx, r))
+
+        results.extend(self._rule_occurrences(target, target, owner))
+        return results
+
+    @_synchronized
+    def find_reports_in_range(self, start, end, owner=None):
+        """start ~ end (포함) 기간의 보고서를 날짜별로 묶어 반환
+        { 'YYYY-MM-DD': [(owner, orig_date, index, report), ...], ... }
+        기간 안의 모든 날짜가 키로 들어가며 (보고서가 없으면 빈 목록),
+        인덱스를 한 번만 조회하므로 달력/주간 화면에서 날짜마다 부를 필요가 없다.
+        """
+        lo = _to_ordinal(start)
+        hi = _to_ordinal(end)
+        if lo is None or hi is None or hi < lo:
+            return {}
+
+        days = [_date.fromordinal(o).strftime("%Y-%m-%d") for o in range(lo, hi + 1)]
+        buckets = {d: [] for d in days}
+
+        owners = [owner] if owner else list(self._reports.keys())
+        for ow in owners:
+            index = self._index.get(ow)
+            if index is None:
+                continue
+            for orig_date, r in index.overlapping(lo, hi):
+                idx = self._position(ow, orig_date, r)
+                if idx is None:
+                    continue
+                for o in range(max(r.start, lo), min(r.end, hi) + 1):
+                    buckets[days[o - lo]].append((ow, orig_date, idx, r))
+
+        self._add_rule_occurrences(buckets, days, lo, hi, owner)
+        return buckets
+
+    # --- interval index maintenance ---
+    def _position(self, owner, date, report):
+        """date 목록 안에서 report의 현재 위치 (동일 객체 기준)"""
+        for i, r in enumerate(self._reports.get(owner, {}).get(date, [])):
+            if r is report:
+                return i
+        return None
+
+    def _index_add(self, owner, date, report):
+        if report.start is None:
+            # 날짜를 해석할 수 없는 보고서는 조회 대상에서 제외 (기존 동작과 동일)
+            return
+        key = self._index.setdefault(owner, _IntervalIndex()).add(report.start, report.end, (date, report))
+        self._index_keys[id(report)] = (owner, key)
+
+    def _index_remove(self, report):
+        entry = self._index_keys.pop(id(report), None)
+        if entry is not None:
+            owner, key = entry
+            self._index[owner].remove(key)
+
+    def _attach(self, owner, date, report):
+        """저장소에 들어온 report를 보조 인덱스들에 등록"""
+        self._by_id[report.id] = (owner, date, report)
+        self._index_add(owner, date, report)
+        self._weekly.add(owner, report)
+        self._category_add(report.category)
+        self._search_attach(owner, date, report)
+
+    def _detach(self, report):
+        """저장소에서 빠진 report를 보조 인덱스들에서 제거"""
+        entry = self._by_id.get(report.id)
+        if entry is not None and entry[2] is report:
+            del self._by_id[report.id]
+        indexed = self._index_keys.get(id(report))
+        if indexed is not None:
+            self._weekly.remove(indexed[0], report)
+        self._index_remove(report)
+        self._category_remove(report.category)
+        self._search_detach(report)
+
+    def _rebuild_index(self):
+        self._by_id = {}
+        self._index = {}
+        self._index_keys = {}
+        self._weekly.clear()
+        self._category_counts = {}
+        self._sorted_categories = None
+        # 검색 색인은 전체를 다시 만들지 않고 _load_search_index에서 맞춘다
+        self._bulk_loading = True
+        try:
+            for ow, reports_map in self._reports.items():
+                for orig_date, reports in reports_map.items():
+                    for r in reports:
+                        self._attach(ow, orig_date, r)
+        finally:
+            self._bulk_loading = False
+
+    # --- full-text search index ---
+    def _search_attach(self, owner, date, report):
+        # journal 재생 중인 변경은 재생이 끝난 뒤 _load_search_index에서 맞춘다
+        if self._bulk_loading or self._replaying or self.read_only:
+            return
+        self._search.add(report.id, report_text(report), owner, date, report.category, report.start, report.end)
+        self._search_dirty = True
+
+    def _search_detach(self, report):
+        if self._bulk_loading or self._replaying or self.read_only:
+            return
+        self._search.remove(report.id)
+        self._search_dirty = True
+
+    def _search_stamp(self):
+        """색인과 함께 저장하는 저장소 상태: data.json 세대와 마지막 기록 번호 (세대를 모르면 None)"""
+        if self._data_generation is None:
+            return None
+        return [self._data_generation, self._journal_seq]
+
+    def _load_search_index(self):
+        """저장된 색인을 읽는다. 지금 보고서와 함께 저장된 색인이면 그대로 쓰고,
+        아니면 현재 보고서와 달라진 것만 다시 색인
+        """
+        self._search = NgramIndex.load(self.search_index_file)
+        stamp = self._search_stamp()
+        if stamp is not None and self._search.stamp == stamp:
+            self._search_dirty = False
+            return
+        live = set()
+        changed = False
+        for ow, reports_map in self._reports.items():
             for orig_date, reports in reports_map.items():
-                for idx, r in enumerate(reports):
-                    s = r.get("start_date") or orig_date
-                    e = r.get("end_date") or s
-                    try:
-                        s_date = _dt.strptime(s, "%Y-%m-%d").date()
-                        e_date = _dt.strptime(e, "%Y-%m-%d").date()
-                    except Exception:
-                        continue
+                for r in reports:
+                    live.add(r.id)
+                    changed |= self._search.ensure(r.id, report_text(r), ow, orig_date, r.category, r.start, r.end)
+        for doc_id in self._search.doc_ids():
+            if doc_id not in live:
+                self._search.remove(doc_id)
+                changed = True
+        self._search_dirty = changed
 
-                    if s_date <= target <= e_date:
-                        results.append((ow, orig_date, idx, r))
+    def _save_search_index(self):
+        stamp = self._search_stamp()
+        if self._search_dirty or (stamp is not None and self._search.stamp != stamp):
+            self._search.stamp = stamp
+            self._search.save(self.search_index_file)
+            self._search_dirty = False
 
+    @_synchronized
+    def search(self, query, owner=None, category=None, start=None, end=None, limit=50):
+        """내용/장소/참석자에서 query를 찾아 관련도 순으로 (owner, orig_date, index, report) 목록 반환
+        owner/category로 거르고, start/end('YYYY-MM-DD')가 주어지면 기간이 겹치는 보고서만
+        """
+        lo = _to_ordinal(start) if start else None
+        hi = _to_ordinal(end) if end else None
+        results = []
+        for _score, report_id, ow, orig_date in self._search.search(query, owner, category, lo, hi, limit):
+            found = self._resolve_search_hit(report_id, ow, orig_date)
+            if found is not None:
+                results.append(found)
         return results
 
+    def _resolve_search_hit(self, report_id, owner, orig_date):
+        entry = self._by_id.get(report_id)
+        if entry is None:
+            return None
+        ow, date, report = entry
+        return ow, date, self._position(ow, date, report), report
+
+    # --- category index ---
+    def _category_add(self, category):
+        if not category:
+            return
+        count = self._category_counts.get(category, 0)
+        if count == 0:
+            self._sorted_categories = None
+        self._category_counts[category] = count + 1
+
+    def _category_remove(self, category):
+        count = self._category_counts.get(category, 0)
+        if count <= 1:
+            if self._category_counts.pop(category, None) is not None:
+                self._sorted_categories = None
+        else:
+            self._category_counts[category] = count - 1
+
+    # --- change notification ---
+    def subscribe(self, callback, owner=None, immediate=False):
+        """보고서가 추가/수정/이동/삭제될 때마다 callback(ChangeEvent) 호출. 해제 함수 반환
+        owner를 주면 그 owner가 관련된 변경만 받는다.
+        callback은 변경한 스레드에서 저장소 잠금을 푼 뒤에 불린다. 작업 스레드에서 바뀔 수도 있으므로
+        화면 갱신은 StoreWorker.main_thread(callback)으로 감싸 메인 스레드에서 한다.
+        immediate: 잠금을 쥔 채 변경 순서대로 바로 부른다 (되돌리기 기록처럼 변경과 함께 묶여야 할 때)
+        """
+        entry = (callback, owner, immediate)
+        with self._lock:
+            self._listeners = self._listeners + [entry]
+
+        def unsubscribe():
+            with self._lock:
+                self._listeners = [e for e in self._listeners if e is not entry]
+        return unsubscribe
+
+    def enable_undo(self, max_steps=None, max_kb=None, path=None):
+        """변경을 되돌릴 수 있게 기록을 켠다 (self.undo). path를 주면 파일에 남겨 다시 열어도 되돌릴 수 있다"""
+        if self.undo is None:
+            from undo_log import UndoLog
+            self.undo = UndoLog(self, max_steps, max_kb, path)
+        return self.undo
+
+    def _emit(self, kind, owner, date, report, old_owner=None, old_date=None, old_report=None):
+        if not self._listeners or self._replaying:
+            return
+        event = ChangeEvent(kind, owner, date, report, old_owner, old_date, old_report)
+        self._notify(event, immediate=True)
+        self._pending_events.append(event)
+
+    def _notify(self, event, immediate):
+        for callback, want, now in self._listeners:
+            if now != immediate or (want is not None and want not in (event.owner, event.old_owner)):
+                continue
+            try:
+                callback(event)
+            except Exception as e:
+                print(f"변경 알림 처리 실패: {e}")
+
+    def _take_events(self):
+        events, self._pending_events = self._pending_events, []
+        return events
+
+    def _dispatch(self, events):
+        for event in events:
+            self._notify(event, immediate=False)
+
+    @_synchronized
     def add_report(self, date, report=None, owner="personal"):
         if report is None:
             report = {"content": "", "category": "", "location": "", "attendees": "", "start_date": date, "end_date": ""}
+        report = Report.from_dict(report, date)
         self._reports.setdefault(owner, {})
         self._reports[owner].setdefault(date, []).append(report)
+        self._attach(owner, date, report)
+        self._log_op({"op": "add", "owner": owner, "date": date, "report": report})
+        self._emit("added", owner, date, report)
         return len(self._reports[owner][date]) - 1
 
+    @_synchronized
+    def add_reports(self, items):
+        """(owner, date, report dict) 여러 건을 한 번에 추가하고 추가한 수를 반환
+        저장은 하지 않으므로 일괄 가져오기가 끝난 뒤 save_to_json()을 한 번 부르면 된다.
+        """
+        count = 0
+        for owner, date, report in items:
+            self.add_report(date, report, owner=owner)
+            count += 1
+        return count
+
+    def iter_reports(self, owner=None, start=None, end=None, rules=True):
+        """(owner, date, report)를 owner별 저장 키 날짜 순으로 하나씩 반환
+        start/end('YYYY-MM-DD')가 주어지면 기간이 겹치는 보고서만
+        rules: 반복 규칙 항목도 저장된 보고서 다음에 반환 (_iter_rule_occurrences 참고)
+        """
+        lo = _to_ordinal(start) if start else None
+        hi = _to_ordinal(end) if end else None
+        owners = [owner] if owner else list(self._reports.keys())
+        for ow in owners:
+            with self._lock:
+                dates = sorted(self._reports.get(ow, {}))
+            for d in dates:
+                with self._lock:
+                    reports = list(self._reports.get(ow, {}).get(d, []))
+                for r in reports:
+                    if _in_range(r, lo, hi):
+                        yield ow, d, r
+        if rules:
+            yield from self._iter_rule_occurrences(owner, start, end)
+
     def get_report(self, date, index, owner="personal"):
         return self._reports.get(owner, {}).get(date, [])[index]
 
+    @_synchronized
     def update_report(self, date, index, report, owner="personal"):
         self._reports.setdefault(owner, {})
         self._reports[owner].setdefault(date, [])
+        old = self._reports[owner][date][index]
+        report = Report.from_dict(report, date, old.id)
+        self._detach(old)
         self._reports[owner][date][index] = report
+        self._attach(owner, date, report)
+        self._log_op({"op": "update", "owner": owner, "date": date, "index": index, "report": report})
+        self._emit("updated", owner, date, report, owner, date, old)
 
+    @_synchronized
     def move_report(self, old_date, new_date, index, report, owner="personal", new_owner=None):
         """보고서를 같은 owner 내에서 다른 날짜로 이동하거나 owner를 바꿔 이동"""
         if new_owner is None:
             new_owner = owner
         # 기존 날짜에서 삭제
+        old_id = None
+        old = None
         if old_date in self._reports.get(owner, {}) and 0 <= index < len(self._reports[owner][old_date]):
             try:
-                del self._reports[owner][old_date][index]
+                old = self._reports[owner][old_date].pop(index)
+                old_id = old.id
+                self._detach(old)
             except Exception:
                 pass
-        # 새 날짜에 추가
+        # 새 날짜에 추가 (id 유지)
+        report = Report.from_dict(report, new_date, old_id)
         self._reports.setdefault(new_owner, {})
         self._reports[new_owner].setdefault(new_date, []).append(report)
+        self._attach(new_owner, new_date, report)
+        self._log_op({"op": "move", "owner": owner, "old_date": old_date, "new_date": new_date,
+                      "index": index, "new_owner": new_owner, "report": report})
+        if old is None:
+            self._emit("added", new_owner, new_date, report)
+        else:
+            self._emit("moved", new_owner, new_date, report, owner, old_date, old)
         return len(self._reports[new_owner][new_date]) - 1
 
+    @_synchronized
     def delete_report(self, date, index, owner="personal"):
         if date in self._reports.get(owner, {}) and 0 <= index < len(self._reports[owner][date]):
-            del self._reports[owner][date][index]
+            removed = self._reports[owner][date].pop(index)
+            self._detach(removed)
+            self._log_op({"op": "delete", "owner": owner, "date": date, "index": index})
+            self._emit("deleted", owner, date, removed)
+
+    # --- id 기반 접근 ---
+    @_synchronized
+    def get_by_id(self, report_id):
+        """id로 보고서 조회 (없으면 KeyError)"""
+        entry = self._by_id.get(report_id)
+        if entry is None:
+            return self._occurrence_by_id(report_id)
+        return entry[2]
+
+    @_synchronized
+    def locate_by_id(self, report_id):
+        """id -> (owner, date, index), 없으면 None (반복 규칙 항목은 index가 -1)"""
+        entry = self._by_id.get(report_id)
+        if entry is None:
+            return self._locate_occurrence(report_id)
+        owner, date, report = entry
+        return owner, date, self._position(owner, date, report)
+
+    @_synchronized
+    def update_by_id(self, report_id, report):
+        """같은 저장 위치에서 내용만 교체 (목록 순서 유지)
+        반복 규칙 항목이면 그 날만 규칙에서 빼고 새 id의 보고서로 저장한다 (새 Report 반환)
+        """
+        if report_id not in self._by_id:
+            return self._override_occurrence(report_id, report)
+        owner, date, old = self._by_id[report_id]
+        reports = self._reports[owner][date]
+        report = _report_with_id(report, date, report_id)
+        reports[self._position(owner, date, old)] = report
+        self._detach(old)
+        self._attach(owner, date, report)
+        self._log_op({"op": "update_id", "id": report_id, "report": report})
+        self._emit("updated", owner, date, report, owner, date, old)
+        return report
+
+    @_synchronized
+    def move_by_id(self, report_id, new_date, report=None, new_owner=None):
+        """보고서를 다른 날짜(저장 키)/owner로 이동, report가 주어지면 내용도 교체
+        반복 규칙 항목이면 update_by_id처럼 그 날만 빼서 새 보고서로 옮긴다
+        """
+        if report_id not in self._by_id:
+            return self._override_occurrence(report_id, report, new_date, new_owner)
+        owner, date, old = self._by_id[report_id]
+        if new_owner is None:
+            new_owner = owner
+        report = _report_with_id(report if report is not None else old, new_date, report_id)
+        self._reports[owner][date].pop(self._position(owner, date, old))
+        self._detach(old)
+        self._reports.setdefault(new_owner, {}).setdefault(new_date, []).append(report)
+        self._attach(new_owner, new_date, report)
+        self._log_op({"op": "move_id", "id": report_id, "new_date": new_date, "new_owner": new_owner,
+                      "report": report})
+        self._emit("moved", new_owner, new_date, report, owner, date, old)
+        return report
+
+    @_synchronized
+    def delete_by_id(self, report_id):
+        """id의 보고서 삭제 (반복 규칙 항목이면 그 날만 뺀다). 없으면 False"""
+        entry = self._by_id.get(report_id)
+        if entry is None:
+            return self._skip_by_id(report_id)
+        owner, date, report = entry
+        self._reports[owner][date].pop(self._position(owner, date, report))
+        self._detach(report)
+        self._log_op({"op": "delete_id", "id": report_id})
+        self._emit("deleted", owner, date, report)
+        return True
+
+    # --- 반복 규칙 ---
+    def _rules_file_path(self):
+        # 같은 폴더의 다른 저장소(백업 사본 등)와 섞이지 않도록 파일 이름에서 만든다
+        return self.json_file.with_name(f"{self.json_file.stem}.rules.json")
+
+    def _load_rules(self):
+        self._rules = {}
+        try:
+            if self.rules_file.exists():
+                with open(self.rules_file, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                rules = {}
+                for item in data.get("rules", []):
+                    try:
+                        rule = Rule.from_dict(item)
+                    except Exception as e:
+                        print(f"반복 규칙 로드 실패 ({item.get('id')}): {e}")
+                        continue
+                    rules[rule.id] = rule
+                self._rules = rules
+        except Exception as e:
+            print(f"반복 규칙 로드 실패: {e}")
+
+    def _save_rules(self):
+        if self.read_only:
+            return
+        self._write_json_atomic({"rules": [r.to_dict() for r in self._rules.values()]}, self.rules_file)
+
+    def _put_rule(self, rule, old=None):
+        """규칙 추가/교체 (rule이 None이면 old 삭제) 후 기록
+        journal 모드에서는 보고서 변경과 같은 journal에 순서대로 남기고 규칙 파일은 압축할 때 쓴다
+        (규칙 파일만 먼저 바뀐 채 중단되면 journal의 보고서 변경과 어긋나므로)
+        """
+        rule_id = old.id if rule is None else rule.id
+        self._set_rule(rule_id, rule)
+        if self.journal:
+            self._log_op({"op": "rule", "id": rule_id, "rule": rule.to_dict() if rule is not None else None})
+        else:
+            self._save_rules()
+
+    def _set_rule(self, rule_id, rule):
+        rules = dict(self._rules)
+        if rule is None:
+            rules.pop(rule_id, None)
+        else:
+            rules[rule_id] = rule
+        self._rules = rules
+
+    def list_rules(self, owner=None):
+        return [r for r in self._rules.values() if owner is None or r.owner == owner]
+
+    def get_rule(self, rule_id):
+        """id로 반복 규칙 조회 (없으면 KeyError)"""
+        return self._rules[rule_id]
+
+    def rule_for(self, report_id):
+        """반복 규칙 항목 id('규칙id@YYYY-MM-DD')면 그 규칙, 아니면 None"""
+        rule_id, sep, _date_str = str(report_id).rpartition("@")
+        return self._rules.get(rule_id) if sep else None
+
+    @_synchronized
+    def add_rule(self, freq, report, until=None, owner="personal"):
+        """반복 보고서 규칙 추가. report의 start_date~end_date가 첫 항목의 기간
+        freq: 'weekly' | 'biweekly' | 'monthly', until: 마지막 항목 시작일 상한 ('YYYY-MM-DD', 없으면 계속)
+        추가한 Rule 반환 (주기/날짜가 올바르지 않으면 ValueError)
+        """
+        data = dict(report)
+        data.pop("id", None)
+        rule = Rule.from_dict(dict(data, freq=freq, owner=owner, until=until or ""))
+        self._put_rule(rule)
+        self._emit("rule", owner, rule.template.start_date, rule.period_report())
+        return rule
+
+    @_synchronized
+    def update_rule(self, rule_id, report=None, freq=None, until=None):
+        """규칙의 내용/기간(report), 주기(freq), 종료일(until, ''이면 종료일 없음)을 바꾼다
+        이미 뺀 날짜와 따로 저장된 항목은 그대로 둔다. 바뀐 Rule 반환
+        """
+        old = self._rules[rule_id]
+        data = old.to_dict()
+        if report is not None:
+            data.update({k: report.get(k, "") for k in ("content", "category", "location", "attendees",
+                                                       "start_date", "end_date")})
+        if freq is not None:
+            data["freq"] = freq
+        if until is not None:
+            data["until"] = until
+        rule = Rule.from_dict(data)
+        self._put_rule(rule)
+        self._emit("rule", rule.owner, rule.template.start_date, rule.period_report(),
+                   old.owner, old.template.start_date, old.period_report())
+        return rule
+
+    @_synchronized
+    def delete_rule(self, rule_id):
+        """규칙 삭제 (따로 저장된 항목은 남는다). 없으면 False"""
+        old = self._rules.get(rule_id)
+        if old is None:
+            return False
+        self._put_rule(None, old)
+        self._emit("rule", old.owner, old.template.start_date, old.period_report())
+        return True
+
+    @_synchronized
+    def skip_occurrence(self, rule_id, date):
+        """규칙의 date('YYYY-MM-DD')에 시작하는 항목 하나만 뺀다 (예외 날짜). 뺐으면 True"""
+        rule = self._rules.get(rule_id)
+        ordinal = _to_ordinal(date)
+        if rule is None or ordinal is None or not rule.occurs_on(ordinal):
+            return False
+        self._put_rule(rule.replace(exceptions=rule.exceptions | {ordinal}))
+        self._emit("deleted", rule.owner, date, rule.occurrence(ordinal))
+        return True
+
+    @_synchronized
+    def unskip_occurrence(self, rule_id, date):
+        """skip_occurrence로 뺀 항목을 되살린다. 되살렸으면 True"""
+        rule = self._rules.get(rule_id)
+        ordinal = _to_ordinal(date)
+        if rule is None or ordinal not in rule.exceptions:
+            return False
+        self._put_rule(rule.replace(exceptions=rule.exceptions - {ordinal}))
+        self._emit("added", rule.owner, date, rule.occurrence(ordinal))
+        return True
+
+    def restore_report(self, date, report, owner="personal"):
+        """지워진 보고서를 되살린다 (되돌리기용): 뺀 반복 규칙 항목이면 규칙에 되돌리고, 아니면 add_report"""
+        found = self._occurrence(report.get("id"), skipped=True)
+        if found is not None and found[1] in found[0].exceptions and self.unskip_occurrence(found[0].id, date):
+            return -1
+        return self.add_report(date, report, owner)
+
+    def _occurrence(self, report_id, skipped=False):
+        """반복 규칙 항목 id -> (rule, 시작일 ordinal), 그런 항목이 없으면 None"""
+        rule = self.rule_for(report_id)
+        if rule is None:
+            return None
+        ordinal = _to_ordinal(report_id.rpartition("@")[2])
+        if ordinal is None or not rule.occurs_on(ordinal, skipped):
+            return None
+        return rule, ordinal
+
+    def _occurrence_by_id(self, report_id):
+        found = self._occurrence(report_id)
+        if found is None:
+            raise KeyError(report_id)
+        return found[0].occurrence(found[1])
+
+    def _locate_occurrence(self, report_id):
+        found = self._occurrence(report_id)
+        if found is None:
+            return None
+        return found[0].owner, _from_ordinal(found[1]), -1
+
+    def _skip_by_id(self, report_id):
+        found = self._occurrence(report_id)
+        if found is None:
+            return False
+        return self.skip_occurrence(found[0].id, _from_ordinal(found[1]))
+
+    def _override_occurrence(self, report_id, report, new_date=None, new_owner=None):
+        """반복 규칙 항목 하나를 따로 저장된 보고서로 바꾼다 (나머지 항목은 그대로 규칙에서 만든다)
+        되돌리기에서는 '그 날 빼기 + 보고서 추가'가 한 단계다.
+        """
+        found = self._occurrence(report_id)
+        if found is None:
+            raise KeyError(report_id)
+        rule, ordinal = found
+        date = _from_ordinal(ordinal)
+        data = dict(report if report is not None else rule.occurrence(ordinal))
+        data.pop("id", None)
+        key = new_date or date
+        report = Report.from_dict(data, key)
+        with self._undo_group("수정" if new_date is None else "이동"):
+            self.skip_occurrence(rule.id, date)
+            self.add_report(key, report, new_owner or rule.owner)
+        return report
+
+    def _undo_group(self, label):
+        return self.undo.group(label) if self.undo is not None else contextlib.nullcontext()
+
+    def _rule_occurrences(self, lo, hi, owner=None):
+        """기간이 [lo, hi]와 겹치는 반복 규칙 항목 [(owner, 시작일, -1, Report)] (조회한 기간만 만든다)"""
+        found = []
+        for rule in self._rules.values():
+            if owner is not None and rule.owner != owner:
+                continue
+            for s in rule.starts(lo, hi):
+                found.append((rule.owner, _from_ordinal(s), -1, rule.occurrence(s)))
+        return found
+
+    def _add_rule_occurrences(self, buckets, days, lo, hi, owner=None):
+        """find_reports_in_range의 날짜별 목록에 반복 규칙 항목을 더한다"""
+        for entry in self._rule_occurrences(lo, hi, owner):
+            r = entry[3]
+            for o in range(max(r.start, lo), min(r.end, hi) + 1):
+                buckets[days[o - lo]].append(entry)
+
+    def _iter_rule_occurrences(self, owner=None, start=None, end=None):
+        """iter_reports의 반복 규칙 항목 (owner, 시작일, Report)을 owner, 시작일 순으로
+        start가 없으면 규칙의 첫 항목부터, end가 없으면 규칙의 종료일까지 (종료일이 없으면
+        오늘부터 RULE_HORIZON_DAYS일까지) 만든다.
+        """
+        lo = _to_ordinal(start) if start else None
+        hi = _to_ordinal(end) if end else None
+        horizon = _date.today().toordinal() + self.RULE_HORIZON_DAYS
+        found = []
+        for rule in self.list_rules(owner):
+            rule_hi = hi if hi is not None else (rule.until if rule.until is not None else horizon)
+            for s in rule.starts(lo if lo is not None else rule.template.start, rule_hi):
+                found.append((rule.owner, s, rule.id, rule.occurrence(s)))
+        found.sort(key=lambda item: item[:3])
+        for ow, s, _rule_id, report in found:
+            yield ow, _from_ordinal(s), report
+
+    def week_summary(self, year, week):
+        """ISO (year, week) 주의 집계
+        {year, week, start, end, reports, by_owner, categories, days, days_covered}
+        reports/by_owner/categories는 그 주에 걸친 보고서 수 (여러 주에 걸친 보고서는 주마다 1건),
+        days는 날짜별로 그 날을 포함하는 보고서 수, days_covered는 보고서가 있는 날 수
+        """
+        return self._summary_with_rules(iso_week_monday(year, week))
+
+    def week_summary_for(self, date_str):
+        """date_str('YYYY-MM-DD')이 속한 주의 집계"""
+        ordinal = _to_ordinal(date_str)
+        if ordinal is None:
+            return None
+        return self._summary_with_rules(week_monday(ordinal))
+
+    def _summary_with_rules(self, monday):
+        # 반복 규칙 항목은 집계 색인에 없으므로 그 주에 항목이 있으면 범위 조회로 센다
+        if self._rule_occurrences(monday, monday + 6):
+            buckets = self.find_reports_in_range(_from_ordinal(monday), _from_ordinal(monday + 6))
+            return rollup_from_buckets(monday, buckets)
+        return self._week_summary(monday)
+
+    def _week_summary(self, monday):
+        with self._lock:
+            return self._weekly.summary(monday)
 
     def has_reports(self, date, owner="personal"):
         return bool(self._reports.get(owner, {}).get(date))
 
-    def list_categories(self):
-        cats = set()
-        for owner_map in self._reports.values():
-            for reports in owner_map.values():
-                for r in reports:
-                    if r.get("category"):
-                        cats.add(r["category"])
-        return sorted(cats)
+    def list_categories(self, by_frequency=False):
+        """사용 중인 카테고리 목록 (기본 이름순, by_frequency=True면 많이 쓰인 순)"""
+        if by_frequency:
+            counts = self._category_counts
+            return sorted(counts, key=lambda c: (-counts[c], c))
+        if self._sorted_categories is None:
+            self._sorted_categories = sorted(self._category_counts)
+        return list(self._sorted_categories)
+
+    def category_counts(self):
+        """{category: 사용 중인 보고서 수}"""
+        return dict(self._category_counts)
+
+    @_synchronized
+    def delete_category(self, category):
+        """카테고리 삭제: 해당 카테고리를 쓰던 보고서(반복 규칙 포함)의 카테고리를 비운다. 바뀐 수 반환"""
+        changed = self._clear_rule_category(category)
+        if not category or category not in self._category_counts:
+            return changed
+        for ow, reports_map in self._reports.items():
+            for orig_date, reports in reports_map.items():
+                for i, r in enumerate(reports):
+                    if r.category != category:
+                        continue
+                    cleared = r.to_dict()
+                    cleared["category"] = ""
+                    cleared = Report.from_dict(cleared, orig_date)
+                    self._detach(r)
+                    reports[i] = cleared
+                    self._attach(ow, orig_date, cleared)
+                    self._emit("updated", ow, orig_date, cleared, ow, orig_date, r)
+                    changed += 1
+        self._log_op({"op": "delete_category", "category": category})
+        return changed
+
+    def _clear_rule_category(self, category):
+        changed = 0
+        for rule in list(self._rules.values()):
+            if category and rule.template.category == category:
+                self.update_rule(rule.id, dict(rule.template, category=""))
+                changed += 1
+        return changed
 
     def save_to_json(self):
-        """모든 보고서를 JSON 파일로 저장"""
+        """모든 보고서를 JSON 파일로 저장
+        저장 스레드가 있으면 요청만 남기고 바로 반환하며, 실제 기록은 잠시 뒤 백그라운드에서 한다.
+        journal 모드에서는 마지막 저장 이후의 변경분만 data.journal에 덧붙인다.
+        """
+        if self._saver is not None:
+            self._saver.request()
+        else:
+            self._write_out()
+
+    def flush(self):
+        """대기 중인 저장을 즉시 수행하고 진행 중인 압축이 끝날 때까지 기다림 (종료 시 호출)"""
+        requested = self._saver.cancel() if self._saver is not None else False
+        # io_lock: 저장 스레드가 쓰는 중이면 끝날 때까지 기다린다
+        with self._io_lock:
+            if requested or self._pending_ops:
+                self._write_out()
+        compactor = self._compactor
+        if compactor is not None:
+            compactor.join()
+        # 압축으로 바뀐 data.json 세대까지 반영해 색인을 저장한다
+        with self._io_lock:
+            self._save_search_index()
+
+    def close(self):
+        """남은 변경을 기록하고 저장 스레드와 종료 시 저장 등록을 정리한다 (저장소를 바꾸거나 끝낼 때)
+        닫은 저장소는 더 쓰지 않는다. 여러 번 불러도 된다.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        if self.undo is not None:
+            self.undo.close()
+        if not self.read_only:
+            self.flush()
+        if self._saver is not None:
+            atexit.unregister(self._atexit_flush)
+            self._saver.close()
+            self._saver = None
+
+    def _write_out(self):
+        if self.read_only:
+            self._pending_ops = []
+            return
+        with self._io_lock:
+            if self.journal:
+                self._append_journal()
+                return
+            with self._lock:
+                snapshot = self._snapshot()
+                seq = self._journal_seq
+                self._pending_ops = []
+            data = self._snapshot_to_json(snapshot)
+            data["_journal_seq"] = seq
+            data["_generation"] = uuid.uuid4().hex
+            if not self._write_json_atomic(data):
+                return
+            self._data_generation = data["_generation"]
+            # 전체 스냅샷을 썼으므로 남아 있던 journal은 더 이상 필요 없음
+            for path in (self.journal_file, self._old_journal_file()):
+                try:
+                    path.unlink()
+                except FileNotFoundError:
+                    pass
+                except Exception as e:
+                    print(f"journal 삭제 실패: {e}")
+
+    def _snapshot(self):
+        """현재 보고서 목록의 얕은 복사본 (Report는 교체만 되므로 참조 공유가 안전)"""
+        return {ow: {d: list(reports) for d, reports in m.items()} for ow, m in self._reports.items()}
+
+    @staticmethod
+    def _snapshot_to_json(snapshot):
+        return {ow: {d: [r.to_dict() for r in reports] for d, reports in m.items()} for ow, m in snapshot.items()}
+
+    def _write_json_atomic(self, data, path=None):
+        """임시 파일에 쓴 뒤 rename으로 교체 (쓰는 도중 중단되어도 기존 파일 유지)"""
+        path = Path(path) if path is not None else self.json_file
+        tmp = path.with_suffix(".json.tmp")
         try:
-            with open(self.json_file, 'w', encoding='utf-8') as f:
-                json.dump(self._reports, f, ensure_ascii=False, indent=2)
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, path)
         except Exception as e:
             print(f"JSON 저장 실패: {e}")
+            return False
+        return True
 
     def load_from_json(self):
         """JSON 파일에서 보고서 로드"""
-        if not self.json_file.exists():
-            return
-
+        snapshot_seq = 0
+        self._data_generation = None
         try:
-            with open(self.json_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = {}
+            if self.json_file.exists():
+                with open(self.json_file, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                if isinstance(data, dict):
+                    snapshot_seq = data.get("_journal_seq", 0)
+                    self._data_generation = data.get("_generation")
                 # backward compatibility: older format was a flat date->list mapping
                 if isinstance(data, dict) and ("personal" in data or "shared" in data):
                     # assume new format
-                    self._reports = data
+                    self._reports = self._from_json_data(data)
                 else:
                     # old format: treat as personal
-                    self._reports = {"personal": data or {}, "shared": {}}
+                    self._reports = self._from_json_data({"personal": data or {}, "shared": {}})
         except Exception as e:
             print(f"JSON 로드 실패: {e}")
             self._reports = {"personal": {}, "shared": {}}
+        self._rebuild_index()
+        self._journal_seq = snapshot_seq
+        self._replay_journal()
+        if not self.read_only:
+            self._load_search_index()
+
+    @staticmethod
+    def _from_json_data(data):
+        reports = {"personal": {}, "shared": {}}
+        for ow, reports_map in data.items():
+            if not isinstance(reports_map, dict):
+                continue
+            reports[ow] = {
+                d: [Report.from_dict(r, d, _legacy_report_id(ow, d, i)) for i, r in enumerate(items)]
+                for d, items in reports_map.items()
+            }
+        return reports
+
+    # --- write-ahead journal ---
+    def _old_journal_file(self):
+        return self.journal_file.with_suffix(".journal.old")
+
+    def _log_op(self, op):
+        if self._replaying:
+            return
+        self._journal_seq += 1
+        op["seq"] = self._journal_seq
+        self._pending_ops.append(op)
+
+    def _append_journal(self):
+        """대기 중인 변경 기록을 journal 끝에 추가 (fsync 후 반환)"""
+        with self._lock:
+            ops, self._pending_ops = self._pending_ops, []
+        if ops:
+            lines = []
+            for op in ops:
+                rec = dict(op)
+                if "report" in rec:
+                    rec["report"] = rec["report"].to_dict()
+                lines.append(json.dumps(rec, ensure_ascii=False))
+            try:
+                with open(self.journal_file, 'a', encoding='utf-8') as f:
+                    f.write("\n".join(lines) + "\n")
+                    f.flush()
+                    os.fsync(f.fileno())
+            except Exception as e:
+                print(f"journal 기록 실패: {e}")
+                # 다음 저장 때 다시 시도
+                with self._lock:
+                    self._pending_ops[:0] = ops
+                return
+            self._journal_count += len(ops)
+        if self._journal_count >= self.JOURNAL_COMPACT_EVERY:
+            self.compact_journal()
+
+    def compact_journal(self, wait=False):
+        """journal을 스냅샷(data.json)으로 압축
+
+        현재 journal을 .old로 돌려놓고 그 시점의 보고서 목록을 복사한 뒤,
+        직렬화와 파일 쓰기는 백그라운드 스레드에서 한다. 스냅샷에는 포함된
+        마지막 기록 번호(_journal_seq)를 남기므로 중간에 중단되어도 재시작 시
+        같은 기록을 두 번 적용하지 않는다.
+        """
+        with self._io_lock:
+            if self._compactor is not None and self._compactor.is_alive():
+                if wait:
+                    self._compactor.join()
+                return
+            self._start_compaction()
+        if wait:
+            self._compactor.join()
+
+    def _start_compaction(self):
+        old = self._old_journal_file()
+        if old.exists():
+            # 이전 압축이 끝나지 않은 채 종료됨 -> 현재 journal을 .old 뒤에 합침
+            # (중간에 중단되어 기록이 겹치더라도 재생 시 seq로 걸러진다)
+            try:
+                tmp = old.with_suffix(".old.tmp")
+                with open(tmp, 'wb') as dst:
+                    for path in (old, self.journal_file):
+                        if path.exists():
+                            with open(path, 'rb') as src:
+                                dst.write(src.read())
+                    dst.flush()
+                    os.fsync(dst.fileno())
+                os.replace(tmp, old)
+                self.journal_file.unlink(missing_ok=True)
+            except Exception as e:
+                print(f"journal 압축 실패: {e}")
+                return
+        elif self.journal_file.exists():
+            try:
+                os.replace(self.journal_file, old)
+            except Exception as e:
+                print(f"journal 압축 실패: {e}")
+                return
+        with self._lock:
+            snapshot = self._snapshot()
+            rules = list(self._rules.values())
+            # 아직 journal에 쓰지 않은 변경도 스냅샷에 포함되므로 seq는 메모리 기준
+            seq = self._journal_seq
+        self._journal_count = 0
+        # non-daemon: 앱 종료 시에도 압축이 끝날 때까지 기다린다
+        self._compactor = threading.Thread(target=self._write_snapshot, args=(snapshot, seq, old, rules))
+        self._compactor.start()
+
+    def _write_snapshot(self, snapshot, seq, old_journal, rules):
+        data = self._snapshot_to_json(snapshot)
+        data["_journal_seq"] = seq
+        data["_generation"] = uuid.uuid4().hex
+        # 규칙을 먼저 쓴다: journal의 규칙 기록은 규칙 하나의 전체 상태이므로 다시 재생해도 같은 상태가 된다
+        if not self._write_json_atomic({"rules": [r.to_dict() for r in rules]}, self.rules_file):
+            return
+        if self._write_json_atomic(data):
+            self._data_generation = data["_generation"]
+            old_journal.unlink(missing_ok=True)
+
+    def _replay_journal(self):
+        """스냅샷 이후의 journal 기록을 순서대로 다시 적용
+        적용할 수 없는 기록을 만나면 거기서 멈추고 그 뒤의 기록은 .journal.rejected로 옮긴다
+        (위치로 가리키는 기록은 앞의 기록이 빠지면 엉뚱한 보고서를 고치므로 건너뛰고 계속하지 않는다)
+        """
+        self._replaying = True
+        rules = self._rules
+        try:
+            stopped = False
+            for path in (self._old_journal_file(), self.journal_file):
+                if not path.exists():
+                    continue
+                if stopped:
+                    self._reject_journal(path, 0)
+                elif not self._replay_file(path):
+                    stopped = True
+        finally:
+            self._replaying = False
+        if self._rules is not rules and not self.journal:
+            # journal을 끈 뒤 처음 열 때: 전체 스냅샷을 쓰면 journal이 지워지므로 규칙은 여기서 기록
+            self._save_rules()
+
+    def _rejected_journal_file(self):
+        return self.journal_file.with_suffix(".journal.rejected")
+
+    def _replay_file(self, path):
+        """path의 기록을 적용. 적용할 수 없는 기록에서 멈췄으면 False"""
+        good_size = 0
+        torn = False
+        with open(path, 'rb') as f:
+            for raw in f:
+                try:
+                    op = json.loads(raw.decode('utf-8'))
+                except Exception:
+                    # 기록 도중 중단된 마지막 줄은 버린다
+                    torn = True
+                    break
+                seq = op.get("seq", 0)
+                if seq > self._journal_seq:
+                    try:
+                        self._apply_op(op)
+                    except Exception as e:
+                        print(f"journal 기록 적용 실패 ({path.name} seq {seq}): {e!r}, 이후 기록은 건너뜀")
+                        self._reject_journal(path, good_size)
+                        return False
+                    self._journal_seq = seq
+                    self._journal_count += 1
+                # seq가 이하면 스냅샷에 이미 반영되었거나 중복된 기록
+                good_size += len(raw)
+        if torn and not self.read_only:
+            try:
+                with open(path, 'r+b') as f:
+                    f.truncate(good_size)
+            except Exception as e:
+                print(f"journal 복구 실패: {e}")
+        return True
+
+    def _reject_journal(self, path, size):
+        """path의 size 바이트 뒤를 .journal.rejected 끝에 옮겨 두고 잘라낸다 (읽기 전용이면 그대로)"""
+        if self.read_only:
+            return
+        try:
+            with open(path, 'r+b') as f:
+                f.seek(size)
+                rest = f.read()
+                with open(self._rejected_journal_file(), 'ab') as dst:
+                    dst.write(rest)
+                    dst.flush()
+                    os.fsync(dst.fileno())
+                f.truncate(size)
+        except Exception as e:
+            print(f"journal 복구 실패: {e}")
+
+    def _apply_op(self, op):
+        kind = op.get("op")
+        owner = op.get("owner", "personal")
+        if kind == "add":
+            self.add_report(op["date"], op["report"], owner=owner)
+        elif kind == "update":
+            self.update_report(op["date"], op["index"], op["report"], owner=owner)
+        elif kind == "move":
+            self.move_report(op["old_date"], op["new_date"], op["index"], op["report"],
+                             owner=owner, new_owner=op.get("new_owner"))
+        elif kind == "delete":
+            self.delete_report(op["date"], op["index"], owner=owner)
+        elif kind == "update_id":
+            self.update_by_id(op["id"], op["report"])
+        elif kind == "move_id":
+            self.move_by_id(op["id"], op["new_date"], op["report"], new_owner=op.get("new_owner"))
+        elif kind == "delete_id":
+            self.delete_by_id(op["id"])
+        elif kind == "delete_category":
+            self.delete_category(op["category"])
+        elif kind == "rule":
+            self._set_rule(op["id"], Rule.from_dict(op["rule"]) if op.get("rule") else None)
@@ -0,0 +1,195 @@
+import json
+import math
+import os
+import zlib
+from pathlib import Path
+
+
+# 형태소 분석기 없이 한국어도 찾을 수 있도록 글자 단위 2-gram을 색인한다
+NGRAM = 2
+# 2: 글자 하나짜리 gram도 색인
+INDEX_VERSION = 2
+
+# BM25 parameters
+K1 = 1.2
+B = 0.75
+
+
+def report_text(report):
+    """검색 대상 필드 (내용, 장소, 참석자)"""
+    return "\n".join((report.content, report.location, report.attendees))
+
+
+def text_checksum(text):
+    return zlib.crc32(text.encode("utf-8"))
+
+
+def ngrams(text):
+    """텍스트 -> {gram: 횟수}. 공백으로 나눈 토큰마다 2-gram, 한 글자 토큰은 그 글자 자체"""
+    grams = {}
+    for token in text.lower().split():
+        if len(token) < NGRAM:
+            grams[token] = grams.get(token, 0) + 1
+            continue
+        for i in range(len(token) - NGRAM + 1):
+            g = token[i:i + NGRAM]
+            grams[g] = grams.get(g, 0) + 1
+    return grams
+
+
+def index_grams(text):
+    """색인할 {gram: 횟수}와 문서 길이 (2-gram 수)
+    한 글자 검색어를 posting 하나로 찾을 수 있도록 토큰의 글자 하나짜리 gram도 함께 넣는다
+    """
+    grams = ngrams(text)
+    length = sum(grams.values())
+    for token in text.lower().split():
+        if len(token) >= NGRAM:
+            for ch in token:
+                grams[ch] = grams.get(ch, 0) + 1
+    return grams, length
+
+
+def query_grams(query):
+    """검색어 -> gram 집합. 모든 gram이 들어 있는 문서만 결과가 된다"""
+    return set(ngrams(query))
+
+
+def bm25(tf, df, doc_count, doc_len, avg_len):
+    idf = math.log(1 + (doc_count - df + 0.5) / (df + 0.5))
+    norm = K1 * (1 - B + B * doc_len / (avg_len or 1))
+    return idf * tf * (K1 + 1) / (tf + norm)
+
+
+class NgramIndex:
+    """보고서 id를 문서로 하는 글자 n-gram 역색인
+
+    postings: gram -> {doc_id: tf}
+    docs: doc_id -> [checksum, length, owner, date_key, category, start, end]
+    stamp: 색인이 맞춰진 저장소 상태 (저장소가 정해서 색인과 함께 저장한다)
+    문서 메타데이터를 함께 보관하므로 owner/category/기간 필터와 결과 위치(owner, date_key)를
+    보고서를 불러오지 않고도 알 수 있다.
+    """
+
+    def __init__(self):
+        self.postings = {}
+        self.docs = {}
+        self.stamp = None
+        self._doc_grams = {}
+        self._total_len = 0
+
+    def __len__(self):
+        return len(self.docs)
+
+    def __contains__(self, doc_id):
+        return doc_id in self.docs
+
+    def doc_ids(self):
+        return list(self.docs)
+
+    def add(self, doc_id, text, owner, date_key, category, start, end):
+        if doc_id in self.docs:
+            self.remove(doc_id)
+        grams, length = index_grams(text)
+        for g, tf in grams.items():
+            self.postings.setdefault(g, {})[doc_id] = tf
+        self._doc_grams[doc_id] = list(grams)
+        self.docs[doc_id] = [text_checksum(text), length, owner, date_key, category, start, end]
+        self._total_len += length
+
+    def remove(self, doc_id):
+        meta = self.docs.pop(doc_id, None)
+        if meta is None:
+            return
+        self._total_len -= meta[1]
+        for g in self._doc_grams.pop(doc_id, ()):
+            posting = self.postings.get(g)
+            if posting is None:
+                continue
+            posting.pop(doc_id, None)
+            if not posting:
+                del self.postings[g]
+
+    def ensure(self, doc_id, text, owner, date_key, category, start, end):
+        """이미 같은 내용/위치로 색인되어 있으면 건너뛰고, 아니면 다시 색인 (다시 색인했으면 True)"""
+        meta = self.docs.get(doc_id)
+        if meta is not None and meta[0] == text_checksum(text) and meta[2:] == [owner, date_key, category, start, end]:
+            return False
+        self.add(doc_id, text, owner, date_key, category, start, end)
+        return True
+
+    def search(self, query, owner=None, category=None, lo=None, hi=None, limit=50):
+        """점수 순 [(score, doc_id, owner, date_key)]
+        lo/hi: date ordinal, 보고서 기간이 [lo, hi]와 겹치는 것만
+        """
+        grams = query_grams(query)
+        if not grams or not self.docs:
+            return []
+        postings = []
+        for g in grams:
+            posting = self.postings.get(g)
+            if not posting:
+                return []
+            postings.append(posting)
+        postings.sort(key=len)
+        candidates = set(postings[0])
+        for posting in postings[1:]:
+            candidates.intersection_update(posting)
+            if not candidates:
+                return []
+
+        doc_count = len(self.docs)
+        avg_len = self._total_len / doc_count
+        results = []
+        for doc_id in candidates:
+            meta = self.docs[doc_id]
+            _crc, length, d_owner, date_key, d_category, start, end = meta
+            if owner and d_owner != owner:
+                continue
+            if category and d_category != category:
+                continue
+            if lo is not None and (end is None or end < lo):
+                continue
+            if hi is not None and (start is None or start > hi):
+                continue
+            score = sum(bm25(p[doc_id], len(p), doc_count, length, avg_len) for p in postings)
+            results.append((score, doc_id, d_owner, date_key))
+        results.sort(key=lambda r: (-r[0], r[3], r[1]))
+        return results[:limit] if limit else results
+
+    # --- persistence ---
+    def save(self, path):
+        path = Path(path)
+        data = {"version": INDEX_VERSION, "ngram": NGRAM, "stamp": self.stamp,
+                "docs": self.docs, "postings": self.postings}
+        tmp = path.with_suffix(path.suffix + ".tmp")
+        try:
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+            os.replace(tmp, path)
+        except Exception as e:
+            print(f"검색 색인 저장 실패: {e}")
+
+    @classmethod
+    def load(cls, path):
+        """저장된 색인을 읽는다. 없거나 형식이 다르면 빈 색인"""
+        index = cls()
+        path = Path(path)
+        if not path.exists():
+            return index
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get("version") != INDEX_VERSION or data.get("ngram") != NGRAM:
+                return index
+            index.docs = data["docs"]
+            index.postings = data["postings"]
+            index.stamp = data.get("stamp")
+        except Exception as e:
+            print(f"검색 색인 로드 실패: {e}")
+            return cls()
+        for g, posting in index.postings.items():
+            for doc_id in posting:
+                index._doc_grams.setdefault(doc_id, []).append(g)
+        index._total_len = sum(meta[1] for meta in index.docs.values())
+        return index
@@ -0,0 +1,492 @@
+import json
+from collections import OrderedDict
+from datetime import date as _date
+from pathlib import Path
+
+from search_index import NgramIndex, report_text
+from report_store import (
+    ReportStore, Report, _synchronized, _to_ordinal, _legacy_report_id, _in_range, _from_ordinal,
+    load_config, data_dir, storage_config,
+)
+
+
+MISC_SHARD = "misc"
+
+
+def _shard_of(date_key):
+    """저장 키(YYYY-MM-DD) -> 샤드 이름 'YYYY-MM' (날짜가 아니면 'misc')"""
+    ordinal = _to_ordinal(date_key)
+    if ordinal is None:
+        return MISC_SHARD
+    d = _date.fromordinal(ordinal)
+    return f"{d.year:04d}-{d.month:02d}"
+
+
+def _months_between(lo, hi):
+    """ordinal 구간 [lo, hi]에 걸친 샤드 이름들"""
+    d = _date.fromordinal(max(lo, 1))
+    end = _date.fromordinal(max(hi, 1))
+    year, month = d.year, d.month
+    months = []
+    while (year, month) <= (end.year, end.month):
+        months.append(f"{year:04d}-{month:02d}")
+        month += 1
+        if month > 12:
+            year, month = year + 1, 1
+    return months
+
+
+class ShardedReportStore(ReportStore):
+    """월 단위 샤드(data/shards/2026/10.json)에 보고서를 나눠 보관하는 ReportStore
+
+    config.json의 storage.backend = "sharded"로 선택한다. 시작할 때는 manifest만 읽고,
+    조회하는 기간의 샤드만 불러온다. 불러온 샤드는 최근 사용 순(LRU)으로 최대
+    cache_months개까지 메모리에 두고, 저장할 때는 바뀐 샤드만 다시 쓴다.
+    manifest.json에는 가장 긴 보고서 기간과 샤드별 카테고리 사용 수를 기록해
+    샤드를 모두 읽지 않고도 조회 범위와 카테고리 목록을 알 수 있다.
+    """
+
+    DEFAULT_CACHE_MONTHS = 12
+
+    def __init__(self, shard_dir=None, json_file=None, config=None, cache_months=None, save_delay=None, **kwargs):
+        if config is None:
+            config = load_config() if shard_dir is None else {}
+        storage_cfg = storage_config(config)
+        base = data_dir(config)
+        self.shard_dir = Path(shard_dir or storage_cfg.get("shard_dir") or (base / "shards"))
+        self.cache_months = cache_months or storage_cfg.get("shard_cache_months", self.DEFAULT_CACHE_MONTHS)
+        self._loaded = OrderedDict()  # 불러온 샤드 (LRU 순서)
+        self._dirty = set()           # 저장해야 할 샤드
+        self._writing = set()         # 저장 스레드가 쓰는 중인 샤드 (내보내면 안 됨)
+        self._pinned = set()          # 현재 조회에 필요한 샤드
+        self._manifest = {"max_span": 0, "shards": {}}
+        self._loading = False
+        # journal 모드는 샤드 단위 저장과 함께 쓰지 않는다
+        super().__init__(json_file=json_file or (base / "data.json"), journal=False,
+                         save_delay=save_delay, config=config)
+
+    @property
+    def manifest_file(self):
+        return self.shard_dir / "manifest.json"
+
+    def _shard_path(self, shard):
+        if shard == MISC_SHARD:
+            return self.shard_dir / "misc.json"
+        year, month = shard.split("-")
+        return self.shard_dir / year / f"{month}.json"
+
+    # --- loading / migration ---
+    def load_from_json(self):
+        """manifest만 읽는다 (샤드는 필요할 때 불러옴). 샤드가 없고 data.json이 있으면 한 번 나눠 저장"""
+        with self._lock:
+            self._reports = {"personal": {}, "shared": {}}
+            self._loaded.clear()
+            self._dirty.clear()
+            self._rebuild_index()
+            if not self.manifest_file.exists() and self.json_file.exists():
+                self._migrate_from_json()
+            try:
+                if self.manifest_file.exists():
+                    with open(self.manifest_file, 'r', encoding='utf-8') as f:
+                        manifest = json.load(f)
+                    if isinstance(manifest, dict):
+                        self._manifest = {
+                            "max_span": manifest.get("max_span", 0),
+                            "shards": manifest.get("shards") or {},
+                        }
+            except Exception as e:
+                print(f"manifest 로드 실패: {e}")
+            self._load_search_index()
+
+    def _load_search_index(self):
+        """검색 색인은 모든 샤드를 대상으로 한다. 저장된 색인이 없을 때만 샤드를 하나씩 읽어 만든다"""
+        self.search_index_file = self.shard_dir / "search_index.json"
+        self._search = NgramIndex.load(self.search_index_file)
+        self._search_dirty = False
+        if len(self._search) or not self._manifest["shards"]:
+            return
+        for shard in self._manifest["shards"]:
+            try:
+                with open(self._shard_path(shard), 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+            except Exception:
+                continue
+            for ow, reports_map in data.items():
+                for date_key, items in reports_map.items():
+                    for i, item in enumerate(items):
+                        r = Report.from_dict(item, date_key, _legacy_report_id(ow, date_key, i))
+                        self._search.add(r.id, report_text(r), ow, date_key, r.category, r.start, r.end)
+        self._search_dirty = True
+
+    def _migrate_from_json(self):
+        # 읽기 전용: 가져오는 동안 원본 data.json/journal을 다시 쓰거나 압축하지 않는다
+        legacy = ReportStore(self.json_file, save_delay=0, config={}, read_only=True)
+        shards = {}
+        for ow, reports_map in legacy._reports.items():
+            for date_key, reports in reports_map.items():
+                for r in reports:
+                    # 시작일이 저장 키와 다른 달인 보고서는 시작일의 샤드로 옮겨 둔다
+                    key = self._start_key(date_key, r)
+                    shards.setdefault(_shard_of(key), {}).setdefault(ow, {}).setdefault(key, []).append(r)
+        manifest = {"max_span": 0, "shards": {}}
+        for shard, data in shards.items():
+            if not self._write_shard(shard, data):
+                return
+            manifest["shards"][shard] = self._count_categories(data)
+            for reports_map in data.values():
+                for reports in reports_map.values():
+                    for r in reports:
+                        if r.start is not None:
+                            manifest["max_span"] = max(manifest["max_span"], r.end - r.start)
+        # manifest를 마지막에 써야 중간에 중단되었을 때 다음 실행에서 다시 나눈다
+        self.shard_dir.mkdir(parents=True, exist_ok=True)
+        self._write_json_atomic(manifest, self.manifest_file)
+
+    def _ensure_shard(self, shard):
+        if shard in self._loaded:
+            self._loaded.move_to_end(shard)
+            return
+        path = self._shard_path(shard)
+        data = {}
+        if path.exists():
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+            except Exception as e:
+                print(f"샤드 로드 실패 ({shard}): {e}")
+                data = {}
+        self._loading = True
+        try:
+            for ow, reports_map in data.items():
+                if not isinstance(reports_map, dict):
+                    continue
+                owner_map = self._reports.setdefault(ow, {})
+                for date_key, items in reports_map.items():
+                    reports = [Report.from_dict(r, date_key, _legacy_report_id(ow, date_key, i))
+                               for i, r in enumerate(items)]
+                    owner_map[date_key] = reports
+                    for r in reports:
+                        self._attach(ow, date_key, r)
+        finally:
+            self._loading = False
+        self._loaded[shard] = None
+        self._evict(keep=shard)
+
+    def _ensure_range(self, lo, hi):
+        """ordinal 구간 [lo, hi]와 겹칠 수 있는 보고서가 들어 있는 샤드를 모두 불러옴"""
+        shards = _months_between(lo - self._manifest["max_span"], hi)
+        with self._lock:
+            self._pinned = set(shards)
+            try:
+                for shard in shards:
+                    self._ensure_shard(shard)
+                self._ensure_shard(MISC_SHARD)
+            finally:
+                self._pinned = set()
+
+    def _ensure_dates(self, *date_keys):
+        with self._lock:
+            self._pinned = {_shard_of(d) for d in date_keys}
+            try:
+                for shard in self._pinned:
+                    self._ensure_shard(shard)
+            finally:
+                self._pinned = set()
+
+    def _evict(self, keep=None):
+        """캐시 한도를 넘으면 오래 쓰지 않은 샤드부터 메모리에서 내린다 (저장 전 샤드는 제외)"""
+        busy = self._dirty | self._writing | self._pinned | {MISC_SHARD, keep}
+        for shard in list(self._loaded):
+            if len(self._loaded) <= self.cache_months:
+                break
+            if shard not in busy:
+                self._unload(shard)
+
+    def _unload(self, shard):
+        self._loading = True
+        try:
+            for owner_map in self._reports.values():
+                for date_key in [d for d in owner_map if _shard_of(d) == shard]:
+                    for r in owner_map.pop(date_key):
+                        self._detach(r)
+        finally:
+            self._loading = False
+        self._loaded.pop(shard, None)
+
+    # --- index hooks: 변경된 샤드 기록 ---
+    def _attach(self, owner, date, report):
+        super()._attach(owner, date, report)
+        if report.start is not None and report.end - report.start > self._manifest["max_span"]:
+            self._manifest["max_span"] = report.end - report.start
+        if not self._loading:
+            self._dirty.add(_shard_of(date))
+
+    def _detach(self, report):
+        entry = self._by_id.get(report.id)
+        super()._detach(report)
+        if entry is not None and not self._loading:
+            self._dirty.add(_shard_of(entry[1]))
+
+    # 샤드를 불러오거나 내릴 때는 검색 색인을 지우지 않고 (다른 샤드 문서도 들어 있으므로)
+    # 불러온 내용이 색인과 다를 때만 다시 색인한다
+    def _search_attach(self, owner, date, report):
+        if self._loading:
+            self._search_dirty |= self._search.ensure(report.id, report_text(report), owner, date,
+                                                      report.category, report.start, report.end)
+            return
+        super()._search_attach(owner, date, report)
+
+    def _search_detach(self, report):
+        if self._loading:
+            return
+        super()._search_detach(report)
+
+    def _resolve_search_hit(self, report_id, owner, orig_date):
+        self._ensure_dates(orig_date)
+        return super()._resolve_search_hit(report_id, owner, orig_date)
+
+    # --- queries ---
+    def list_reports(self, date):
+        return self.list_reports_for(date, owner="personal")
+
+    @_synchronized
+    def list_reports_for(self, date, owner="personal"):
+        self._ensure_dates(date)
+        return super().list_reports_for(date, owner)
+
+    @_synchronized
+    def find_reports_for_date(self, date_str, owner=None):
+        target = _to_ordinal(date_str)
+        if target is not None:
+            self._ensure_range(target, target)
+        return super().find_reports_for_date(date_str, owner)
+
+    @_synchronized
+    def find_reports_in_range(self, start, end, owner=None):
+        lo = _to_ordinal(start)
+        hi = _to_ordinal(end)
+        if lo is not None and hi is not None and lo <= hi:
+            self._ensure_range(lo, hi)
+        return super().find_reports_in_range(start, end, owner)
+
+    def _week_summary(self, monday):
+        # 그 주와 겹치는 보고서가 모두 올라와 있어야 집계가 맞다
+        with self._lock:
+            self._ensure_range(monday, monday + 6)
+            return super()._week_summary(monday)
+
+    @_synchronized
+    def get_report(self, date, index, owner="personal"):
+        self._ensure_dates(date)
+        return super().get_report(date, index, owner)
+
+    @_synchronized
+    def has_reports(self, date, owner="personal"):
+        self._ensure_dates(date)
+        return super().has_reports(date, owner)
+
+    def _merged_category_counts(self):
+        counts = dict(self._category_counts)
+        for shard, shard_counts in self._manifest["shards"].items():
+            if shard in self._loaded:
+                continue
+            for category, n in shard_counts.items():
+                counts[category] = counts.get(category, 0) + n
+        return counts
+
+    def list_categories(self, by_frequency=False):
+        counts = self._merged_category_counts()
+        if by_frequency:
+            return sorted(counts, key=lambda c: (-counts[c], c))
+        return sorted(counts)
+
+    def category_counts(self):
+        return self._merged_category_counts()
+
+    # --- mutators: 대상 날짜의 샤드를 먼저 불러온다 ---
+    @staticmethod
+    def _start_key(date_key, report):
+        """report를 둘 저장 키. 시작일이 저장 키와 다른 달이면 시작일을 저장 키로 쓴다
+        (기간 조회는 시작일로 샤드를 고르므로 보고서는 시작일의 샤드에 있어야 찾을 수 있다)
+        """
+        if report is None:
+            return date_key
+        start = Report.from_dict(report, date_key).start
+        if start is None:
+            return date_key
+        start_key = _from_ordinal(start)
+        return date_key if _shard_of(start_key) == _shard_of(date_key) else start_key
+
+    @_synchronized
+    def add_report(self, date, report=None, owner="personal"):
+        """시작일이 date와 다른 달이면 시작일을 저장 키로 추가한다 (반환하는 위치도 그 목록 기준)"""
+        date = self._start_key(date, report)
+        self._ensure_dates(date)
+        return super().add_report(date, report, owner)
+
+    @_synchronized
+    def update_report(self, date, index, report, owner="personal"):
+        self._ensure_dates(date)
+        return super().update_report(date, index, report, owner)
+
+    @_synchronized
+    def move_report(self, old_date, new_date, index, report, owner="personal", new_owner=None):
+        self._ensure_dates(old_date, new_date)
+        return super().move_report(old_date, new_date, index, report, owner, new_owner)
+
+    @_synchronized
+    def delete_report(self, date, index, owner="personal"):
+        self._ensure_dates(date)
+        return super().delete_report(date, index, owner)
+
+    # --- id 기반 접근: 검색 색인에 모든 보고서의 저장 키가 있으므로 그 샤드를 불러온다 ---
+    def _id_dates(self, report_id):
+        # 이미 올라와 있어도 저장 키를 돌려준다 (다른 샤드를 불러올 때 내려가지 않도록 고정)
+        entry = self._by_id.get(report_id)
+        if entry is not None:
+            return (entry[1],)
+        meta = self._search.docs.get(report_id)
+        return (meta[3],) if meta is not None else ()
+
+    @_synchronized
+    def get_by_id(self, report_id):
+        self._ensure_dates(*self._id_dates(report_id))
+        return super().get_by_id(report_id)
+
+    @_synchronized
+    def locate_by_id(self, report_id):
+        self._ensure_dates(*self._id_dates(report_id))
+        return super().locate_by_id(report_id)
+
+    @_synchronized
+    def update_by_id(self, report_id, report):
+        self._ensure_dates(*self._id_dates(report_id))
+        entry = self._by_id.get(report_id)
+        if entry is not None and self._start_key(entry[1], report) != entry[1]:
+            # 시작일이 다른 달로 바뀌면 그 달의 샤드로 옮겨 저장한다 (되돌리기에서는 '수정' 한 단계)
+            with self._undo_group("수정"):
+                return self.move_by_id(report_id, entry[1], report)
+        return super().update_by_id(report_id, report)
+
+    @_synchronized
+    def move_by_id(self, report_id, new_date, report=None, new_owner=None):
+        self._ensure_dates(*self._id_dates(report_id))
+        entry = self._by_id.get(report_id)
+        new_date = self._start_key(new_date, report if report is not None or entry is None else entry[2])
+        self._ensure_dates(new_date, *self._id_dates(report_id))
+        return super().move_by_id(report_id, new_date, report, new_owner)
+
+    def _override_occurrence(self, report_id, report, new_date=None, new_owner=None):
+        found = self._occurrence(report_id)
+        if found is not None and new_date is not None:
+            new_date = self._start_key(new_date, report if report is not None else found[0].occurrence(found[1]))
+        return super()._override_occurrence(report_id, report, new_date, new_owner)
+
+    @_synchronized
+    def delete_by_id(self, report_id):
+        self._ensure_dates(*self._id_dates(report_id))
+        return super().delete_by_id(report_id)
+
+    def iter_reports(self, owner=None, start=None, end=None, rules=True):
+        """샤드를 하나씩 불러가며 반환 (다 읽은 샤드는 LRU에 따라 메모리에서 내려간다)
+        rules: 반복 규칙 항목도 저장된 보고서 다음에 반환
+        """
+        lo = _to_ordinal(start) if start else None
+        hi = _to_ordinal(end) if end else None
+        with self._lock:
+            shards = set(self._manifest["shards"]) | set(self._loaded)
+        if lo is not None or hi is not None:
+            # 날짜를 해석할 수 없는 보고서(misc)는 기간 조건에 걸리지 않는다
+            first = _shard_of(_from_ordinal(max(1, (lo or 1) - self._manifest["max_span"])))
+            last = _shard_of(_from_ordinal(hi)) if hi is not None else "9999-12"
+            shards = {s for s in shards if s != MISC_SHARD and first <= s <= last}
+        owners = [owner] if owner else ["personal", "shared"]
+        for shard in sorted(shards):
+            with self._lock:
+                self._ensure_shard(shard)
+                batch = []
+                for ow in owners:
+                    reports_map = self._reports.get(ow, {})
+                    for d in sorted(k for k in reports_map if _shard_of(k) == shard):
+                        batch.extend((ow, d, r) for r in reports_map[d] if _in_range(r, lo, hi))
+            yield from batch
+        if rules:
+            yield from self._iter_rule_occurrences(owner, start, end)
+
+    def delete_category(self, category):
+        """manifest에서 그 카테고리를 쓰는 샤드만 골라 하나씩 고친다.
+        불러와 있지 않던 샤드는 고친 뒤 바로 기록하고 메모리에서 내린다.
+        """
+        with self._io_lock:
+            with self._lock:
+                changed = super().delete_category(category)
+                if not category:
+                    return changed
+                shards = [shard for shard, counts in self._manifest["shards"].items()
+                          if counts.get(category) and shard not in self._loaded]
+                written = False
+                for shard in shards:
+                    self._ensure_shard(shard)
+                    changed += super().delete_category(category)
+                    written |= self._write_back(shard)
+                if written:
+                    self._write_json_atomic({"max_span": self._manifest["max_span"],
+                                             "shards": dict(self._manifest["shards"])}, self.manifest_file)
+                return changed
+
+    # --- persistence: 바뀐 샤드와 manifest만 기록 ---
+    def _write_out(self):
+        with self._io_lock:
+            with self._lock:
+                dirty = sorted(self._dirty)
+                self._dirty = set()
+                self._writing = set(dirty)
+                self._pending_ops = []
+                snapshots = {shard: self._shard_snapshot(shard) for shard in dirty}
+                max_span = self._manifest["max_span"]
+            try:
+                failed = [shard for shard, data in snapshots.items() if not self._write_shard(shard, data)]
+                with self._lock:
+                    self._dirty.update(failed)
+                    for shard, data in snapshots.items():
+                        if shard not in failed:
+                            self._manifest["shards"][shard] = self._count_categories(data)
+                    manifest = {"max_span": max_span, "shards": dict(self._manifest["shards"])}
+                if dirty:
+                    self._write_json_atomic(manifest, self.manifest_file)
+            finally:
+                with self._lock:
+                    self._writing = set()
+
+    def _write_back(self, shard):
+        """샤드 하나를 바로 기록하고 메모리에서 내린다 (실패하면 바뀐 샤드로 남겨 둔다)"""
+        data = self._shard_snapshot(shard)
+        if not self._write_shard(shard, data):
+            return False
+        self._manifest["shards"][shard] = self._count_categories(data)
+        self._dirty.discard(shard)
+        self._unload(shard)
+        return True
+
+    def _shard_snapshot(self, shard):
+        snapshot = {}
+        for ow, owner_map in self._reports.items():
+            dates = {d: list(reports) for d, reports in owner_map.items() if _shard_of(d) == shard and reports}
+            if dates:
+                snapshot[ow] = dates
+        return snapshot
+
+    def _write_shard(self, shard, snapshot):
+        path = self._shard_path(shard)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        return self._write_json_atomic(self._snapshot_to_json(snapshot), path)
+
+    @staticmethod
+    def _count_categories(snapshot):
+        counts = {}
+        for reports_map in snapshot.values():
+            for reports in reports_map.values():
+                for r in reports:
+                    if r.category:
+                        counts[r.category] = counts.get(r.category, 0) + 1
+        return counts
@@ -0,0 +1,876 @@
+import json
+import mmap
+import os
+import struct
+import threading
+import uuid
+from datetime import date as _date
+from pathlib import Path
+
+from search_index import INDEX_VERSION, NgramIndex, report_text
+from report_store import (
+    ReportStore, Report, _synchronized, _to_ordinal, _in_range,
+    load_config, data_dir, storage_config,
+)
+
+
+MAGIC = b"WRSNAP01"
+
+# 머리글: magic, meta 위치, meta 길이
+_HEADER = struct.Struct("<8sQI4x")
+# 레코드: owner 번호, category 번호, start, end (ordinal, 날짜가 아니면 0), 보고서 JSON 위치, 길이
+_RECORD = struct.Struct("<B3xIiiQI")
+# 저장 키: owner 번호, 키 문자열 위치, 길이, 첫 레코드 번호, 레코드 수
+_KEY = struct.Struct("<B3xQIII")
+# 시작일 순 표: 레코드 번호
+_POS = struct.Struct("<I")
+
+_MAX_ORDINAL = _date.max.toordinal()
+
+
+class SnapshotFile:
+    """mmap으로 연 바이너리 스냅샷 (읽기 전용)
+
+    파일 구조: 머리글 | 문자열 힙 (보고서 JSON, 저장 키) | 레코드 표 | 저장 키 표 | 시작일 순 표 | meta JSON
+    - 레코드 표: (owner, 저장 키, 목록 순서)로 정렬된 고정 폭 항목
+    - 저장 키 표: (owner, 저장 키)마다 첫 레코드 번호와 개수 (같은 정렬)
+    - 시작일 순 표: owner별로 시작일 순으로 정렬한 레코드 번호 (날짜가 있는 보고서만)
+    열 때는 머리글과 meta만 읽는다. 보고서 JSON은 꺼낼 때만 해석하고,
+    날짜 범위 조회는 시작일 순 표에서 bisect로 바로 한다.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self._file = open(self.path, 'rb')
+        self._mm = None
+        try:
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, meta_offset, meta_len = _HEADER.unpack_from(self._mm, 0)
+            if magic != MAGIC:
+                raise ValueError("스냅샷 파일 형식이 아닙니다")
+            self.meta = json.loads(self._mm[meta_offset:meta_offset + meta_len].decode("utf-8"))
+        except Exception:
+            self.close()
+            raise
+        self.owners = self.meta["owners"]
+        self.categories = self.meta["categories"]
+        self.max_span = self.meta["max_span"]
+        # owner -> [저장 키 표 시작, 끝, 시작일 순 표 시작, 끝]
+        self._ranges = self.meta["owner_ranges"]
+        self._records_at = self.meta["records"]
+        self._keys_at = self.meta["keys"]
+        self._by_start_at = self.meta["by_start"]
+
+    def __len__(self):
+        return self.meta["count"]
+
+    def close(self):
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    # --- 레코드 ---
+    def record(self, i):
+        """i번째 레코드 -> (owner 번호, category 번호, start, end, offset, length)"""
+        return _RECORD.unpack_from(self._mm, self._records_at + i * _RECORD.size)
+
+    def raw(self, i):
+        """해석하지 않은 보고서: (JSON bytes, category, start, end)"""
+        _owner, category, start, end, offset, length = self.record(i)
+        return self._mm[offset:offset + length], self.categories[category], start, end
+
+    def report(self, i, date_key):
+        _owner, _category, _start, _end, offset, length = self.record(i)
+        return Report.from_dict(json.loads(self._mm[offset:offset + length].decode("utf-8")), date_key)
+
+    def category_of(self, i):
+        return self.categories[self.record(i)[1]]
+
+    # --- 저장 키 ---
+    def key(self, k):
+        """k번째 저장 키 -> (owner, date_key, 첫 레코드 번호, 레코드 수)"""
+        owner, offset, length, first, count = _KEY.unpack_from(self._mm, self._keys_at + k * _KEY.size)
+        return self.owners[owner], self._mm[offset:offset + length].decode("utf-8"), first, count
+
+    def _key_text(self, k):
+        _owner, offset, length, _first, _count = _KEY.unpack_from(self._mm, self._keys_at + k * _KEY.size)
+        return self._mm[offset:offset + length].decode("utf-8")
+
+    def _key_first(self, k):
+        return _KEY.unpack_from(self._mm, self._keys_at + k * _KEY.size)[3]
+
+    def keys_for(self, owner):
+        """owner의 저장 키 번호 범위 (키 순)"""
+        r = self._ranges.get(owner)
+        return range(r[0], r[1]) if r else range(0)
+
+    def find_key(self, owner, date_key):
+        """owner의 date_key 저장 키 번호, 없으면 None"""
+        r = self._ranges.get(owner)
+        if r is None:
+            return None
+        lo, hi = r[0], r[1]
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._key_text(mid) < date_key:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < r[1] and self._key_text(lo) == date_key:
+            return lo
+        return None
+
+    def key_of(self, i):
+        """i번째 레코드가 속한 저장 키 번호"""
+        lo, hi = 0, self.meta["key_count"]
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._key_first(mid) <= i:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo - 1
+
+    def keys_with_category(self, category):
+        """category를 쓰는 보고서가 있는 저장 키 문자열 집합 (레코드 표만 훑는다)"""
+        if category not in self.categories:
+            return set()
+        target = self.categories.index(category)
+        keys = set()
+        for i in range(len(self)):
+            if self.record(i)[1] == target:
+                keys.add(self._key_text(self.key_of(i)))
+        return keys
+
+    # --- 날짜 범위 ---
+    def _start_at(self, j):
+        i = _POS.unpack_from(self._mm, self._by_start_at + j * _POS.size)[0]
+        return i, self.record(i)
+
+    def _bisect_start(self, lo, hi, value):
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._start_at(mid)[1][2] < value:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def overlapping(self, owner, lo, hi):
+        """owner 보고서 중 기간이 [lo, hi]와 겹치는 레코드 번호 (시작일 순)"""
+        r = self._ranges.get(owner)
+        if r is None:
+            return []
+        left = self._bisect_start(r[2], r[3], lo - self.max_span)
+        right = self._bisect_start(left, r[3], hi + 1)
+        found = []
+        for j in range(left, right):
+            i, rec = self._start_at(j)
+            if rec[3] >= lo:
+                found.append(i)
+        return found
+
+
+def write_snapshot(path, groups, source=None):
+    """groups: (owner, date_key, items)를 owner, 저장 키 순으로. items의 항목은 Report 또는
+    source(SnapshotFile)의 레코드 번호 (해석하지 않고 그대로 옮김). path에 쓰고 fsync까지 한다.
+    """
+    owners = []
+    owner_index = {}
+    categories = [""]
+    category_index = {"": 0}
+    category_counts = {}
+    records = []
+    keys = []
+    max_span = 0
+    with open(path, 'wb') as f:
+        f.write(b"\0" * _HEADER.size)
+        offset = _HEADER.size
+        for owner, date_key, items in groups:
+            if not items:
+                continue
+            if owner not in owner_index:
+                owner_index[owner] = len(owners)
+                owners.append(owner)
+            data = date_key.encode("utf-8")
+            f.write(data)
+            keys.append((owner_index[owner], offset, len(data), len(records), len(items)))
+            offset += len(data)
+            for item in items:
+                if isinstance(item, Report):
+                    payload = json.dumps(item.to_dict(), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+                    category, start, end = item.category, item.start or 0, item.end or 0
+                else:
+                    payload, category, start, end = source.raw(item)
+                if category not in category_index:
+                    category_index[category] = len(categories)
+                    categories.append(category)
+                if category:
+                    category_counts[category] = category_counts.get(category, 0) + 1
+                if start:
+                    max_span = max(max_span, end - start)
+                f.write(payload)
+                records.append((owner_index[owner], category_index[category], start, end, offset, len(payload)))
+                offset += len(payload)
+
+        records_at = offset
+        f.write(b"".join(_RECORD.pack(*r) for r in records))
+        keys_at = records_at + len(records) * _RECORD.size
+        f.write(b"".join(_KEY.pack(*k) for k in keys))
+        by_start_at = keys_at + len(keys) * _KEY.size
+        by_start = sorted((r[0], r[2], i) for i, r in enumerate(records) if r[2])
+        f.write(b"".join(_POS.pack(i) for _o, _s, i in by_start))
+        meta_at = by_start_at + len(by_start) * _POS.size
+
+        ranges = {}
+        for n, owner in enumerate(owners):
+            key_lo = next(k for k, entry in enumerate(keys) if entry[0] == n)
+            key_hi = key_lo + sum(1 for entry in keys if entry[0] == n)
+            start_lo = sum(1 for entry in by_start if entry[0] < n)
+            start_hi = start_lo + sum(1 for entry in by_start if entry[0] == n)
+            ranges[owner] = [key_lo, key_hi, start_lo, start_hi]
+        meta = {
+            "version": 1,
+            "generation": uuid.uuid4().hex,
+            "count": len(records),
+            "key_count": len(keys),
+            "max_span": max_span,
+            "owners": owners,
+            "owner_ranges": ranges,
+            "categories": categories,
+            "category_counts": category_counts,
+            "records": records_at,
+            "keys": keys_at,
+            "by_start": by_start_at,
+        }
+        meta_data = json.dumps(meta, ensure_ascii=False).encode("utf-8")
+        f.write(meta_data)
+        f.seek(0)
+        f.write(_HEADER.pack(MAGIC, meta_at, len(meta_data)))
+        f.flush()
+        os.fsync(f.fileno())
+    return meta
+
+
+def _count_down(counts, category):
+    if not category:
+        return
+    n = counts.get(category, 0)
+    if n <= 1:
+        counts.pop(category, None)
+    else:
+        counts[category] = n - 1
+
+
+class SnapshotReportStore(ReportStore):
+    """바이너리 스냅샷(data.snap)을 mmap으로 열어 쓰는 ReportStore
+
+    config.json의 storage.backend = "snapshot"으로 선택한다. 시작할 때는 스냅샷의 meta만 읽으므로
+    보고서가 아무리 많아도 바로 열리고, 조회한 날짜(저장 키)의 보고서만 Report로 만들어 메모리에 올린다.
+    한 번 올린 저장 키는 메모리 쪽이 기준이며, 저장할 때는 메모리의 보고서와 스냅샷에 그대로 남은
+    보고서(해석하지 않고 바이트 복사)를 합쳐 새 스냅샷을 쓴다.
+    평소 저장은 바뀐 저장 키의 보고서 목록만 data.snap.delta 끝에 덧붙이고 (빈 목록이면 삭제 표시),
+    변경분이 DELTA_COMPACT_EVERY 건을 넘으면 새 스냅샷으로 합친다. 변경분은 열 때 메모리에 올린다.
+    검색 색인은 처음 검색하거나 수정할 때 읽는다. 색인이 지금 스냅샷과 함께 저장된 것이 아니면
+    열 때 백그라운드 스레드에서 스냅샷을 색인해 둔다.
+    """
+
+    DELTA_COMPACT_EVERY = 500
+
+    def __init__(self, snapshot_file=None, json_file=None, config=None, save_delay=None, **kwargs):
+        if config is None:
+            config = load_config() if snapshot_file is None else {}
+        storage_cfg = storage_config(config)
+        base = data_dir(config)
+        self.snapshot_file = Path(snapshot_file or storage_cfg.get("snapshot_file") or (base / "data.snap"))
+        self._snap = None
+        self._materialized = set()  # 메모리에 올린 저장 키 (모든 owner)
+        self._covered = set()       # 이미 올린 조회 구간 (lo, hi)
+        self._base_counts = {}      # 아직 올리지 않은 보고서의 카테고리 사용 수
+        self._changed_keys = set()  # 마지막 저장 이후 바뀐 저장 키
+        self._delta_count = 0       # data.snap.delta에 쌓인 지금 스냅샷의 변경분 수
+        self._loading = False
+        self._search_builder = None
+        self._search_stop = None
+        self._built_search = None
+        # journal 모드는 스냅샷 저장과 함께 쓰지 않는다
+        kwargs.pop("journal", None)
+        super().__init__(json_file=json_file or (base / "data.json"), journal=False,
+                         save_delay=save_delay, config=config, **kwargs)
+
+    @property
+    def search_generation_file(self):
+        return self.search_index_file.with_suffix(".gen")
+
+    @property
+    def delta_file(self):
+        return self.snapshot_file.with_suffix(".snap.delta")
+
+    # --- loading / migration ---
+    def load_from_json(self):
+        """스냅샷의 meta만 읽는다. 스냅샷이 없고 data.json이 있으면 한 번 변환해 저장"""
+        with self._lock:
+            self._stop_search_builder()
+            self._reports = {"personal": {}, "shared": {}}
+            self._materialized = set()
+            self._covered = set()
+            self._changed_keys = set()
+            self._rebuild_index()
+            self._close_snapshot()
+            if not self.snapshot_file.exists() and self.json_file.exists() and not self.read_only:
+                self._migrate_from_json()
+            if self.snapshot_file.exists():
+                try:
+                    self._snap = SnapshotFile(self.snapshot_file)
+                except Exception as e:
+                    print(f"스냅샷 로드 실패: {e}")
+            self._base_counts = dict(self._snap.meta["category_counts"]) if self._snap is not None else {}
+            self._load_delta()
+            self.search_index_file = self.snapshot_file.with_name(self.snapshot_file.stem + "_search_index.json")
+            # 검색 색인은 _ensure_search에서 처음 필요할 때 읽는다
+            self._search = NgramIndex() if self.read_only else None
+            self._search_dirty = False
+            if (not self.read_only and self._snap is not None
+                    and self._saved_search_generation() != self._snap.meta["generation"]):
+                self._start_search_builder()
+
+    def _load_delta(self):
+        """data.snap.delta에서 지금 스냅샷 이후에 바뀐 저장 키를 읽어 메모리에 올린다
+        다른 스냅샷(압축 전)의 변경분은 건너뛰고, 기록 도중 중단된 마지막 줄은 잘라낸다.
+        """
+        self._delta_count = 0
+        if self._snap is None or not self.delta_file.exists():
+            return
+        generation = self._snap.meta["generation"]
+        changed = {}
+        good_size = 0
+        torn = False
+        try:
+            with open(self.delta_file, 'rb') as f:
+                for raw in f:
+                    try:
+                        entry = json.loads(raw.decode('utf-8'))
+                        if entry["generation"] == generation:
+                            changed[(entry["owner"], entry["key"])] = entry["reports"]
+                            self._delta_count += 1
+                    except Exception:
+                        torn = True
+                        break
+                    good_size += len(raw)
+        except Exception as e:
+            print(f"스냅샷 변경분 로드 실패: {e}")
+            return
+        if torn and not self.read_only:
+            try:
+                with open(self.delta_file, 'r+b') as f:
+                    f.truncate(good_size)
+            except Exception as e:
+                print(f"스냅샷 변경분 복구 실패: {e}")
+        for date_key in sorted({key for _owner, key in changed}):
+            self._materialize(date_key, changed)
+
+    def _migrate_from_json(self):
+        legacy = ReportStore(self.json_file, save_delay=0, config={}, read_only=True)
+        groups = [(ow, d, reports) for ow in sorted(legacy._reports)
+                  for d, reports in sorted(legacy._reports[ow].items())]
+        tmp = self.snapshot_file.with_suffix(".snap.tmp")
+        try:
+            self.snapshot_file.parent.mkdir(parents=True, exist_ok=True)
+            write_snapshot(tmp, groups)
+            os.replace(tmp, self.snapshot_file)
+        except Exception as e:
+            print(f"스냅샷 변환 실패: {e}")
+
+    def _close_snapshot(self):
+        if self._snap is not None:
+            self._snap.close()
+            self._snap = None
+
+    def _ensure_dates(self, *date_keys):
+        with self._lock:
+            for date_key in date_keys:
+                if date_key not in self._materialized:
+                    self._materialize(date_key)
+
+    def _materialize(self, date_key, changed=None):
+        """스냅샷에서 date_key의 보고서를 (모든 owner) 해석해 메모리에 올린다
+        changed: {(owner, date_key): 보고서 dict 목록} 변경분이 있으면 스냅샷 대신 그 목록을 쓴다
+        """
+        self._materialized.add(date_key)
+        snap = self._snap
+        if snap is None:
+            return
+        owners = set(snap.owners)
+        if changed:
+            owners.update(ow for ow, key in changed if key == date_key)
+        self._loading = True
+        try:
+            for ow in sorted(owners):
+                k = snap.find_key(ow, date_key)
+                if k is not None:
+                    _owner, _key, first, count = snap.key(k)
+                    for i in range(first, first + count):
+                        _count_down(self._base_counts, snap.category_of(i))
+                if changed and (ow, date_key) in changed:
+                    reports = [Report.from_dict(d, date_key) for d in changed[(ow, date_key)]]
+                elif k is not None:
+                    reports = [snap.report(i, date_key) for i in range(first, first + count)]
+                else:
+                    continue
+                if not reports:
+                    continue
+                self._reports.setdefault(ow, {})[date_key] = reports
+                for r in reports:
+                    self._attach(ow, date_key, r)
+        finally:
+            self._loading = False
+
+    def _ensure_range(self, lo, hi):
+        """ordinal 구간 [lo, hi]와 겹치는 보고서가 있는 저장 키를 모두 올린다 (스냅샷 색인만 조회)"""
+        with self._lock:
+            if self._snap is None or (lo, hi) in self._covered:
+                return
+            snap = self._snap
+            keys = set()
+            for ow in snap.owners:
+                for i in snap.overlapping(ow, lo, hi):
+                    keys.add(snap.key(snap.key_of(i))[1])
+            self._ensure_dates(*keys)
+            # 스냅샷에만 있는 보고서는 저장 전까지 바뀌지 않으므로 한 번 올린 구간은 다시 볼 필요가 없다
+            self._covered.add((lo, hi))
+
+    # --- index hooks: 바뀐 저장 키 기록 ---
+    def _attach(self, owner, date, report):
+        super()._attach(owner, date, report)
+        if not self._loading:
+            self._changed_keys.add(date)
+
+    def _detach(self, report):
+        entry = self._by_id.get(report.id)
+        super()._detach(report)
+        if not self._loading and entry is not None:
+            self._changed_keys.add(entry[1])
+
+    # --- full-text search index: 처음 필요할 때 읽는다 ---
+    def _load_search_index(self):
+        pass
+
+    def _ensure_search(self):
+        if self._search is not None:
+            return
+        with self._lock:
+            if self._search is not None:
+                return
+            index = self._take_built_search()
+            if index is not None:
+                changed = True
+            else:
+                index = NgramIndex.load(self.search_index_file)
+                generation = self._search_stamp()
+                if generation is None or index.stamp != generation:
+                    # 색인이 지금 스냅샷과 함께 저장된 것이 아니면 전체를 맞춘다
+                    self._search = index
+                    self._search_dirty = self._sync_search(index, None)
+                    return
+                changed = False
+            # 스냅샷 쪽은 색인과 같으므로 메모리에 올린 저장 키만 맞춘다
+            changed |= self._sync_search(index, self._materialized)
+            self._search = index
+            self._search_dirty = changed
+
+    def _sync_search(self, index, keys):
+        """keys(None이면 전체) 저장 키의 보고서를 index에 맞춘다 (고쳤으면 True)"""
+        live = set()
+        changed = False
+        if keys is None:
+            items = self.iter_reports(rules=False)
+        else:
+            items = ((ow, d, r) for ow, reports_map in self._reports.items()
+                     for d, reports in reports_map.items() if d in keys for r in reports)
+        for ow, orig_date, r in items:
+            live.add(r.id)
+            changed |= index.ensure(r.id, report_text(r), ow, orig_date, r.category, r.start, r.end)
+        for doc_id in index.doc_ids():
+            if doc_id not in live and (keys is None or index.docs[doc_id][3] in keys):
+                index.remove(doc_id)
+                changed = True
+        return changed
+
+    # --- 색인이 스냅샷과 맞지 않을 때: 따로 연 스냅샷을 백그라운드에서 색인 ---
+    def _start_search_builder(self):
+        self._search_stop = threading.Event()
+        self._search_builder = threading.Thread(
+            target=self._build_search, args=(self.snapshot_file, self._search_stop),
+            name="SnapshotSearchIndex", daemon=True)
+        self._search_builder.start()
+
+    def _build_search(self, path, stop):
+        """스냅샷의 모든 레코드를 색인해 _built_search에 둔다 (store 잠금을 쓰지 않는다)"""
+        try:
+            snap = SnapshotFile(path)
+        except Exception as e:
+            print(f"검색 색인 생성 실패: {e}")
+            return
+        try:
+            index = NgramIndex()
+            for k in range(snap.meta["key_count"]):
+                if stop.is_set():
+                    return
+                ow, date_key, first, count = snap.key(k)
+                for i in range(first, first + count):
+                    r = snap.report(i, date_key)
+                    index.add(r.id, report_text(r), ow, date_key, r.category, r.start, r.end)
+            self._built_search = index
+        except Exception as e:
+            print(f"검색 색인 생성 실패: {e}")
+        finally:
+            snap.close()
+
+    def _take_built_search(self):
+        """백그라운드 색인이 끝나기를 기다려 결과를 넘겨받는다 (없거나 실패했으면 None)"""
+        builder = self._search_builder
+        if builder is None:
+            return None
+        builder.join()
+        index = self._built_search
+        self._search_builder = self._search_stop = self._built_search = None
+        return index
+
+    def _stop_search_builder(self):
+        if self._search_builder is not None:
+            self._search_stop.set()
+            self._take_built_search()
+
+    def _search_stamp(self):
+        # 색인은 스냅샷 세대와 함께 저장한다 (변경분은 열 때 메모리에 올라오므로 따로 맞춘다)
+        return self._snap.meta.get("generation") if self._snap is not None else None
+
+    def _saved_search_generation(self):
+        """색인 옆 .gen 파일의 스냅샷 세대: 색인 전체를 읽지 않고 열 때 바로 비교한다"""
+        try:
+            with open(self.search_generation_file, 'r', encoding='utf-8') as f:
+                saved = json.load(f)
+            return saved.get("generation") if saved.get("version") == INDEX_VERSION else None
+        except Exception:
+            return None
+
+    def _save_search_index(self):
+        if self._search is None or self.read_only:
+            return
+        super()._save_search_index()
+        generation = self._search_stamp()
+        if generation is not None and generation != self._saved_search_generation():
+            try:
+                with open(self.search_generation_file, 'w', encoding='utf-8') as f:
+                    json.dump({"generation": generation, "version": INDEX_VERSION}, f)
+            except Exception as e:
+                print(f"검색 색인 저장 실패: {e}")
+
+    def _search_attach(self, owner, date, report):
+        # 스냅샷에서 올린 보고서는 저장된 색인에 이미 들어 있다
+        if self._loading or self._bulk_loading or self.read_only:
+            return
+        self._ensure_search()
+        super()._search_attach(owner, date, report)
+
+    def _search_detach(self, report):
+        if self._loading or self._bulk_loading or self.read_only:
+            return
+        self._ensure_search()
+        super()._search_detach(report)
+
+    @_synchronized
+    def search(self, query, owner=None, category=None, start=None, end=None, limit=50):
+        self._ensure_search()
+        return super().search(query, owner, category, start, end, limit)
+
+    def _resolve_search_hit(self, report_id, owner, orig_date):
+        self._ensure_dates(orig_date)
+        return super()._resolve_search_hit(report_id, owner, orig_date)
+
+    # --- queries ---
+    def list_reports(self, date):
+        return self.list_reports_for(date, owner="personal")
+
+    @_synchronized
+    def list_reports_for(self, date, owner="personal"):
+        self._ensure_dates(date)
+        return super().list_reports_for(date, owner)
+
+    @_synchronized
+    def find_reports_for_date(self, date_str, owner=None):
+        target = _to_ordinal(date_str)
+        if target is not None:
+            self._ensure_range(target, target)
+        return super().find_reports_for_date(date_str, owner)
+
+    @_synchronized
+    def find_reports_in_range(self, start, end, owner=None):
+        lo = _to_ordinal(start)
+        hi = _to_ordinal(end)
+        if lo is not None and hi is not None and lo <= hi:
+            self._ensure_range(lo, hi)
+        return super().find_reports_in_range(start, end, owner)
+
+    def _week_summary(self, monday):
+        with self._lock:
+            self._ensure_range(monday, monday + 6)
+            return super()._week_summary(monday)
+
+    @_synchronized
+    def get_report(self, date, index, owner="personal"):
+        self._ensure_dates(date)
+        return super().get_report(date, index, owner)
+
+    def has_reports(self, date, owner="personal"):
+        # 올리지 않은 저장 키는 저장 키 표만 보고 답한다
+        with self._lock:
+            if date in self._materialized or self._snap is None:
+                return super().has_reports(date, owner)
+            k = self._snap.find_key(owner, date)
+            return k is not None and self._snap.key(k)[3] > 0
+
+    def _merged_category_counts(self):
+        counts = dict(self._category_counts)
+        for category, n in self._base_counts.items():
+            counts[category] = counts.get(category, 0) + n
+        return counts
+
+    def list_categories(self, by_frequency=False):
+        counts = self._merged_category_counts()
+        if by_frequency:
+            return sorted(counts, key=lambda c: (-counts[c], c))
+        return sorted(counts)
+
+    def category_counts(self):
+        return self._merged_category_counts()
+
+    # --- mutators: 대상 저장 키를 먼저 올린다 ---
+    @_synchronized
+    def add_report(self, date, report=None, owner="personal"):
+        self._ensure_dates(date)
+        return super().add_report(date, report, owner)
+
+    @_synchronized
+    def update_report(self, date, index, report, owner="personal"):
+        self._ensure_dates(date)
+        return super().update_report(date, index, report, owner)
+
+    @_synchronized
+    def move_report(self, old_date, new_date, index, report, owner="personal", new_owner=None):
+        self._ensure_dates(old_date, new_date)
+        return super().move_report(old_date, new_date, index, report, owner, new_owner)
+
+    @_synchronized
+    def delete_report(self, date, index, owner="personal"):
+        self._ensure_dates(date)
+        return super().delete_report(date, index, owner)
+
+    # --- id 기반 접근: 검색 색인에 모든 보고서의 저장 키가 있다 ---
+    def _id_dates(self, report_id):
+        if report_id in self._by_id:
+            return ()
+        self._ensure_search()
+        meta = self._search.docs.get(report_id)
+        return (meta[3],) if meta is not None else ()
+
+    @_synchronized
+    def get_by_id(self, report_id):
+        self._ensure_dates(*self._id_dates(report_id))
+        return super().get_by_id(report_id)
+
+    @_synchronized
+    def locate_by_id(self, report_id):
+        self._ensure_dates(*self._id_dates(report_id))
+        return super().locate_by_id(report_id)
+
+    @_synchronized
+    def update_by_id(self, report_id, report):
+        self._ensure_dates(*self._id_dates(report_id))
+        return super().update_by_id(report_id, report)
+
+    @_synchronized
+    def move_by_id(self, report_id, new_date, report=None, new_owner=None):
+        self._ensure_dates(new_date, *self._id_dates(report_id))
+        return super().move_by_id(report_id, new_date, report, new_owner)
+
+    @_synchronized
+    def delete_by_id(self, report_id):
+        self._ensure_dates(*self._id_dates(report_id))
+        return super().delete_by_id(report_id)
+
+    @_synchronized
+    def delete_category(self, category):
+        if self._snap is not None and self._base_counts.get(category):
+            self._ensure_dates(*self._snap.keys_with_category(category))
+        return super().delete_category(category)
+
+    def iter_reports(self, owner=None, start=None, end=None, rules=True):
+        """메모리에 올리지 않고 스냅샷에서 바로 해석해 반환 (올린 저장 키는 메모리 쪽)
+        기간이 주어지면 스냅샷의 시작일 순 표로 겹치는 저장 키만 본다
+        rules: 반복 규칙 항목도 저장된 보고서 다음에 반환
+        """
+        lo = _to_ordinal(start) if start else None
+        hi = _to_ordinal(end) if end else None
+        with self._lock:
+            snap = self._snap
+            snap_owners = snap.owners if snap is not None else []
+            owners = [owner] if owner else sorted(set(self._reports) | set(snap_owners))
+        for ow in owners:
+            with self._lock:
+                snap = self._snap
+                keys = {d for d in self._reports.get(ow, {}) if d in self._materialized}
+                if snap is not None:
+                    if lo is None and hi is None:
+                        keys.update(snap.key(k)[1] for k in snap.keys_for(ow))
+                    else:
+                        found = snap.overlapping(ow, lo if lo is not None else 1,
+                                                 hi if hi is not None else _MAX_ORDINAL)
+                        keys.update(snap.key(snap.key_of(i))[1] for i in found)
+            for d in sorted(keys):
+                with self._lock:
+                    batch = self._key_reports(ow, d, lo, hi)
+                yield from batch
+        if rules:
+            yield from self._iter_rule_occurrences(owner, start, end)
+
+    def _key_reports(self, owner, date_key, lo, hi):
+        if date_key in self._materialized:
+            return [(owner, date_key, r) for r in self._reports.get(owner, {}).get(date_key, [])
+                    if _in_range(r, lo, hi)]
+        snap = self._snap
+        k = snap.find_key(owner, date_key) if snap is not None else None
+        if k is None:
+            return []
+        _owner, _key, first, count = snap.key(k)
+        batch = []
+        for i in range(first, first + count):
+            if lo is not None or hi is not None:
+                _o, _c, s, e, _off, _len = snap.record(i)
+                if not s or (lo is not None and e < lo) or (hi is not None and s > hi):
+                    continue
+            batch.append((owner, date_key, snap.report(i, date_key)))
+        return batch
+
+    def close(self):
+        super().close()
+        with self._lock:
+            self._stop_search_builder()
+            self._close_snapshot()
+
+    # --- persistence: 바뀐 저장 키는 변경분 파일에, 가끔 새 스냅샷으로 합친다 ---
+    def _write_out(self):
+        if self.read_only:
+            self._pending_ops = []
+            return
+        with self._io_lock:
+            with self._lock:
+                self._pending_ops = []
+                if not self._changed_keys and self._snap is not None:
+                    return
+                keys, self._changed_keys = self._changed_keys, set()
+                lines = self._delta_lines(keys) if self._snap is not None else None
+            if lines is None or self._delta_count + len(lines) > self.DELTA_COMPACT_EVERY:
+                self._compact(keys)
+                return
+            try:
+                with open(self.delta_file, 'ab') as f:
+                    f.write(b"".join(lines))
+                    f.flush()
+                    os.fsync(f.fileno())
+            except Exception as e:
+                print(f"스냅샷 변경분 저장 실패: {e}")
+                # 다음 저장 때 다시 시도
+                with self._lock:
+                    self._changed_keys |= keys
+                return
+            self._delta_count += len(lines)
+
+    def _delta_lines(self, keys):
+        """바뀐 저장 키마다 owner별 현재 보고서 목록 한 줄 (빈 목록은 그 저장 키의 삭제 표시)"""
+        generation = self._snap.meta["generation"]
+        owners = sorted(set(self._reports) | set(self._snap.owners))
+        lines = []
+        for date_key in sorted(keys):
+            for ow in owners:
+                entry = {"generation": generation, "owner": ow, "key": date_key,
+                         "reports": [r.to_dict() for r in self._reports.get(ow, {}).get(date_key, [])]}
+                lines.append((json.dumps(entry, ensure_ascii=False) + "\n").encode("utf-8"))
+        return lines
+
+    def _compact(self, keys):
+        """메모리 쪽과 스냅샷에 남은 보고서를 합쳐 새 스냅샷을 쓰고 변경분 파일을 비운다"""
+        # 색인을 새 스냅샷과 함께 저장해 두어야 다음에 열 때 전체를 다시 색인하지 않는다
+        self._ensure_search()
+        with self._lock:
+            groups = self._snapshot_groups()
+            source = self._snap
+        tmp = self.snapshot_file.with_suffix(".snap.tmp")
+        try:
+            self.snapshot_file.parent.mkdir(parents=True, exist_ok=True)
+            write_snapshot(tmp, groups, source)
+        except Exception as e:
+            print(f"스냅샷 저장 실패: {e}")
+            with self._lock:
+                self._changed_keys |= keys
+            return
+        with self._lock:
+            if not self._replace_snapshot(tmp):
+                self._changed_keys |= keys
+                return
+            self._delta_count = 0
+            try:
+                self.delta_file.unlink(missing_ok=True)
+            except Exception as e:
+                # 남은 변경분은 이전 스냅샷의 것이므로 다음에 열 때 건너뛴다
+                print(f"스냅샷 변경분 정리 실패: {e}")
+            self._save_search_index()
+
+    def _snapshot_groups(self):
+        """새 스냅샷에 쓸 (owner, date_key, items). 올린 저장 키는 Report 목록, 나머지는 스냅샷 레코드 번호"""
+        snap = self._snap
+        owners = set(self._reports) | set(snap.owners if snap is not None else ())
+        groups = []
+        for ow in sorted(owners):
+            items = {}
+            if snap is not None:
+                for k in snap.keys_for(ow):
+                    _owner, date_key, first, count = snap.key(k)
+                    if date_key not in self._materialized:
+                        items[date_key] = range(first, first + count)
+            for date_key, reports in self._reports.get(ow, {}).items():
+                if reports:
+                    items[date_key] = list(reports)
+            groups.extend((ow, date_key, items[date_key]) for date_key in sorted(items))
+        return groups
+
+    def _replace_snapshot(self, tmp):
+        """tmp를 스냅샷으로 바꿔 다시 연다 (바꾸지 못했으면 False)"""
+        # Windows에서는 mmap으로 열린 파일을 바꿀 수 없으므로 먼저 닫는다
+        self._close_snapshot()
+        replaced = True
+        try:
+            os.replace(tmp, self.snapshot_file)
+        except Exception as e:
+            print(f"스냅샷 저장 실패: {e}")
+            replaced = False
+        try:
+            self._snap = SnapshotFile(self.snapshot_file)
+        except Exception as e:
+            print(f"스냅샷 로드 실패: {e}")
+            return False
+        # 올린 저장 키의 보고서는 _category_counts에 들어 있으므로 나머지만 센다
+        counts = dict(self._snap.meta["category_counts"])
+        for date_key in self._materialized:
+            for ow in self._snap.owners:
+                k = self._snap.find_key(ow, date_key)
+                if k is None:
+                    continue
+                _owner, _key, first, count = self._snap.key(k)
+                for i in range(first, first + count):
+                    _count_down(counts, self._snap.category_of(i))
+        self._base_counts = counts
+        return replaced
@@ -0,0 +1,573 @@
+import sqlite3
+from pathlib import Path
+
+from search_index import INDEX_VERSION, bm25, index_grams, query_grams, report_text
+from weekly_rollup import rollup_from_buckets, week_monday
+from report_store import (
+    ReportStore, Report, _report_with_id, _synchronized, _to_ordinal, _from_ordinal,
+    load_config, data_dir, storage_config, new_report_id,
+)
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS reports (
+    id INTEGER PRIMARY KEY,
+    uid TEXT,
+    owner TEXT NOT NULL,
+    date_key TEXT NOT NULL,
+    content TEXT NOT NULL DEFAULT '',
+    category TEXT NOT NULL DEFAULT '',
+    location TEXT NOT NULL DEFAULT '',
+    attendees TEXT NOT NULL DEFAULT '',
+    start_date INTEGER,
+    end_date INTEGER,
+    raw_start TEXT,
+    raw_end TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_reports_owner_key ON reports(owner, date_key, id);
+CREATE INDEX IF NOT EXISTS idx_reports_start ON reports(owner, start_date);
+CREATE INDEX IF NOT EXISTS idx_reports_start_any ON reports(start_date);
+CREATE INDEX IF NOT EXISTS idx_reports_end ON reports(owner, end_date);
+CREATE INDEX IF NOT EXISTS idx_reports_span ON reports((end_date - start_date));
+CREATE INDEX IF NOT EXISTS idx_reports_category ON reports(category);
+CREATE TABLE IF NOT EXISTS search_docs (
+    uid TEXT PRIMARY KEY,
+    length INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS search_grams (
+    gram TEXT NOT NULL,
+    uid TEXT NOT NULL,
+    tf INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_search_grams_gram ON search_grams(gram);
+CREATE INDEX IF NOT EXISTS idx_search_grams_uid ON search_grams(uid);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+COLUMNS = "id, uid, owner, date_key, content, category, location, attendees, start_date, end_date, raw_start, raw_end"
+
+R_COLUMNS = ", ".join("r." + c for c in COLUMNS.split(", "))
+
+INSERT_SQL = ("INSERT INTO reports (owner, date_key, uid, content, category, location, attendees,"
+              " start_date, end_date, raw_start, raw_end) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)")
+
+# 같은 (owner, date_key) 안에서의 위치 = 기존 (date, index) 주소의 index
+POSITION = ("(SELECT COUNT(*) FROM reports p WHERE p.owner = r.owner "
+            "AND p.date_key = r.date_key AND p.id < r.id)")
+
+
+def _row_to_report(row):
+    raw = None
+    if row["start_date"] is None:
+        raw = (row["raw_start"] or "", row["raw_end"] or "")
+    return Report(
+        content=row["content"],
+        category=row["category"],
+        location=row["location"],
+        attendees=row["attendees"],
+        start=row["start_date"],
+        end=row["end_date"],
+        raw_dates=raw,
+        report_id=row["uid"],
+    )
+
+
+def _report_values(report):
+    raw = report._raw_dates or (None, None)
+    return (report.id, report.content, report.category, report.location, report.attendees,
+            report.start, report.end, raw[0], raw[1])
+
+
+class SqliteReportStore(ReportStore):
+    """SQLite 파일에 보고서를 보관하는 ReportStore
+
+    config.json의 storage.backend = "sqlite"로 선택한다. 보고서를 메모리에 올리지 않고
+    조회할 때마다 인덱스를 탄 쿼리를 실행하며, 변경은 건마다 트랜잭션으로 바로 기록된다.
+    처음 열 때 DB가 비어 있고 data.json이 있으면 한 번만 가져온다.
+    """
+
+    def __init__(self, db_file=None, json_file=None, config=None, **kwargs):
+        if config is None:
+            config = load_config() if db_file is None else {}
+        storage_cfg = storage_config(config)
+        base = data_dir(config)
+        if db_file is None:
+            db_file = storage_cfg.get("sqlite_file") or (base / "reports.db")
+        if json_file is None:
+            json_file = base / "data.json"
+        self.db_file = Path(db_file)
+        self.db_file.parent.mkdir(parents=True, exist_ok=True)
+        # 공통 상태는 ReportStore에서 만든다. 변경은 건마다 커밋하므로 journal/저장 스레드는 쓰지 않고,
+        # load_from_json은 아무것도 하지 않으므로 data.json을 메모리에 올리지 않는다
+        super().__init__(json_file=json_file, journal=False, save_delay=0, config=config)
+        # 월요일 ordinal -> 주간 집계. 변경된 보고서 기간에 걸친 주만 비운다
+        self._week_cache = {}
+        # store worker 등 다른 스레드에서도 쓰므로 같은 스레드 제한은 끄고 _lock으로 직렬화
+        self._conn = sqlite3.connect(str(self.db_file), check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        with self._conn:
+            self._conn.executescript(SCHEMA)
+        self._ensure_uids()
+        self._migrate_from_json()
+        self._ensure_search_index()
+
+    def _rules_file_path(self):
+        # 반복 규칙은 DB 옆 reports.rules.json (다른 저장소와 같은 형식)
+        return self.db_file.with_name(f"{self.db_file.stem}.rules.json")
+
+    def _ensure_uids(self):
+        """uid 열이 없던 DB는 열을 추가하고 기존 행에 id를 채운다"""
+        columns = {row["name"] for row in self._conn.execute("PRAGMA table_info(reports)")}
+        with self._conn:
+            if "uid" not in columns:
+                self._conn.execute("ALTER TABLE reports ADD COLUMN uid TEXT")
+            missing = self._conn.execute("SELECT id FROM reports WHERE uid IS NULL").fetchall()
+            self._conn.executemany("UPDATE reports SET uid = ? WHERE id = ?",
+                                   [(new_report_id(), row["id"]) for row in missing])
+            self._conn.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_reports_uid ON reports(uid)")
+
+    # --- migration ---
+    def _migrate_from_json(self):
+        """DB가 비어 있으면 기존 data.json(및 journal)을 한 번에 가져온다"""
+        done = self._conn.execute("SELECT value FROM meta WHERE key = 'migrated_from'").fetchone()
+        if done is not None or not self.json_file.exists():
+            return
+        if self._conn.execute("SELECT 1 FROM reports LIMIT 1").fetchone() is not None:
+            return
+        # 읽기 전용: 가져오는 동안 원본 data.json/journal을 다시 쓰거나 압축하지 않는다
+        legacy = ReportStore(self.json_file, save_delay=0, config={}, read_only=True)
+        try:
+            with self._conn:
+                for ow, reports_map in legacy._reports.items():
+                    for date_key, reports in reports_map.items():
+                        self._conn.executemany(
+                            INSERT_SQL,
+                            [(ow, date_key) + _report_values(r) for r in reports],
+                        )
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES ('migrated_from', ?)",
+                    (str(self.json_file),),
+                )
+        except Exception as e:
+            print(f"data.json 가져오기 실패: {e}")
+
+    def _ensure_search_index(self):
+        """검색 색인 테이블이 보고서와 맞지 않으면 (이전 버전 DB 등) 한 번 다시 만든다"""
+        docs = self._conn.execute("SELECT COUNT(*) FROM search_docs").fetchone()[0]
+        reports = self._conn.execute("SELECT COUNT(*) FROM reports").fetchone()[0]
+        version = self._conn.execute("SELECT value FROM meta WHERE key = 'search_version'").fetchone()
+        if docs == reports and version is not None and version[0] == str(INDEX_VERSION):
+            return
+        with self._conn:
+            self._conn.execute("DELETE FROM search_docs")
+            self._conn.execute("DELETE FROM search_grams")
+            for row in self._conn.execute(f"SELECT {COLUMNS} FROM reports").fetchall():
+                self._search_put(_row_to_report(row))
+            self._conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('search_version', ?)",
+                               (str(INDEX_VERSION),))
+
+    # --- search index maintenance (호출하는 쪽의 트랜잭션 안에서 실행) ---
+    def _search_put(self, report):
+        self._search_drop(report.id)
+        grams, length = index_grams(report_text(report))
+        self._conn.executemany("INSERT INTO search_grams (gram, uid, tf) VALUES (?, ?, ?)",
+                               [(g, report.id, tf) for g, tf in grams.items()])
+        self._conn.execute("INSERT INTO search_docs (uid, length) VALUES (?, ?)", (report.id, length))
+
+    def _search_drop(self, uid):
+        self._conn.execute("DELETE FROM search_grams WHERE uid = ?", (uid,))
+        self._conn.execute("DELETE FROM search_docs WHERE uid = ?", (uid,))
+
+    # --- helpers ---
+    def _row_id(self, owner, date, index):
+        if index < 0:
+            return None
+        row = self._conn.execute(
+            "SELECT id FROM reports WHERE owner = ? AND date_key = ? ORDER BY id LIMIT 1 OFFSET ?",
+            (owner, date, index),
+        ).fetchone()
+        return row["id"] if row is not None else None
+
+    def _count(self, owner, date):
+        return self._conn.execute(
+            "SELECT COUNT(*) FROM reports WHERE owner = ? AND date_key = ?", (owner, date)
+        ).fetchone()[0]
+
+    def _insert(self, owner, date, report):
+        self._conn.execute(
+            INSERT_SQL,
+            (owner, date) + _report_values(report),
+        )
+        self._search_put(report)
+        self._forget_weeks(report.start, report.end)
+
+    def _update_row(self, row_id, report):
+        self._forget_row_weeks("id = ?", (row_id,))
+        self._conn.execute(
+            "UPDATE reports SET uid = ?, content = ?, category = ?, location = ?, attendees = ?,"
+            " start_date = ?, end_date = ?, raw_start = ?, raw_end = ? WHERE id = ?",
+            _report_values(report) + (row_id,),
+        )
+        self._search_put(report)
+        self._forget_weeks(report.start, report.end)
+
+    def _forget_weeks(self, lo, hi):
+        """[lo, hi] 기간에 걸친 주의 집계 캐시를 비운다"""
+        if lo is None or hi is None:
+            return
+        monday = week_monday(lo)
+        while monday <= hi:
+            self._week_cache.pop(monday, None)
+            monday += 7
+
+    def _forget_row_weeks(self, where, params):
+        for row in self._conn.execute(f"SELECT start_date, end_date FROM reports WHERE {where}", params):
+            self._forget_weeks(row[0], row[1])
+
+    def _row(self, row_id):
+        return self._conn.execute(f"SELECT {COLUMNS} FROM reports WHERE id = ?", (row_id,)).fetchone()
+
+    def _row_by_uid(self, report_id):
+        return self._conn.execute(
+            f"SELECT {COLUMNS}, {POSITION} AS position FROM reports r WHERE uid = ?", (report_id,)
+        ).fetchone()
+
+    def _max_span(self):
+        """가장 긴 보고서 기간 (일). idx_reports_span 색인의 끝값이라 표를 훑지 않는다"""
+        return self._conn.execute("SELECT MAX(end_date - start_date) FROM reports").fetchone()[0] or 0
+
+    def _overlapping(self, lo, hi, owner=None):
+        # 메모리 _IntervalIndex와 같은 방식: [lo, hi]와 겹치려면 시작일이 [lo - max_span, hi] 안에 있어야 하므로
+        # 시작일 색인의 양쪽 경계로 범위를 좁힌 뒤 종료일을 확인한다
+        sql = (f"SELECT {COLUMNS}, {POSITION} AS position FROM reports r "
+               "WHERE r.start_date BETWEEN ? AND ? AND r.end_date >= ?")
+        if owner:
+            sql += " AND r.owner = ?"
+        sql += " ORDER BY r.start_date, r.id"
+        with self._lock:
+            params = [lo - self._max_span(), hi, lo]
+            if owner:
+                params.append(owner)
+            return self._conn.execute(sql, params).fetchall()
+
+    # --- queries ---
+    def list_reports(self, date):
+        return self.list_reports_for(date, owner="personal")
+
+    def list_reports_for(self, date, owner="personal"):
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {COLUMNS} FROM reports WHERE owner = ? AND date_key = ? ORDER BY id",
+                (owner, date),
+            ).fetchall()
+        return [_row_to_report(row) for row in rows]
+
+    def find_reports_for_date(self, date_str, owner=None):
+        target = _to_ordinal(date_str)
+        if target is None:
+            return []
+        found = [(row["owner"], row["date_key"], row["position"], _row_to_report(row))
+                 for row in self._overlapping(target, target, owner)]
+        found.extend(self._rule_occurrences(target, target, owner))
+        return found
+
+    def find_reports_in_range(self, start, end, owner=None):
+        lo = _to_ordinal(start)
+        hi = _to_ordinal(end)
+        if lo is None or hi is None or hi < lo:
+            return {}
+        days = [_from_ordinal(o) for o in range(lo, hi + 1)]
+        buckets = {d: [] for d in days}
+        for row in self._overlapping(lo, hi, owner):
+            entry = (row["owner"], row["date_key"], row["position"], _row_to_report(row))
+            for o in range(max(row["start_date"], lo), min(row["end_date"], hi) + 1):
+                buckets[days[o - lo]].append(entry)
+        self._add_rule_occurrences(buckets, days, lo, hi, owner)
+        return buckets
+
+    def get_report(self, date, index, owner="personal"):
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {COLUMNS} FROM reports WHERE owner = ? AND date_key = ? ORDER BY id LIMIT 1 OFFSET ?",
+                (owner, date, index),
+            ).fetchone() if index >= 0 else None
+        if row is None:
+            raise IndexError(index)
+        return _row_to_report(row)
+
+    def has_reports(self, date, owner="personal"):
+        with self._lock:
+            return self._conn.execute(
+                "SELECT 1 FROM reports WHERE owner = ? AND date_key = ? LIMIT 1", (owner, date)
+            ).fetchone() is not None
+
+    def list_categories(self, by_frequency=False):
+        order = "COUNT(*) DESC, category" if by_frequency else "category"
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT category FROM reports WHERE category != '' GROUP BY category ORDER BY {order}"
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def category_counts(self):
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT category, COUNT(*) FROM reports WHERE category != '' GROUP BY category"
+            ).fetchall()
+        return {row[0]: row[1] for row in rows}
+
+    # --- mutators (각각 하나의 트랜잭션) ---
+    @_synchronized
+    def add_report(self, date, report=None, owner="personal"):
+        if report is None:
+            report = {"content": "", "category": "", "location": "", "attendees": "", "start_date": date, "end_date": ""}
+        report = Report.from_dict(report, date)
+        with self._conn:
+            self._insert(owner, date, report)
+        self._emit("added", owner, date, report)
+        return self._count(owner, date) - 1
+
+    @_synchronized
+    def add_reports(self, items):
+        """여러 건을 한 트랜잭션으로 추가"""
+        added = []
+        with self._conn:
+            for owner, date, report in items:
+                report = Report.from_dict(report, date)
+                self._insert(owner, date, report)
+                added.append((owner, date, report))
+        if self._listeners:
+            for owner, date, report in added:
+                self._emit("added", owner, date, report)
+        return len(added)
+
+    def iter_reports(self, owner=None, start=None, end=None, rules=True, chunk=500):
+        """(owner, date, report)를 owner, 저장 키 날짜 순으로. chunk건씩 읽어 메모리를 일정하게 유지
+        rules: 반복 규칙 항목도 저장된 보고서 다음에 반환
+        """
+        filters = []
+        params = []
+        if owner:
+            filters.append("owner = ?")
+            params.append(owner)
+        if start and _to_ordinal(start) is not None:
+            filters.append("end_date >= ?")
+            params.append(_to_ordinal(start))
+        if end and _to_ordinal(end) is not None:
+            filters.append("start_date <= ?")
+            params.append(_to_ordinal(end))
+        where = (" WHERE " + " AND ".join(filters)) if filters else ""
+        # (owner, date_key, id) 위치부터 이어 읽는다 (커서를 잠금 밖에 열어 두지 않기 위해)
+        last = None
+        while True:
+            sql = f"SELECT {COLUMNS} FROM reports{where}"
+            page_params = list(params)
+            if last is not None:
+                sql += (" AND " if filters else " WHERE ") + "(owner, date_key, id) > (?, ?, ?)"
+                page_params.extend(last)
+            sql += " ORDER BY owner, date_key, id LIMIT ?"
+            page_params.append(chunk)
+            with self._lock:
+                rows = self._conn.execute(sql, page_params).fetchall()
+            for row in rows:
+                yield row["owner"], row["date_key"], _row_to_report(row)
+            if len(rows) < chunk:
+                break
+            last = (rows[-1]["owner"], rows[-1]["date_key"], rows[-1]["id"])
+        if rules:
+            yield from self._iter_rule_occurrences(owner, start, end)
+
+    @_synchronized
+    def update_report(self, date, index, report, owner="personal"):
+        row_id = self._row_id(owner, date, index)
+        if row_id is None:
+            raise IndexError(index)
+        old = self._row(row_id)
+        report = Report.from_dict(report, date, old["uid"])
+        with self._conn:
+            self._update_row(row_id, report)
+        self._emit("updated", owner, date, report, owner, date, _row_to_report(old))
+
+    @_synchronized
+    def move_report(self, old_date, new_date, index, report, owner="personal", new_owner=None):
+        if new_owner is None:
+            new_owner = owner
+        row_id = self._row_id(owner, old_date, index)
+        old = self._row(row_id) if row_id is not None else None
+        report = Report.from_dict(report, new_date, old["uid"] if old is not None else None)
+        with self._conn:
+            if row_id is not None:
+                self._forget_row_weeks("id = ?", (row_id,))
+                self._conn.execute("DELETE FROM reports WHERE id = ?", (row_id,))
+            self._insert(new_owner, new_date, report)
+        if old is None:
+            self._emit("added", new_owner, new_date, report)
+        else:
+            self._emit("moved", new_owner, new_date, report, owner, old_date, _row_to_report(old))
+        return self._count(new_owner, new_date) - 1
+
+    @_synchronized
+    def delete_report(self, date, index, owner="personal"):
+        row_id = self._row_id(owner, date, index)
+        if row_id is not None:
+            old = self._row(row_id)
+            with self._conn:
+                self._forget_row_weeks("id = ?", (row_id,))
+                self._conn.execute("DELETE FROM reports WHERE id = ?", (row_id,))
+                self._search_drop(old["uid"])
+            self._emit("deleted", owner, date, _row_to_report(old))
+
+    # --- id 기반 접근 ---
+    def get_by_id(self, report_id):
+        with self._lock:
+            row = self._row_by_uid(report_id)
+        if row is None:
+            return self._occurrence_by_id(report_id)
+        return _row_to_report(row)
+
+    def locate_by_id(self, report_id):
+        with self._lock:
+            row = self._row_by_uid(report_id)
+        if row is None:
+            return self._locate_occurrence(report_id)
+        return row["owner"], row["date_key"], row["position"]
+
+    @_synchronized
+    def update_by_id(self, report_id, report):
+        row = self._row_by_uid(report_id)
+        if row is None:
+            return self._override_occurrence(report_id, report)
+        report = _report_with_id(report, row["date_key"], report_id)
+        with self._conn:
+            self._update_row(row["id"], report)
+        self._emit("updated", row["owner"], row["date_key"], report, row["owner"], row["date_key"], _row_to_report(row))
+        return report
+
+    @_synchronized
+    def move_by_id(self, report_id, new_date, report=None, new_owner=None):
+        row = self._row_by_uid(report_id)
+        if row is None:
+            return self._override_occurrence(report_id, report, new_date, new_owner)
+        if new_owner is None:
+            new_owner = row["owner"]
+        if report is None:
+            report = _row_to_report(row).to_dict()
+        report = _report_with_id(report, new_date, report_id)
+        with self._conn:
+            # 새 행으로 넣어야 새 날짜 목록의 끝에 붙는다
+            self._forget_weeks(row["start_date"], row["end_date"])
+            self._conn.execute("DELETE FROM reports WHERE id = ?", (row["id"],))
+            self._insert(new_owner, new_date, report)
+        self._emit("moved", new_owner, new_date, report, row["owner"], row["date_key"], _row_to_report(row))
+        return report
+
+    @_synchronized
+    def delete_by_id(self, report_id):
+        row = self._row_by_uid(report_id)
+        if row is None:
+            return self._skip_by_id(report_id)
+        with self._conn:
+            self._forget_weeks(row["start_date"], row["end_date"])
+            self._conn.execute("DELETE FROM reports WHERE id = ?", (row["id"],))
+            self._search_drop(report_id)
+        self._emit("deleted", row["owner"], row["date_key"], _row_to_report(row))
+        return True
+
+    def search(self, query, owner=None, category=None, start=None, end=None, limit=50):
+        grams = query_grams(query)
+        if not grams:
+            return []
+        with self._lock:
+            doc_count, total_len = self._conn.execute("SELECT COUNT(*), SUM(length) FROM search_docs").fetchone()
+            if not doc_count:
+                return []
+            postings = []
+            for g in grams:
+                rows = self._conn.execute("SELECT uid, tf FROM search_grams WHERE gram = ?", (g,))
+                posting = dict(rows.fetchall())
+                if not posting:
+                    return []
+                postings.append(posting)
+            postings.sort(key=len)
+            candidates = set(postings[0])
+            for posting in postings[1:]:
+                candidates.intersection_update(posting)
+
+            sql = (f"SELECT {R_COLUMNS}, {POSITION} AS position, d.length AS doc_length FROM reports r "
+                   "JOIN search_docs d ON d.uid = r.uid WHERE r.uid IN ({})")
+            filters = []
+            params = []
+            if owner:
+                filters.append("r.owner = ?")
+                params.append(owner)
+            if category:
+                filters.append("r.category = ?")
+                params.append(category)
+            if start and _to_ordinal(start) is not None:
+                filters.append("r.end_date >= ?")
+                params.append(_to_ordinal(start))
+            if end and _to_ordinal(end) is not None:
+                filters.append("r.start_date <= ?")
+                params.append(_to_ordinal(end))
+            if filters:
+                sql += " AND " + " AND ".join(filters)
+            rows = []
+            candidates = list(candidates)
+            for i in range(0, len(candidates), 500):
+                chunk = candidates[i:i + 500]
+                rows.extend(self._conn.execute(sql.format(",".join("?" * len(chunk))), chunk + params).fetchall())
+
+        avg_len = total_len / doc_count
+        scored = []
+        for row in rows:
+            score = sum(bm25(p[row["uid"]], len(p), doc_count, row["doc_length"], avg_len) for p in postings)
+            scored.append((score, row))
+        scored.sort(key=lambda item: (-item[0], item[1]["date_key"], item[1]["uid"]))
+        if limit:
+            scored = scored[:limit]
+        return [(row["owner"], row["date_key"], row["position"], _row_to_report(row)) for _score, row in scored]
+
+    @_synchronized
+    def delete_category(self, category):
+        if not category:
+            return 0
+        rows = []
+        if self._listeners:
+            rows = self._conn.execute(f"SELECT {COLUMNS} FROM reports WHERE category = ?", (category,)).fetchall()
+        with self._conn:
+            self._forget_row_weeks("category = ?", (category,))
+            cur = self._conn.execute("UPDATE reports SET category = '' WHERE category = ?", (category,))
+        for row in rows:
+            old = _row_to_report(row)
+            cleared = _row_to_report(row)
+            cleared.category = ""
+            self._emit("updated", row["owner"], row["date_key"], cleared, row["owner"], row["date_key"], old)
+        return cur.rowcount + self._clear_rule_category(category)
+
+    def _week_summary(self, monday):
+        with self._lock:
+            summary = self._week_cache.get(monday)
+            if summary is None:
+                buckets = self.find_reports_in_range(_from_ordinal(monday), _from_ordinal(monday + 6))
+                summary = self._week_cache[monday] = rollup_from_buckets(monday, buckets)
+        return summary
+
+    # --- persistence: 변경은 이미 커밋되어 있으므로 별도 저장이 필요 없음 ---
+    def save_to_json(self):
+        pass
+
+    def flush(self):
+        pass
+
+    def load_from_json(self):
+        pass
+
+    def close(self):
+        if self._closed:
+            return
+        super().close()
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,184 @@
+"""저장소 작업을 Tk 메인 스레드 밖에서 실행하고 결과를 root.after로 돌려주는 작업 스레드
+
+    worker = StoreWorker(root)
+    worker.submit(lambda: store.find_reports_for_date(date), on_done=self._show, key=(self, "list"))
+
+작업은 스레드 하나에서 넣은 순서대로 실행된다 (저장 순서가 섞이지 않도록).
+같은 key로 새 작업을 넣으면 이전 작업은 취소된다: 아직 시작 전이면 건너뛰고,
+실행 중이었으면 결과를 버린다 (날짜를 연달아 눌렀을 때 마지막 날짜만 표시).
+on_done/on_error는 항상 메인 스레드에서 불리므로 그 안에서 위젯을 바로 고쳐도 된다.
+저장소 변경 알림처럼 작업 스레드에서 불릴 수 있는 콜백은 main_thread(callback)으로 감싼다.
+"""
+import queue
+import threading
+from collections import deque
+
+
+class Job:
+    __slots__ = ("func", "on_done", "on_error", "key", "cancelled")
+
+    def __init__(self, func, on_done, on_error, key):
+        self.func = func
+        self.on_done = on_done
+        self.on_error = on_error
+        self.key = key
+        self.cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
+
+
+class StoreWorker:
+    # 결과가 남아 있는 동안 메인 스레드에서 확인하는 주기 (ms)
+    POLL_MS = 10
+
+    def __init__(self, root):
+        self.root = root
+        self._cond = threading.Condition()
+        self._jobs = deque()
+        self._closed = False
+        self._latest = {}              # key -> 마지막으로 넣은 Job (메인 스레드에서만 씀)
+        self._results = queue.Queue()  # (job, result, error)
+        self._calls = queue.Queue()    # 메인 스레드에서 부를 (callback, args)
+        self._main = threading.current_thread()
+        self._outstanding = 0          # 넣었지만 결과를 아직 처리하지 않은 작업 수
+        self._polling = False
+        self._thread = threading.Thread(target=self._run, name="StoreWorker", daemon=True)
+        self._thread.start()
+
+    def submit(self, func, on_done=None, on_error=None, key=None):
+        """func()를 작업 스레드에서 실행하고 on_done(결과) / on_error(예외)를 메인 스레드에서 호출"""
+        job = Job(func, on_done, on_error, key)
+        if key is not None:
+            self.cancel(key)
+            self._latest[key] = job
+        with self._cond:
+            if self._closed:
+                return job
+            self._jobs.append(job)
+            self._cond.notify()
+        self._outstanding += 1
+        self._schedule_poll()
+        return job
+
+    def cancel(self, key):
+        """key로 넣은 작업 취소 (메인 스레드에서 같은 일을 바로 했을 때 늦게 오는 결과를 버리도록)"""
+        job = self._latest.pop(key, None)
+        if job is not None:
+            job.cancel()
+
+    def main_thread(self, callback):
+        """어느 스레드에서 불러도 callback이 메인 스레드에서 실행되도록 감싼다
+        메인 스레드에서 부르면 바로, 다른 스레드(작업 중인 작업)에서 부르면 그 작업의 결과를
+        돌려줄 때 함께 부른다 (Tk는 메인 스레드에서만 건드릴 수 있으므로).
+        """
+        def call(*args):
+            if threading.current_thread() is self._main:
+                callback(*args)
+            else:
+                self._calls.put((callback, args))
+        return call
+
+    def pending(self):
+        return self._outstanding
+
+    def close(self, wait=True):
+        """남은 작업을 버리고 실행 중인 작업이 끝날 때까지 기다린다 (종료 시)"""
+        with self._cond:
+            self._closed = True
+            for job in self._jobs:
+                job.cancel()
+            self._jobs.clear()
+            self._cond.notify()
+        if wait:
+            self._thread.join()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._jobs and not self._closed:
+                    self._cond.wait()
+                if not self._jobs:
+                    return
+                job = self._jobs.popleft()
+            if job.cancelled:
+                self._results.put((job, None, None))
+                continue
+            try:
+                self._results.put((job, job.func(), None))
+            except Exception as e:
+                self._results.put((job, None, e))
+
+    # --- 메인 스레드 ---
+    def _schedule_poll(self):
+        if not self._polling:
+            self._polling = True
+            self.root.after(self.POLL_MS, self._poll)
+
+    def _poll(self):
+        self._polling = False
+        # 작업 중에 넘어온 콜백을 먼저 (작업 결과보다 먼저 생긴 것이므로)
+        while True:
+            try:
+                callback, args = self._calls.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                callback(*args)
+            except Exception as e:
+                print(f"메인 스레드 콜백 실패: {e}")
+        while True:
+            try:
+                job, result, error = self._results.get_nowait()
+            except queue.Empty:
+                break
+            self._outstanding -= 1
+            self._deliver(job, result, error)
+        if self._outstanding > 0 and not self._closed:
+            self._schedule_poll()
+
+    def _deliver(self, job, result, error):
+        if job.key is not None and self._latest.get(job.key) is job:
+            del self._latest[job.key]
+        if job.cancelled:
+            return
+        try:
+            if error is not None:
+                if job.on_error is not None:
+                    job.on_error(error)
+                else:
+                    print(f"저장소 작업 실패: {error}")
+            elif job.on_done is not None:
+                job.on_done(result)
+        except Exception as e:
+            print(f"저장소 작업 결과 처리 실패: {e}")
+
+
+class InlineWorker:
+    """StoreWorker와 같은 사용법으로 바로 실행 (작업 스레드 없이 탭을 만들 때)"""
+
+    def submit(self, func, on_done=None, on_error=None, key=None):
+        job = Job(func, on_done, on_error, key)
+        try:
+            result = func()
+        except Exception as e:
+            if on_error is None:
+                print(f"저장소 작업 실패: {e}")
+            else:
+                on_error(e)
+            return job
+        if on_done is not None:
+            on_done(result)
+        return job
+
+    def cancel(self, key):
+        pass
+
+    def main_thread(self, callback):
+        return callback
+
+    def pending(self):
+        return 0
+
+    def close(self, wait=True):
+        pass
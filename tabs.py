@@ -1,21 +1,55 @@
 import tkinter as tk
-from tkinter import ttk
-from tkcalendar import Calendar
+from tkinter import ttk, messagebox
+import contextlib
 import datetime
+import functools
+
+import instrumentation
+import recurrence
+from store_worker import InlineWorker
+from virtual_list import VirtualListbox
+
+
+NO_REPEAT = "반복 없음"
+# 반복 선택 표시 -> 반복 주기 ('매주' -> 'weekly' 등)
+REPEAT_CHOICES = {recurrence.FREQUENCY_LABELS[f]: f for f in recurrence.FREQUENCIES}
+
+
+def _edits_store(func):
+    """탭이 직접 저장소를 바꾸는 동안 오는 변경 알림은 무시 (목록은 그 메서드가 직접 고친다)"""
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        self._editing += 1
+        try:
+            return func(self, *args, **kwargs)
+        finally:
+            self._editing -= 1
+    return wrapper
 
 
 class PersonalTab:
-    """개인업무 입력/관리 탭 (이전 ReportTab)"""
-    def __init__(self, parent, store, owner="personal"):
+    """개인업무 입력/관리 탭 (이전 ReportTab)
+    날짜별 목록은 worker(StoreWorker)에서 읽어 오고, 보고서 추가/수정/삭제는 바로 한다.
+    """
+    def __init__(self, parent, store, owner="personal", worker=None):
         self.store = store
+        self.worker = worker or InlineWorker()
         self.parent = parent
         self.frame = tk.Frame(parent)
         self.owner = owner
-        self.current_index = None
-        self.current_orig_date = None
+        self.current_id = None  # 편집 중인 보고서 id (새 보고서면 None)
         self.current_date = None
-        self._visible_reports = []  # list of (owner, orig_date, idx)
+        self._visible_reports = []  # list of report ids (listbox 순서)
+        self._row_reports = {}      # report id -> report (현재 목록)
+        self._label_cache = {}      # report id -> (report, 번호 뺀 표시 글자)
+        self._list_date = None      # 목록이 보여주는 날짜 (검색 결과면 None)
+        self._editing = 0           # 이 탭이 저장소를 바꾸는 중 (_edits_store)
+        self._refresh_pending = False
+        self._list_key = (self, "list")
         self._build_ui()
+        # 다른 곳(다른 탭, 가져오기 등)에서 이 owner의 보고서가 바뀌면 보이는 날짜일 때만 목록을 다시 읽는다
+        self._unsubscribe = store.subscribe(self.worker.main_thread(self._on_store_change), owner=owner)
+        self._unsubscribe_undo = self._watch_undo()
 
     def _build_ui(self):
         # Top: report list for the selected date (compact)
@@ -34,11 +68,10 @@ class PersonalTab:
         self.list_label = tk.Label(self.list_frame, text=label_text)
         self.list_label.pack(anchor="nw", padx=6, pady=(6, 0))
 
-        self.report_listbox = tk.Listbox(self.list_frame, height=3)
+        # 보이는 행만 글자를 만드는 목록 (기간 검색 등으로 수천 건이어도 가볍게)
+        self.report_listbox = VirtualListbox(self.list_frame, self._format_row, height=3)
         self.report_listbox.pack(side="left", fill="both", expand=True, padx=(6,0), pady=6)
-        self.list_scroll = tk.Scrollbar(self.list_frame, command=self.report_listbox.yview)
-        self.list_scroll.pack(side="left", fill="y", pady=6)
-        self.report_listbox.config(yscrollcommand=self.list_scroll.set)
+        self.list_scroll = self.report_listbox.scrollbar
         self.report_listbox.bind("<<ListboxSelect>>", self.on_report_select)
 
         btns_frame = tk.Frame(self.list_frame)
@@ -49,6 +82,12 @@ class PersonalTab:
         self.save_btn.pack(fill="x", pady=(6,0))
         self.del_btn = tk.Button(btns_frame, text="업무삭제", command=self.delete_report, state='disabled')
         self.del_btn.pack(fill="x", pady=(6,0))
+        undo_frame = tk.Frame(btns_frame)
+        undo_frame.pack(fill="x", pady=(6,0))
+        self.undo_btn = tk.Button(undo_frame, text="되돌리기", command=self.undo, state='disabled')
+        self.undo_btn.pack(side="left", fill="x", expand=True)
+        self.redo_btn = tk.Button(undo_frame, text="다시실행", command=self.redo, state='disabled')
+        self.redo_btn.pack(side="left", fill="x", expand=True)
 
         # Bottom: input area (category/location/attendees/text/save)
         self.input_frame = tk.Frame(self.frame)
@@ -70,12 +109,21 @@ class PersonalTab:
         self.end_var = tk.BooleanVar(value=False)
         self.end_check = tk.Checkbutton(time_frame, text="종료일 사용", variable=self.end_var, command=self._toggle_end)
         self.end_check.pack(side="left", padx=6)
+        # 새 보고서를 반복 규칙으로 저장 (기존 보고서/반복 항목을 고칠 때는 그 항목만 바뀐다)
+        self.repeat_var = tk.StringVar(value=NO_REPEAT)
+        self.repeat_box = ttk.Combobox(time_frame, textvariable=self.repeat_var, width=8, state='readonly',
+                                       values=[NO_REPEAT] + list(REPEAT_CHOICES))
+        self.repeat_box.pack(side="left")
 
         # Category
         self.cat_label = tk.Label(self.input_frame, text="카테고리")
         self.cat_label.pack(anchor="nw", padx=6, pady=(6, 0))
-        self.cat_entry = ttk.Combobox(self.input_frame, values=self.store.list_categories(), state='normal')
-        self.cat_entry.pack(fill="x", padx=6)
+        cat_frame = tk.Frame(self.input_frame)
+        cat_frame.pack(fill="x", padx=6)
+        self.cat_entry = ttk.Combobox(cat_frame, values=self.store.list_categories(), state='normal')
+        self.cat_entry.pack(side="left", fill="x", expand=True)
+        self.cat_del_btn = tk.Button(cat_frame, text="카테고리삭제", command=self.delete_category)
+        self.cat_del_btn.pack(side="left", padx=(6, 0))
 
         # Location
         self.loc_label = tk.Label(self.input_frame, text="장소")
@@ -99,20 +147,65 @@ class PersonalTab:
         """탭에 추가될 프레임 반환"""
         return self.frame
 
+    def set_store(self, store):
+        """저장소가 바뀌면 (data_dir/storage 설정 변경) 변경 알림 구독도 옮긴다"""
+        self._unsubscribe()
+        self._unsubscribe_undo()
+        self.store = store
+        self._unsubscribe = store.subscribe(self.worker.main_thread(self._on_store_change), owner=self.owner)
+        self._unsubscribe_undo = self._watch_undo()
+
+    # --- 되돌리기 (store.undo가 켜져 있을 때) ---
+    def _watch_undo(self):
+        self._update_undo_buttons()
+        if self.store.undo is None:
+            return lambda: None
+        return self.store.undo.subscribe(self.worker.main_thread(self._update_undo_buttons))
+
+    def _update_undo_buttons(self):
+        log = self.store.undo
+        self.undo_btn.config(state='normal' if log is not None and log.can_undo() else 'disabled')
+        self.redo_btn.config(state='normal' if log is not None and log.can_redo() else 'disabled')
+
+    def _undo_group(self, label):
+        log = self.store.undo
+        return log.group(label) if log is not None else contextlib.nullcontext()
+
+    def undo(self):
+        """저장소의 마지막 변경을 되돌린다 (다른 탭에서 한 변경도 포함, 목록은 변경 알림으로 갱신)"""
+        log = self.store.undo
+        if log is not None and log.undo() is not None:
+            self._save()
+
+    def redo(self):
+        log = self.store.undo
+        if log is not None and log.redo() is not None:
+            self._save()
+
+    def _on_store_change(self, event):
+        if self._editing or self._refresh_pending or self._list_date is None:
+            return
+        if event.touches(self.owner, self._list_date):
+            self._refresh_pending = True
+            self.frame.after_idle(self._refresh_changed)
+
+    def _refresh_changed(self):
+        """변경 알림으로 목록만 다시 읽는다 (편집 중인 입력칸은 그대로, 선택은 id로 유지)"""
+        self._refresh_pending = False
+        if self._list_date is not None:
+            self.load_report_list(self._list_date)
+
     def set_date(self, date):
         """날짜 선택 시 보고서 목록 새로고침"""
         self.current_date = date
         # Set period start to selected date and refresh list
         self.start_entry.delete(0, tk.END)
         self.start_entry.insert(0, date)
-        self.refresh_report_list(date)
-        self.current_index = None
+        self.current_id = None
         self.clear_inputs()
         self.report_listbox.selection_clear(0, tk.END)
         self.del_btn.config(state='disabled')
-        if self.store.has_reports(date, owner=self.owner):
-            self.report_listbox.selection_set(0)
-            self.report_listbox.event_generate("<<ListboxSelect>>")
+        self.load_report_list(date, select_first=True)
 
     def _toggle_end(self):
         if self.end_var.get():
@@ -131,6 +224,8 @@ class PersonalTab:
             self.end_entry.delete(0, tk.END)
             self.end_entry.config(state='disabled')
 
+    @instrumentation.handler
+    @_edits_store
     def save_report(self):
         selected_date = self.start_entry.get().strip()
         if not selected_date:
@@ -156,29 +251,42 @@ class PersonalTab:
 
         key_date = start_date
 
-        if self.current_index is None:
+        location_now = self.store.locate_by_id(self.current_id) if self.current_id else None
+        freq = REPEAT_CHOICES.get(self.repeat_var.get())
+        if location_now is None and freq is not None:
+            # 새 반복 보고서: 규칙만 저장하고 첫 항목을 선택
+            try:
+                rule = self.store.add_rule(freq, report, owner=self.owner)
+            except ValueError as e:
+                messagebox.showerror("반복 보고서", str(e))
+                return
+            self.current_id = rule.occurrence(rule.template.start).id
+            self.repeat_box.config(state='disabled')
+        elif location_now is None:
             # 새 보고서 추가 (저장 키는 시작일)
-            self.current_index = self.store.add_report(key_date, report, owner=self.owner)
-            self.current_orig_date = key_date
+            idx = self.store.add_report(key_date, report, owner=self.owner)
+            self.current_id = self.store.get_report(key_date, idx, owner=self.owner).id
+        elif location_now[1] != key_date:
+            # 날짜 변경: 기존 날짜에서 빼서 새 날짜(저장 키)로 이동, id는 유지 (반복 항목은 새 id)
+            self.current_id = self.store.move_by_id(self.current_id, key_date, report).id
         else:
-            # 보고서 수정 - 실제로 저장된 원래 키(orig_date)를 사용
-            old_date = self.current_orig_date or selected_date
-            if old_date != key_date:
-                # 날짜 변경: 기존 날짜에서 삭제, 새 날짜에 추가
-                self.current_index = self.store.move_report(old_date, key_date, self.current_index, report, owner=self.owner)
-                self.current_orig_date = key_date
-            else:
-                # 같은 원래 키: 업데이트
-                self.store.update_report(key_date, self.current_index, report, owner=self.owner)
-
-        # 새로고침 후, visible list에서 방금 저장된 항목의 인덱스를 찾아 선택
+            # 같은 원래 키: 업데이트 (반복 항목이면 그 날만 따로 저장되어 id가 바뀐다)
+            updated = self.store.update_by_id(self.current_id, report)
+            if updated.id != self.current_id:
+                self.current_id = updated.id
+            elif self._list_date == selected_date and self.current_id in self._visible_reports:
+                # 시작일이 그대로이므로 목록 구성은 같다: 그 행만 고친다
+                self._patch_row(updated)
+                self.cat_entry['values'] = self.store.list_categories()
+                self._save()
+                return
+
+        # 새로고침 후, visible list에서 방금 저장된 항목을 id로 찾아 선택
         self.refresh_report_list(selected_date)
         self.report_listbox.selection_clear(0, tk.END)
         sel_idx = None
-        for i, (ow, orig, idx) in enumerate(self._visible_reports):
-            if orig == (self.current_orig_date or key_date) and idx == self.current_index:
-                sel_idx = i
-                break
+        if self.current_id in self._visible_reports:
+            sel_idx = self._visible_reports.index(self.current_id)
         if sel_idx is not None:
             self.report_listbox.selection_set(sel_idx)
             self.report_listbox.see(sel_idx)
@@ -186,42 +294,94 @@ class PersonalTab:
         self.cat_entry['values'] = self.store.list_categories()
         
         # JSON 파일에 저장
-        self.store.save_to_json()
+        self._save()
+
+    def _save(self):
+        store = self.store
+        self.worker.submit(store.save_to_json)
 
+    @instrumentation.handler
     def refresh_report_list(self, date):
-        self.report_listbox.delete(0, tk.END)
+        """date의 목록을 바로 읽어 표시 (저장 직후처럼 결과를 곧바로 써야 할 때)"""
+        self.worker.cancel(self._list_key)
         found = self.store.find_reports_for_date(date, owner=self.owner)
-        self._visible_reports = []
-        for i, (ow, orig_date, idx, r) in enumerate(found):
-            preview = r.get("content", "").splitlines()[0][:40]
-            start = r.get("start_date", orig_date)
-            end = r.get("end_date", start)
-            if start == end:
-                time_str = f"[{start}] "
-            else:
-                time_str = f"[{start}~{end}] "
-            label = f"{i+1}. {time_str}[{r.get('category','')}] {preview}"
-            self.report_listbox.insert(tk.END, label)
-            self._visible_reports.append((ow, orig_date, idx))
+        self._show_reports(found)
+        self._list_date = date
+
+    def load_report_list(self, date, select_first=False):
+        """date의 목록을 작업 스레드에서 읽어 표시 (그 사이 다른 날짜를 고르면 이 결과는 버려진다)"""
+        store = self.store
+        owner = self.owner
+        self.worker.submit(lambda: store.find_reports_for_date(date, owner=owner),
+                           on_done=lambda found: self._list_loaded(date, found, select_first),
+                           key=self._list_key)
+
+    @instrumentation.handler
+    def _list_loaded(self, date, found, select_first):
+        self._show_reports(found)
+        self._list_date = date
+        if self.current_id in self._visible_reports:
+            self.report_listbox.selection_set(self._visible_reports.index(self.current_id))
+        elif self.current_id is not None:
+            if self.store.locate_by_id(self.current_id) is None:
+                # 편집 중이던 보고서가 다른 곳에서 지워짐: 저장하면 새 보고서로 들어간다
+                self.current_id = None
+                self.del_btn.config(state='disabled')
+        elif select_first and found:
+            self.report_listbox.selection_set(0)
+            self.report_listbox.event_generate("<<ListboxSelect>>")
 
+    def _show_reports(self, found):
+        """(owner, orig_date, idx, report) 목록을 listbox에 표시 (글자는 보이는 행만 만든다)"""
+        self._visible_reports = [r.id for _ow, _orig_date, _idx, r in found]
+        self._row_reports = {r.id: r for _ow, _orig_date, _idx, r in found}
+        self._list_date = None
+        if len(self._label_cache) > 5000:
+            self._label_cache = {}
+        self.report_listbox.set_items(self._visible_reports)
+
+    def _format_row(self, index, report_id):
+        r = self._row_reports.get(report_id)
+        if r is None:
+            return f"{index+1}. "
+        cached = self._label_cache.get(report_id)
+        if cached is None or not (cached[0] is r or cached[0] == r):
+            # 첫 줄만 필요하므로 내용 전체를 나누지 않는다
+            lines = r.content[:41].splitlines()
+            preview = lines[0][:40] if lines else ""
+            if r.start_date == r.end_date:
+                time_str = f"[{r.start_date}] "
+            else:
+                time_str = f"[{r.start_date}~{r.end_date}] "
+            cached = (r, f"{time_str}[{r.category}] {preview}")
+            self._label_cache[report_id] = cached
+        return f"{index+1}. {cached[1]}"
+
+    def _patch_row(self, report):
+        """보이는 목록에서 report 한 행만 바꾼다"""
+        index = self._visible_reports.index(report.id)
+        self._row_reports[report.id] = report
+        self._label_cache.pop(report.id, None)
+        self.report_listbox.refresh_row(index)
+
+    @instrumentation.handler
     def on_report_select(self, event):
         sel = self.report_listbox.curselection()
         if not sel:
             self.del_btn.config(state='disabled')
             return
         index = sel[0]
-        # map visible index -> (owner, orig_date, idx)
+        # map visible index -> report id
         try:
-            ow, orig_date, orig_idx = self._visible_reports[index]
+            report_id = self._visible_reports[index]
         except Exception:
             self.del_btn.config(state='disabled')
             return
 
-        self.current_orig_date = orig_date
-        self.current_index = orig_idx
+        self.current_id = report_id
 
         try:
-            r = self.store.get_report(orig_date, orig_idx, owner=ow)
+            r = self.store.get_by_id(report_id)
         except Exception:
             return
 
@@ -247,6 +407,9 @@ class PersonalTab:
             self.end_var.set(False)
             self.end_entry.delete(0, tk.END)
             self.end_entry.config(state='disabled')
+        rule = self.store.rule_for(report_id)
+        self.repeat_var.set(recurrence.FREQUENCY_LABELS[rule.freq] if rule is not None else NO_REPEAT)
+        self.repeat_box.config(state='disabled')
         
         # Enable delete button
         self.del_btn.config(state='normal')
@@ -257,22 +420,23 @@ class PersonalTab:
         # 여기서는 특별한 처리 필요 없음 (이미 on_report_select에서 로드됨)
         pass
 
+    @_edits_store
     def new_report(self):
         date = self.start_entry.get().strip()
         if not date:
             return
 
         # add empty report under the selected date
-        self.current_index = self.store.add_report(date, {"content":"", "category":"", "location":"", "attendees":"", "start_date":date, "end_date":""}, owner=self.owner)
-        self.current_orig_date = date
+        idx = self.store.add_report(date, {"content":"", "category":"", "location":"", "attendees":"", "start_date":date, "end_date":""}, owner=self.owner)
+        self.current_id = self.store.get_report(date, idx, owner=self.owner).id
         self.refresh_report_list(date)
         self.report_listbox.selection_clear(0, tk.END)
-        # select the last visible item if matches
-        for i, (ow, orig, idx) in enumerate(self._visible_reports):
-            if orig == self.current_orig_date and idx == self.current_index:
-                self.report_listbox.selection_set(i)
-                self.report_listbox.event_generate("<<ListboxSelect>>")
-                break
+        # select the new item if visible
+        if self.current_id in self._visible_reports:
+            i = self._visible_reports.index(self.current_id)
+            self.report_listbox.selection_set(i)
+            self.report_listbox.see(i)
+            self.report_listbox.event_generate("<<ListboxSelect>>")
 
     def create_new_report(self):
         """새로운 빈 보고서 폼 생성"""
@@ -286,29 +450,58 @@ class PersonalTab:
         else:
             self.current_date = current_date
         
-        self.current_index = None
-        self.current_orig_date = None
+        self.current_id = None
         self.clear_inputs()
         self.report_listbox.selection_clear(0, tk.END)
         self.del_btn.config(state='disabled')
 
+    @_edits_store
     def delete_report(self):
         sel = self.report_listbox.curselection()
         if not sel:
             return
         idx = sel[0]
         try:
-            ow, orig_date, orig_idx = self._visible_reports[idx]
+            report_id = self._visible_reports[idx]
         except Exception:
             return
-        self.store.delete_report(orig_date, orig_idx, owner=ow)
+        rule = self.store.rule_for(report_id)
+        if rule is None:
+            self.store.delete_by_id(report_id)
+        else:
+            answer = messagebox.askyesnocancel(
+                "반복 보고서 삭제", "이 날 항목만 삭제할까요?\n'아니오'를 누르면 반복 규칙 전체를 삭제합니다.")
+            if answer is None:
+                return
+            if answer:
+                self.store.delete_by_id(report_id)
+            else:
+                self.store.delete_rule(rule.id)
         self.refresh_report_list(self.start_entry.get().strip())
-        self.current_index = None
+        self.current_id = None
         self.clear_inputs()
         self.del_btn.config(state='disabled')
         
         # JSON 파일에 저장
-        self.store.save_to_json()
+        self._save()
+
+    @_edits_store
+    def delete_category(self):
+        """선택한 카테고리를 목록에서 삭제 (해당 보고서들의 카테고리는 비워짐)"""
+        category = self.cat_entry.get().strip()
+        if not category or category not in self.store.category_counts():
+            return
+        if not messagebox.askyesno("카테고리 삭제", f"'{category}' 카테고리를 삭제할까요?\n이 카테고리를 쓰던 보고서는 카테고리가 비워집니다."):
+            return
+        # 비워진 보고서들을 한 번에 되돌릴 수 있도록 한 단계로 묶는다
+        with self._undo_group("카테고리 삭제"):
+            self.store.delete_category(category)
+        self.cat_entry['values'] = self.store.list_categories()
+        self.cat_entry.set("")
+        self.refresh_report_list(self.current_date or self.start_entry.get().strip())
+
+        # JSON 파일에 저장
+        self._save()
 
     def clear_inputs(self):
         self.cat_entry.set("")
@@ -327,12 +520,50 @@ class PersonalTab:
         self.end_entry.delete(0, tk.END)
         self.end_entry.config(state='disabled')
         self.end_var.set(False)
+        self.repeat_var.set(NO_REPEAT)
+        self.repeat_box.config(state='readonly')
 
 
 class SharedTab(PersonalTab):
-    """공통업무(Shared) 탭 — PersonalTab UI/동작을 공유합니다."""
-    def __init__(self, parent, store):
-        super().__init__(parent, store, owner="shared")
+    """공통업무(Shared) 탭 — PersonalTab UI/동작을 공유하고 검색창을 추가합니다."""
+    def __init__(self, parent, store, worker=None):
+        super().__init__(parent, store, owner="shared", worker=worker)
+
+    def _build_ui(self):
+        super()._build_ui()
+        # 검색창 (목록 위)
+        search_frame = tk.Frame(self.frame)
+        search_frame.pack(side="top", fill="x", before=self.list_frame)
+        self.search_entry = tk.Entry(search_frame)
+        self.search_entry.pack(side="left", fill="x", expand=True, padx=(6, 0), pady=(6, 0))
+        self.search_entry.bind("<Return>", lambda e: self.run_search())
+        self.search_all_var = tk.BooleanVar(value=False)
+        self.search_all_check = tk.Checkbutton(search_frame, text="개인업무 포함", variable=self.search_all_var)
+        self.search_all_check.pack(side="left", padx=6, pady=(6, 0))
+        self.search_btn = tk.Button(search_frame, text="검색", command=self.run_search)
+        self.search_btn.pack(side="left", padx=(0, 6), pady=(6, 0))
+
+    def run_search(self):
+        """검색어가 있으면 결과를 목록에 표시, 비어 있으면 선택한 날짜 목록으로 복귀"""
+        query = self.search_entry.get().strip()
+        if not query:
+            self.list_label.config(text="공통업무 목록")
+            self.load_report_list(self.current_date or self.start_entry.get().strip())
+            return
+        owner = None if self.search_all_var.get() else self.owner
+        store = self.store
+        # 날짜 목록과 같은 key: 검색 중에 날짜를 고르면 검색 결과는 버려진다
+        self.worker.submit(lambda: store.search(query, owner=owner), on_done=self._show_search, key=self._list_key)
+
+    def _show_search(self, found):
+        self.list_label.config(text=f"검색 결과 ({len(found)}건)")
+        self._show_reports(found)
+        self.current_id = None
+        self.del_btn.config(state='disabled')
+
+    def set_date(self, date):
+        self.list_label.config(text="공통업무 목록")
+        super().set_date(date)
 
 
 # 호환을 위해 CommonTab 별칭 유지
@@ -340,32 +571,234 @@ CommonTab = SharedTab
 
 
 class WeeklyTab:
-    """개인주간업무보고 탭 (이전 StatisticsTab)"""
-    def __init__(self, parent, store):
+    """개인주간업무보고 탭 (이전 StatisticsTab)
+    선택한 날짜가 속한 주(월~일)의 집계와 개인업무 목록을 보여주고, 이전/다음 주로 넘길 수 있다.
+    """
+    def __init__(self, parent, store, worker=None):
         self.store = store
+        self.worker = worker or InlineWorker()
         self.parent = parent
         self.frame = tk.Frame(parent)
+        self._week_key = (self, "week")
+        self.week_start = None  # 표시 중인 주의 월요일 (datetime.date)
+        self._stale = False     # 표시 중인 주의 보고서가 바뀜 (보일 때 다시 그린다)
         self._build_ui()
+        self.set_date(datetime.date.today().strftime("%Y-%m-%d"))
+        self._unsubscribe = store.subscribe(self.worker.main_thread(self._on_store_change))
 
     def _build_ui(self):
-        label = tk.Label(self.frame, text="준비 중", font=("Arial", 14))
-        label.pack(expand=True)
+        nav_frame = tk.Frame(self.frame)
+        nav_frame.pack(side="top", fill="x", padx=6, pady=(6, 0))
+        self.prev_btn = tk.Button(nav_frame, text="◀", width=3, command=lambda: self.move_week(-1))
+        self.prev_btn.pack(side="left")
+        self.week_label = tk.Label(nav_frame, text="", font=("Arial", 12))
+        self.week_label.pack(side="left", expand=True)
+        self.next_btn = tk.Button(nav_frame, text="▶", width=3, command=lambda: self.move_week(1))
+        self.next_btn.pack(side="left")
+        self.xlsx_btn = tk.Button(nav_frame, text="엑셀 저장", command=self.export_xlsx)
+        self.xlsx_btn.pack(side="left", padx=(6, 0))
+
+        self.summary_label = tk.Label(self.frame, text="", anchor="w", justify="left")
+        self.summary_label.pack(side="top", fill="x", padx=6, pady=(6, 0))
+
+        self.text = tk.Text(self.frame, height=10, state='disabled')
+        self.text.pack(side="top", fill="both", expand=True, padx=6, pady=6)
+
+        # 숨어 있는 동안 표시 중인 주가 바뀌었으면 돌아올 때 다시 표시 (집계는 저장소가 미리 갱신해 둠)
+        self.frame.bind("<Map>", lambda e: self._refresh_if_stale())
 
     def get_frame(self):
         return self.frame
 
+    def set_store(self, store):
+        self._unsubscribe()
+        self.store = store
+        self._unsubscribe = store.subscribe(self.worker.main_thread(self._on_store_change))
+        self._stale = True
+
+    def _on_store_change(self, event):
+        if self.week_start is None or self._stale:
+            return
+        week_end = self.week_start + datetime.timedelta(days=6)
+        if event.touches(start=self.week_start.strftime("%Y-%m-%d"), end=week_end.strftime("%Y-%m-%d")):
+            self._stale = True
+            if self.frame.winfo_ismapped():
+                self.frame.after_idle(self._refresh_if_stale)
+
+    def _refresh_if_stale(self):
+        if self._stale:
+            self.refresh()
+
+    def set_date(self, date):
+        """date('YYYY-MM-DD')가 속한 주로 이동"""
+        try:
+            day = datetime.datetime.strptime(date, "%Y-%m-%d").date()
+        except Exception:
+            return
+        self.week_start = day - datetime.timedelta(days=day.weekday())
+        self.refresh()
+
+    def move_week(self, delta):
+        if self.week_start is None:
+            return
+        self.week_start += datetime.timedelta(weeks=delta)
+        self.refresh()
+
+    def refresh(self):
+        """표시 중인 주의 집계와 개인업무를 작업 스레드에서 읽어 표시"""
+        if self.week_start is None:
+            return
+        self._stale = False
+        week_start = self.week_start
+        store = self.store
+        self.worker.submit(lambda: self._read_week(store, week_start),
+                           on_done=lambda data: self._show_week(week_start, *data), key=self._week_key)
+
+    @staticmethod
+    def _read_week(store, week_start):
+        year, week, _ = week_start.isocalendar()
+        week_end = week_start + datetime.timedelta(days=6)
+        summary = store.week_summary(year, week)
+        found = store.find_reports_in_range(
+            week_start.strftime("%Y-%m-%d"), week_end.strftime("%Y-%m-%d"), owner="personal")
+        return summary, found
+
+    def _show_week(self, week_start, summary, found):
+        year, week, _ = week_start.isocalendar()
+        week_end = week_start + datetime.timedelta(days=6)
+        self.week_label.config(text=f"{year}년 {week}주차 ({week_start:%m-%d} ~ {week_end:%m-%d})")
+
+        by_owner = summary["by_owner"]
+        lines = [f"개인업무 {by_owner.get('personal', 0)}건 · 공통업무 {by_owner.get('shared', 0)}건"
+                 f" · 업무가 있는 날 {summary['days_covered']}/7일"]
+        if summary["categories"]:
+            lines.append("카테고리: " + ", ".join(f"{c} {n}" for c, n in summary["categories"].items()))
+        self.summary_label.config(text="\n".join(lines))
+
+        # 개인업무를 날짜별로 (여러 날에 걸친 업무는 처음 나오는 날에만)
+        shown = set()
+        out = []
+        for day, entries in found.items():
+            new = [r for _ow, _orig, _idx, r in entries if r.id not in shown]
+            if not new:
+                continue
+            out.append(f"[{day}]")
+            for r in new:
+                shown.add(r.id)
+                period = r.start_date if r.start_date == r.end_date else f"{r.start_date}~{r.end_date}"
+                category = f"[{r.category}] " if r.category else ""
+                first_line = r.content.splitlines()[0] if r.content else ""
+                out.append(f"  - {category}{first_line} ({period})")
+        self.text.config(state='normal')
+        self.text.delete("1.0", tk.END)
+        self.text.insert(tk.END, "\n".join(out) if out else "이번 주 개인업무가 없습니다.")
+        self.text.config(state='disabled')
+
+    def export_xlsx(self):
+        """표시 중인 주를 config의 weekly_report_dir.xlsx_dir에 엑셀로 저장"""
+        if self.week_start is None:
+            return
+        import xlsx_export
+        year, week, _ = self.week_start.isocalendar()
+        store = self.store
+        self.xlsx_btn.config(state='disabled')
+        self.worker.submit(lambda: xlsx_export.export_week(store, year, week),
+                           on_done=self._export_done, on_error=self._export_failed)
+
+    def _export_done(self, path):
+        self.xlsx_btn.config(state='normal')
+        messagebox.showinfo("엑셀 저장", f"저장했습니다.\n{path}")
+
+    def _export_failed(self, error):
+        self.xlsx_btn.config(state='normal')
+        messagebox.showerror("엑셀 저장", f"저장 실패: {error}")
+
 
 class SpareTab:
-    """예비 탭 (이전 SettingsTab)"""
-    def __init__(self, parent, store):
+    """예비 탭 (이전 SettingsTab) — 성능 계측/프로파일 도구"""
+    def __init__(self, parent, store, worker=None):
         self.store = store
+        self.worker = worker or InlineWorker()
         self.parent = parent
         self.frame = tk.Frame(parent)
         self._build_ui()
 
     def _build_ui(self):
-        label = tk.Label(self.frame, text="준비 중", font=("Arial", 14))
-        label.pack(expand=True)
+        controls = tk.Frame(self.frame)
+        controls.pack(side="top", fill="x", padx=6, pady=(6, 0))
+        self.instrument_var = tk.BooleanVar(value=instrumentation.enabled())
+        self.instrument_check = tk.Checkbutton(controls, text="성능 계측", variable=self.instrument_var,
+                                               command=self.toggle_instrumentation)
+        self.instrument_check.pack(side="left")
+        self.profile_btn = tk.Button(controls, text="프로파일 시작", command=self.toggle_profile)
+        self.profile_btn.pack(side="left", padx=(6, 0))
+        self.export_btn = tk.Button(controls, text="결과 저장", command=self.export_results)
+        self.export_btn.pack(side="left", padx=(6, 0))
+        self.refresh_btn = tk.Button(controls, text="새로고침", command=self.refresh)
+        self.refresh_btn.pack(side="left", padx=(6, 0))
+        self.reset_btn = tk.Button(controls, text="초기화", command=self.reset)
+        self.reset_btn.pack(side="left", padx=(6, 0))
+
+        self.text = tk.Text(self.frame, height=10, state='disabled', font=("Courier", 9))
+        self.text.pack(side="top", fill="both", expand=True, padx=6, pady=6)
+        self.frame.bind("<Map>", lambda e: self.refresh())
 
     def get_frame(self):
         return self.frame
+
+    def _output_dir(self):
+        import app_config
+        return app_config.data_dir() / "profiles"
+
+    def toggle_instrumentation(self):
+        on = self.instrument_var.get()
+        if on:
+            instrumentation.instrument_store(self.store)
+        instrumentation.set_enabled(on)
+        self.refresh()
+
+    def toggle_profile(self):
+        if instrumentation.profiling():
+            path = self._output_dir() / f"profile-{datetime.datetime.now():%Y%m%d-%H%M%S}.prof"
+            try:
+                summary = instrumentation.stop_profile(path)
+            except Exception as e:
+                messagebox.showerror("프로파일", f"저장 실패: {e}")
+                return
+            finally:
+                self.profile_btn.config(text="프로파일 시작")
+            self._show(f"프로파일 저장: {path}\n\n{summary}")
+        else:
+            instrumentation.start_profile()
+            self.profile_btn.config(text="프로파일 중지")
+            self._show("프로파일 수집 중... 느린 동작을 재현한 뒤 '프로파일 중지'를 누르세요.")
+
+    def export_results(self):
+        path = self._output_dir() / f"instrumentation-{datetime.datetime.now():%Y%m%d-%H%M%S}.json"
+        self.worker.submit(lambda: instrumentation.export(path),
+                           on_done=lambda p: messagebox.showinfo("결과 저장", f"저장했습니다.\n{p}"),
+                           on_error=lambda e: messagebox.showerror("결과 저장", f"저장 실패: {e}"))
+
+    def reset(self):
+        instrumentation.recorder().reset()
+        self.refresh()
+
+    def refresh(self):
+        if instrumentation.profiling():
+            return
+        if not instrumentation.enabled():
+            self._show("성능 계측이 꺼져 있습니다. '성능 계측'을 켜면 저장소 호출과 화면 처리 시간을 모읍니다.")
+            return
+        lines = instrumentation.summary_lines() or ["아직 기록이 없습니다."]
+        slow = list(instrumentation.recorder().slow_calls)[-10:]
+        if slow:
+            lines.append("")
+            lines.append(f"기준({instrumentation.recorder().frame_budget_ms}ms)을 넘긴 처리 (최근 {len(slow)}건)")
+            lines.extend(f"  {t}  {name}  {ms}ms" for t, name, ms in slow)
+        self._show("\n".join(lines))
+
+    def _show(self, text):
+        self.text.config(state='normal')
+        self.text.delete("1.0", tk.END)
+        self.text.insert(tk.END, text)
+        self.text.config(state='disabled')
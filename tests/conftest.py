@@ -0,0 +1,49 @@
+"""테스트 공용 fixture: 임시 폴더에 저장소를 연다 (config.json은 읽지 않음, 자동 저장 없음)"""
+from pathlib import Path
+
+import pytest
+
+from report_store import ReportStore
+
+BACKENDS = ("json", "sqlite", "sharded", "snapshot")
+
+
+def open_backend(backend, folder, **kwargs):
+    folder = Path(folder)
+    json_file = folder / "data.json"
+    if backend == "sqlite":
+        from sqlite_store import SqliteReportStore
+        return SqliteReportStore(folder / "reports.db", json_file=json_file, config={}, **kwargs)
+    if backend == "sharded":
+        from sharded_store import ShardedReportStore
+        return ShardedReportStore(folder / "shards", json_file=json_file, config={}, save_delay=0, **kwargs)
+    if backend == "snapshot":
+        from snapshot_store import SnapshotReportStore
+        return SnapshotReportStore(folder / "data.snap", json_file=json_file, config={}, save_delay=0, **kwargs)
+    kwargs.setdefault("journal", False)
+    return ReportStore(json_file, save_delay=0, config={}, **kwargs)
+
+
+def close_store(store):
+    close = getattr(store, "close", None)
+    if close is not None:
+        close()
+
+
+@pytest.fixture(params=BACKENDS)
+def backend(request):
+    return request.param
+
+
+@pytest.fixture
+def open_store(tmp_path, backend):
+    """open_store()로 같은 폴더의 저장소를 열고 (다시 열기 포함) 끝나면 모두 닫는다"""
+    opened = []
+
+    def _open(**kwargs):
+        store = open_backend(backend, tmp_path, **kwargs)
+        opened.append(store)
+        return store
+    yield _open
+    for store in opened:
+        close_store(store)
@@ -0,0 +1,52 @@
+import json
+import os
+
+from app_config import ConfigService, DEFAULT_CONFIG, calendar_config
+
+
+def _write(path, config, mtime):
+    path.write_text(json.dumps(config), encoding="utf-8")
+    os.utime(path, ns=(mtime, mtime))
+
+
+def test_subscriber_with_several_keys_called_once(tmp_path):
+    path = tmp_path / "config.json"
+    _write(path, {"data_dir": "a", "storage": {"backend": "json"}}, 1_000_000_000)
+    service = ConfigService([path])
+    service.get()
+    calls = []
+    service.subscribe(calls.append, ("data_dir", "storage"))
+    calendar_calls = []
+    service.subscribe(calendar_calls.append, "calendar")
+
+    _write(path, {"data_dir": "b", "storage": {"backend": "sqlite"}}, 2_000_000_000)
+    assert service.check()
+    assert [cfg["data_dir"] for cfg in calls] == ["b"]
+    assert calendar_calls == []
+
+    _write(path, {"data_dir": "b", "storage": {"backend": "sqlite"}, "name": "x"}, 3_000_000_000)
+    assert service.check()
+    assert len(calls) == 1
+
+
+def test_calendar_config_migrates_baseline_week_colors():
+    baseline = {"calendar": {
+        "thisweek": {"background": "#FFFFFF", "foreground": "#FFFFFF"},
+        "nextweek": {"background": "#167FFF", "foreground": "#167FFF"},
+        "nextnextweek": {"background": "#167FFF", "foreground": "#167FFF"},
+    }}
+    merged = calendar_config(baseline)
+    for tag in ("thisweek", "nextweek", "nextnextweek"):
+        assert merged[tag] == DEFAULT_CONFIG["calendar"][tag]
+
+
+def test_calendar_config_drops_foreground_equal_to_background():
+    merged = calendar_config({"calendar": {
+        "nextweek": {"background": "#123456", "foreground": "#123456 "},
+        "today": {"foreground": "#00FF00"},
+    }})
+    assert merged["nextweek"] == {"background": "#123456"}
+    assert merged["today"] == {"foreground": "#00FF00"}
+    for tag in ("thisweek", "nextweek", "nextnextweek", "today"):
+        options = merged[tag]
+        assert options.get("foreground", "").lower() != options.get("background", "-").lower()
@@ -0,0 +1,59 @@
+"""저장소 종류(json/sqlite/sharded/snapshot)와 상관없이 조회 결과가 같아야 한다"""
+
+
+def _populate(store):
+    store.add_report("2026-01-05", {"content": "jan", "category": "회의", "start_date": "2026-01-05"})
+    store.add_report("2026-01-10", {"content": "long", "start_date": "2026-01-10", "end_date": "2026-03-02"})
+    store.add_report("2026-02-14", {"content": "shared", "start_date": "2026-02-14"}, owner="shared")
+    store.add_report("2026-04-01", {"content": "apr", "category": "출장", "start_date": "2026-04-01",
+                                    "end_date": "2026-04-03"})
+    moved = store.find_reports_for_date("2026-01-05")[0][3]
+    store.move_by_id(moved.id, "2026-05-20")
+    return moved.id
+
+
+def _contents(results):
+    return sorted(r.content for *_rest, r in results)
+
+
+def _range_contents(store, start, end, owner=None):
+    # find_reports_in_range는 날짜별 목록이므로 보고서 하나로 모은다
+    found = {r.id: r for day in store.find_reports_in_range(start, end, owner).values() for *_rest, r in day}
+    return sorted(r.content for r in found.values())
+
+
+def _check_queries(store):
+    assert _contents(store.find_reports_for_date("2026-02-14")) == ["long", "shared"]
+    assert _contents(store.find_reports_for_date("2026-04-02")) == ["apr"]
+    assert _range_contents(store, "2026-03-01", "2026-03-31") == ["long"]
+    assert _range_contents(store, "2026-02-01", "2026-02-28", owner="personal") == ["long"]
+    assert _contents(store.iter_reports(start="2026-04-01", end="2026-12-31")) == ["apr"]
+    assert _contents(store.iter_reports()) == ["apr", "jan", "long", "shared"]
+    assert store.category_counts() == {"회의": 1, "출장": 1}
+
+
+def test_queries_match_across_backends(open_store):
+    store = open_store()
+    _populate(store)
+    _check_queries(store)
+    store.save_to_json()
+    store.close()
+    _check_queries(open_store())
+
+
+def test_off_key_reports_found_after_reopen(open_store):
+    """move_by_id/update_by_id로 시작일이 저장 키와 다른 달이 되어도 시작일로 찾을 수 있어야 한다"""
+    store = open_store()
+    report_id = _populate(store)
+    # 저장 키는 5월이지만 시작일은 1월
+    assert _contents(store.find_reports_for_date("2026-01-05")) == ["jan"]
+    store.update_by_id(report_id, {"content": "jan", "category": "회의", "start_date": "2026-09-01"})
+    store.save_to_json()
+    store.close()
+
+    store = open_store()
+    assert _contents(store.find_reports_for_date("2026-01-05")) == []
+    assert _contents(store.find_reports_for_date("2026-09-01")) == ["jan"]
+    assert _range_contents(store, "2026-08-15", "2026-09-15") == ["jan"]
+    assert _contents(store.iter_reports(start="2026-09-01", end="2026-09-30")) == ["jan"]
+    assert store.get_by_id(report_id).start_date == "2026-09-01"
@@ -0,0 +1,35 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "benchmarks"))
+
+import bench_store  # noqa: E402
+import synthetic  # noqa: E402
+
+
+def test_synthetic_history_is_deterministic():
+    first = list(synthetic.generate(50, seed=3))
+    assert first == list(synthetic.generate(50, seed=3))
+    assert first != list(synthetic.generate(50, seed=4))
+    assert all(d == r["start_date"] <= r["end_date"] <= "2026-12-31" for _ow, d, r in first)
+    assert {ow for ow, _d, _r in first} == {"personal", "shared"}
+
+
+def test_compare_flags_only_real_regressions():
+    baseline = {"find": {"p50": 1.0, "p95": 2.0, "peak_kb": 100}, "tiny": {"p50": 0.01, "p95": 0.01}}
+    current = {"find": {"p50": 1.2, "p95": 3.5, "peak_kb": 400}, "tiny": {"p50": 0.05, "p95": 0.05},
+               "new": {"p50": 9.0, "p95": 9.0}}
+    assert bench_store.compare(current, baseline, 1.5) == [("find", "p95", 2.0, 3.5), ("find", "peak_kb", 100, 400)]
+
+
+@pytest.mark.parametrize("backend", ["json", "sqlite", "sharded", "snapshot"])
+def test_run_size_smoke(backend, monkeypatch):
+    monkeypatch.setattr(bench_store, "QUERY_SAMPLES", 20)
+    monkeypatch.setattr(bench_store, "MUTATION_SAMPLES", 10)
+    monkeypatch.setattr(bench_store, "IO_REPEATS", 2)
+    results = bench_store.run_size(backend, 100)
+    assert set(results) == {"load_from_json", "find_reports_for_date", "list_categories",
+                            "list_categories_by_frequency", "add_report", "move_report", "save_to_json"}
+    assert all(stats["p50"] <= stats["p95"] <= stats["max"] for stats in results.values())
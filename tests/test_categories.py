@@ -0,0 +1,40 @@
+def _add(store, day, category, owner="personal"):
+    store.add_report(f"2026-09-{day:02d}", {"content": str(day), "category": category,
+                                            "start_date": f"2026-09-{day:02d}"}, owner=owner)
+
+
+def test_counts_follow_edits(open_store):
+    store = open_store()
+    _add(store, 1, "회의")
+    _add(store, 2, "회의")
+    _add(store, 3, "출장", owner="shared")
+    _add(store, 4, "")
+    assert store.category_counts() == {"회의": 2, "출장": 1}
+    assert store.list_categories() == ["출장", "회의"]
+    assert store.list_categories(by_frequency=True) == ["회의", "출장"]
+
+    r = store.list_reports_for("2026-09-01")[0]
+    store.update_by_id(r.id, {"content": "1", "category": "교육", "start_date": "2026-09-01"})
+    store.delete_by_id(store.list_reports_for("2026-09-03", owner="shared")[0].id)
+    assert store.category_counts() == {"회의": 1, "교육": 1}
+    store.save_to_json()
+    store.close()
+
+    store = open_store()
+    assert store.category_counts() == {"회의": 1, "교육": 1}
+
+
+def test_delete_category_clears_reports(open_store):
+    store = open_store()
+    _add(store, 1, "회의")
+    _add(store, 2, "회의", owner="shared")
+    _add(store, 3, "교육")
+    assert store.delete_category("회의") == 2
+    assert store.delete_category("없음") == 0
+    assert store.category_counts() == {"교육": 1}
+    assert [r.category for *_rest, r in store.find_reports_for_date("2026-09-02")] == [""]
+    store.save_to_json()
+    store.close()
+
+    store = open_store()
+    assert store.list_categories() == ["교육"]
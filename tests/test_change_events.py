@@ -0,0 +1,77 @@
+def test_events_for_each_change(open_store):
+    store = open_store()
+    events = []
+    shared_events = []
+    store.subscribe(events.append)
+    store.subscribe(shared_events.append, owner="shared")
+
+    store.add_report("2026-03-02", {"content": "a", "start_date": "2026-03-02", "end_date": "2026-03-03"})
+    report = store.list_reports_for("2026-03-02")[0]
+    store.update_by_id(report.id, {"content": "a2", "start_date": "2026-03-02", "end_date": "2026-03-03"})
+    store.move_by_id(report.id, "2026-03-05", {"content": "a2", "start_date": "2026-03-05"}, new_owner="shared")
+    store.delete_by_id(report.id)
+
+    assert [e.kind for e in events] == ["added", "updated", "moved", "deleted"]
+    assert all(e.report_id == report.id for e in events)
+    moved = events[2]
+    assert (moved.owner, moved.date, moved.old_owner, moved.old_date) == ("shared", "2026-03-05", "personal", "2026-03-02")
+    assert moved.date_range() == ("2026-03-02", "2026-03-05")
+    assert moved.touches("personal", "2026-03-03") and moved.touches("shared", "2026-03-05")
+    assert not moved.touches("personal", "2026-03-04")
+    assert [e.kind for e in shared_events] == ["moved", "deleted"]
+
+
+def test_unsubscribe_and_failing_listener(open_store, capsys):
+    store = open_store()
+    seen = []
+
+    def broken(event):
+        raise RuntimeError("boom")
+    store.subscribe(broken)
+    unsubscribe = store.subscribe(seen.append)
+    store.add_report("2026-03-02", {"content": "a", "start_date": "2026-03-02"})
+    unsubscribe()
+    store.add_report("2026-03-03", {"content": "b", "start_date": "2026-03-03"})
+    assert [e.date for e in seen] == ["2026-03-02"]
+    assert "변경 알림 처리 실패: boom" in capsys.readouterr().out
+
+
+def test_rule_changes_emit_rule_events(open_store):
+    store = open_store()
+    events = []
+    store.subscribe(events.append)
+    rule = store.add_rule("weekly", {"content": "회의", "start_date": "2026-03-02"}, until="2026-03-30")
+    store.skip_occurrence(rule.id, "2026-03-09")
+    assert [e.kind for e in events] == ["rule", "deleted"]
+    assert events[0].date_range() == ("2026-03-02", "2026-03-30")
+    assert events[1].report_id == f"{rule.id}@2026-03-09"
+
+
+def _lock_is_free(store):
+    import threading
+    got = []
+
+    def probe():
+        if store._lock.acquire(timeout=2):
+            got.append(True)
+            store._lock.release()
+    t = threading.Thread(target=probe)
+    t.start()
+    t.join()
+    return bool(got)
+
+
+def test_listeners_run_after_the_lock_is_released(open_store):
+    store = open_store()
+    free = []
+    immediate = []
+    store.subscribe(lambda e: free.append((e.kind, _lock_is_free(store))))
+    store.subscribe(lambda e: immediate.append(e.kind), immediate=True)
+    store.add_report("2026-03-02", {"content": "a", "category": "회의", "start_date": "2026-03-02"})
+    store.add_report("2026-03-03", {"content": "b", "category": "회의", "start_date": "2026-03-03"})
+    with store._lock:
+        store.delete_category("회의")
+        # 잠금 안에서는 immediate 구독자만 불린다
+        assert [kind for kind, _free in free] == ["added", "added"]
+        assert immediate == ["added", "added", "updated", "updated"]
+    assert free == [("added", True), ("added", True), ("updated", True), ("updated", True)]
@@ -0,0 +1,83 @@
+import json
+
+import pytest
+
+import instrumentation
+from report_store import ReportStore
+
+
+@pytest.fixture
+def recorder(monkeypatch):
+    rec = instrumentation.recorder()
+    monkeypatch.setattr(rec, "enabled", True)
+    monkeypatch.setattr(rec, "frame_budget_ms", 16)
+    rec.reset()
+    yield rec
+    rec.reset()
+
+
+def test_percentiles_from_buckets(recorder):
+    for ms in (0.05, 0.2, 0.2, 3.0, 40.0):
+        recorder.record("op", ms)
+    recorder.record("op", 1.0, error=True)
+    stats = recorder.stats()["op"]
+    assert (stats["count"], stats["errors"], stats["max_ms"]) == (6, 1, 40.0)
+    assert stats["p50_ms"] == 0.25 and stats["p95_ms"] == 40.0
+    assert stats["histogram"] == {"<=0.1": 1, "<=0.25": 2, "<=1": 1, "<=5": 1, "<=50": 1}
+
+
+def test_store_methods_and_handlers_are_timed(recorder, tmp_path, capsys):
+    store = ReportStore(tmp_path / "data.json", journal=False, save_delay=0, config={})
+    instrumentation.instrument_store(store)
+    instrumentation.instrument_store(store)
+    store.add_report("2026-03-02", {"content": "a", "start_date": "2026-03-02"})
+    store.find_reports_for_date("2026-03-02")
+    with pytest.raises(KeyError):
+        store.get_by_id("missing")
+
+    class View:
+        @instrumentation.handler
+        def on_click(self, slow):
+            if slow:
+                recorder.frame_budget_ms = -1
+            return "done"
+    assert View().on_click(False) == "done"
+    assert View().on_click(True) == "done"
+
+    stats = recorder.stats()
+    assert stats["store.add_report"]["count"] == 1
+    assert stats["store.get_by_id"]["errors"] == 1
+    assert stats["View.on_click"]["count"] == 2
+    assert [name for _t, name, _ms in recorder.slow_calls] == ["View.on_click"]
+    assert "느린 처리: View.on_click" in capsys.readouterr().out
+    path = instrumentation.export(tmp_path / "out" / "stats.json")
+    assert json.loads(open(path, encoding="utf-8").read())["stats"]["store.add_report"]["count"] == 1
+    store.close()
+
+
+def test_disabled_records_nothing(tmp_path, monkeypatch):
+    rec = instrumentation.recorder()
+    monkeypatch.setattr(rec, "enabled", False)
+    rec.reset()
+    store = instrumentation.instrument_store(
+        ReportStore(tmp_path / "data.json", journal=False, save_delay=0, config={}))
+    store.list_categories()
+    assert rec.stats() == {}
+    assert instrumentation.configure({"instrumentation": {"enabled": True, "frame_budget_ms": 8}}) is True
+    assert rec.frame_budget_ms == 8
+    instrumentation.configure({}, enabled=False)
+    store.close()
+
+
+def test_close_drops_exit_hook_of_instrumented_store(tmp_path, monkeypatch):
+    import report_store
+    hooks = []
+    monkeypatch.setattr(report_store.atexit, "register", hooks.append)
+    # atexit.unregister처럼 같은(==) 함수만 지운다
+    monkeypatch.setattr(report_store.atexit, "unregister", lambda func: hooks.remove(func) if func in hooks else None)
+    store = ReportStore(tmp_path / "data.json", journal=False, save_delay=60, config={})
+    instrumentation.instrument_store(store)
+    assert store.flush != ReportStore.flush.__get__(store)
+    assert len(hooks) == 1
+    store.close()
+    assert hooks == []
@@ -0,0 +1,44 @@
+from report_store import ReportStore, _IntervalIndex
+
+
+def test_overlapping_uses_span_window():
+    index = _IntervalIndex()
+    index.add(10, 12, "a")
+    index.add(11, 11, "b")
+    index.add(20, 25, "c")
+    assert index.overlapping(11, 11) == ["a", "b"]
+    assert index.overlapping(13, 19) == []
+    assert index.overlapping(24, 30) == ["c"]
+
+
+def test_max_span_shrinks_when_longest_removed():
+    index = _IntervalIndex()
+    long_key = index.add(10, 100, "long")
+    other = index.add(50, 52, "b")
+    index.add(60, 63, "c")
+    assert index._max_span == 90
+    index.remove(long_key)
+    assert index._max_span == 3
+    assert index.overlapping(51, 51) == ["b"]
+    index.remove(other)
+    assert index._max_span == 3
+    assert len(index) == 1
+
+
+def test_max_span_kept_while_same_span_remains():
+    index = _IntervalIndex()
+    first = index.add(0, 30, "a")
+    index.add(100, 130, "b")
+    index.remove(first)
+    assert index._max_span == 30
+    assert index.overlapping(120, 120) == ["b"]
+
+
+def test_store_point_query_after_long_report_deleted(tmp_path):
+    store = ReportStore(tmp_path / "data.json", journal=False, save_delay=0, config={})
+    store.add_report("2026-01-01", {"content": "long", "start_date": "2026-01-01", "end_date": "2026-12-31"})
+    store.add_report("2026-06-01", {"content": "day", "start_date": "2026-06-01"})
+    long_id = store.find_reports_for_date("2026-01-01")[0][3].id
+    store.delete_by_id(long_id)
+    assert [r.content for *_, r in store.find_reports_for_date("2026-06-01")] == ["day"]
+    assert store._index["personal"]._max_span == 0
@@ -0,0 +1,145 @@
+"""journal 모드: 변경분만 data.journal에 덧붙이고, 다시 열 때 재생하며, 스냅샷으로 압축한다"""
+import json
+
+from report_store import ReportStore
+
+
+def _open(tmp_path, **kwargs):
+    return ReportStore(tmp_path / "data.json", journal=True, save_delay=0, config={}, **kwargs)
+
+
+def _state(store):
+    return sorted((ow, d, r.id, r.content, r.start_date, r.end_date) for ow, d, r in store.iter_reports())
+
+
+def _edit(store):
+    store.add_report("2026-02-02", {"content": "a", "start_date": "2026-02-02"})
+    store.add_report("2026-02-03", {"content": "b", "start_date": "2026-02-03"})
+    store.add_report("2026-02-04", {"content": "c", "start_date": "2026-02-04"}, owner="shared")
+    b = store.list_reports_for("2026-02-03")[0]
+    store.update_by_id(b.id, {"content": "b2", "start_date": "2026-02-03", "end_date": "2026-02-05"})
+    store.move_report("2026-02-04", "2026-02-06", 0, {"content": "c2", "start_date": "2026-02-06"},
+                      owner="shared", new_owner="personal")
+    store.delete_report("2026-02-02", 0)
+    store.save_to_json()
+
+
+def test_replay_restores_edits(tmp_path):
+    store = _open(tmp_path)
+    _edit(store)
+    expected = _state(store)
+    store.close()
+    assert not (tmp_path / "data.json").exists()
+    assert len((tmp_path / "data.journal").read_text(encoding="utf-8").splitlines()) == 6
+
+    store = _open(tmp_path)
+    try:
+        assert _state(store) == expected
+        assert store._journal_seq == 6
+    finally:
+        store.close()
+
+
+def test_torn_last_line_is_dropped_and_truncated(tmp_path):
+    store = _open(tmp_path)
+    _edit(store)
+    expected = _state(store)
+    store.close()
+    journal = tmp_path / "data.journal"
+    good = journal.read_bytes()
+    with open(journal, "ab") as f:
+        f.write(b'{"op": "add", "date": "2026-')
+
+    store = _open(tmp_path)
+    try:
+        assert _state(store) == expected
+    finally:
+        store.close()
+    assert journal.read_bytes() == good
+
+
+def test_compaction_writes_snapshot_and_keeps_later_edits(tmp_path):
+    store = _open(tmp_path)
+    _edit(store)
+    store.compact_journal(wait=True)
+    data = json.loads((tmp_path / "data.json").read_text(encoding="utf-8"))
+    assert data["_journal_seq"] == 6
+    assert not (tmp_path / "data.journal").exists()
+    assert not (tmp_path / "data.journal.old").exists()
+    store.add_report("2026-02-09", {"content": "d", "start_date": "2026-02-09"})
+    store.save_to_json()
+    expected = _state(store)
+    store.close()
+
+    store = _open(tmp_path)
+    try:
+        assert _state(store) == expected
+    finally:
+        store.close()
+
+
+def test_interrupted_compaction_does_not_apply_twice(tmp_path):
+    store = _open(tmp_path)
+    _edit(store)
+    store.close()
+    applied = (tmp_path / "data.journal").read_bytes()
+
+    store = _open(tmp_path)
+    store.compact_journal(wait=True)
+    expected = _state(store)
+    store.close()
+    # 스냅샷은 썼지만 .old journal을 지우기 전에 중단된 경우
+    (tmp_path / "data.journal.old").write_bytes(applied)
+
+    store = _open(tmp_path)
+    try:
+        assert _state(store) == expected
+    finally:
+        store.close()
+
+
+def test_compacts_automatically_after_many_records(tmp_path, monkeypatch):
+    monkeypatch.setattr(ReportStore, "JOURNAL_COMPACT_EVERY", 3)
+    store = _open(tmp_path)
+    try:
+        _edit(store)
+        store.flush()
+        assert (tmp_path / "data.json").exists()
+        assert json.loads((tmp_path / "data.json").read_text(encoding="utf-8"))["_journal_seq"] == 6
+    finally:
+        store.close()
+
+
+def test_unappliable_record_stops_replay_and_is_set_aside(tmp_path, capsys):
+    store = _open(tmp_path)
+    store.add_report("2026-02-02", {"content": "a", "start_date": "2026-02-02"})
+    store.save_to_json()
+    expected = _state(store)
+    store.add_report("2026-02-03", {"content": "b", "start_date": "2026-02-03"})
+    store.save_to_json()
+    store.close()
+    journal = tmp_path / "data.journal"
+    lines = journal.read_bytes().splitlines(keepends=True)
+    # 압축 전에 지워진 보고서의 위치를 가리키는 기록 (적용할 수 없음)
+    bad = json.dumps({"op": "update", "owner": "personal", "date": "2026-01-01", "index": 3,
+                      "report": {"content": "x"}, "seq": 2}).encode("utf-8") + b"\n"
+    later = lines[1].replace(b'"seq": 2', b'"seq": 3')
+    journal.write_bytes(lines[0] + bad + later)
+
+    store = _open(tmp_path)
+    try:
+        assert _state(store) == expected
+        assert store._journal_seq == 1
+        assert "journal 기록 적용 실패" in capsys.readouterr().out
+        store.add_report("2026-02-05", {"content": "c", "start_date": "2026-02-05"})
+        store.save_to_json()
+        expected = _state(store)
+    finally:
+        store.close()
+    assert (tmp_path / "data.journal.rejected").read_bytes() == bad + later
+
+    store = _open(tmp_path)
+    try:
+        assert _state(store) == expected
+    finally:
+        store.close()
@@ -0,0 +1,22 @@
+import json
+
+from json_export import export_range
+
+
+def test_parallel_export_matches_sequential(open_store, tmp_path):
+    store = open_store()
+    store.add_report("2026-03-06", {"content": "a", "category": "출장", "start_date": "2026-03-06",
+                                    "end_date": "2026-03-10"})
+    store.add_report("2026-03-18", {"content": "b", "start_date": "2026-03-18"}, owner="shared")
+    store.add_rule("weekly", {"content": "주간 회의", "start_date": "2026-03-02"}, until="2026-03-16")
+    config = {"name": "tester"}
+    one = export_range("2026-03-01", "2026-03-20", config=config, store=store, out_dir=tmp_path / "one", workers=1)
+    two = export_range("2026-03-01", "2026-03-20", config=config, store=store, out_dir=tmp_path / "two", workers=2)
+    assert [p.rsplit("/", 1)[-1] for p in one] == ["2026-W09.json", "2026-W10.json", "2026-W11.json",
+                                                   "2026-W12.json"]
+    for a, b in zip(one, two):
+        assert open(a, "rb").read() == open(b, "rb").read()
+
+    week11 = json.loads(open(one[2], encoding="utf-8").read())
+    assert sorted(r["content"] for r in week11["reports"]) == ["a", "주간 회의"]
+    assert week11["summary"]["reports"] == len(week11["reports"])
@@ -0,0 +1,47 @@
+"""달력 카테고리 표시: 바뀐 표시만 지우고 만든다 (화면 없이 가짜 달력으로 확인)"""
+from app import ReportApp
+
+
+class _FakeCalendar:
+    def __init__(self):
+        self.events = {}
+        self.created = 0
+
+    def calevent_create(self, day, text, tag):
+        self.created += 1
+        self.events[self.created] = (day.isoformat(), text, tag)
+        return self.created
+
+    def calevent_remove(self, ev_id):
+        del self.events[ev_id]
+
+
+def _app():
+    app = ReportApp.__new__(ReportApp)
+    app.cal = _FakeCalendar()
+    app._markers = {}
+    app._marker_tag = lambda category: f"cat:{category}"
+    return app
+
+
+def test_marker_keys_per_day_and_category(open_store):
+    store = open_store()
+    store.add_report("2026-03-02", {"content": "a", "category": "회의", "start_date": "2026-03-02",
+                                    "end_date": "2026-03-03"})
+    store.add_report("2026-03-03", {"content": "b", "category": "회의", "start_date": "2026-03-03"})
+    store.add_report("2026-03-03", {"content": "c", "start_date": "2026-03-03"}, owner="shared")
+    assert ReportApp._marker_keys(store, "2026-03-01", "2026-03-04") == {
+        ("2026-03-02", "회의"), ("2026-03-03", "회의"), ("2026-03-03", "")}
+
+
+def test_apply_markers_diffs():
+    app = _app()
+    app._apply_markers({("2026-03-02", "회의"), ("2026-03-03", "")})
+    assert sorted(app.cal.events.values()) == [("2026-03-02", "회의", "cat:회의"), ("2026-03-03", "업무", "cat:")]
+    kept = app._markers[("2026-03-02", "회의")]
+
+    app._apply_markers({("2026-03-02", "회의"), ("2026-03-04", "출장")})
+    assert app.cal.created == 3
+    assert app._markers[("2026-03-02", "회의")] == kept
+    assert sorted(app._markers) == [("2026-03-02", "회의"), ("2026-03-04", "출장")]
+    assert len(app.cal.events) == 2
@@ -0,0 +1,31 @@
+def test_buckets_every_day_in_range(open_store):
+    store = open_store()
+    store.add_report("2026-06-01", {"content": "trip", "start_date": "2026-06-01", "end_date": "2026-06-03"})
+    store.add_report("2026-06-03", {"content": "call", "start_date": "2026-06-03"}, owner="shared")
+    days = store.find_reports_in_range("2026-06-02", "2026-06-05")
+    assert list(days) == ["2026-06-02", "2026-06-03", "2026-06-04", "2026-06-05"]
+    assert [r.content for *_rest, r in days["2026-06-02"]] == ["trip"]
+    assert sorted(r.content for *_rest, r in days["2026-06-03"]) == ["call", "trip"]
+    assert days["2026-06-04"] == []
+    owner, orig_date, index, report = days["2026-06-02"][0]
+    assert (owner, orig_date, index) == ("personal", "2026-06-01", 0)
+    assert store.get_report(orig_date, index, owner).id == report.id
+
+
+def test_owner_filter_and_bad_ranges(open_store):
+    store = open_store()
+    store.add_report("2026-06-01", {"content": "a", "start_date": "2026-06-01"})
+    store.add_report("2026-06-01", {"content": "b", "start_date": "2026-06-01"}, owner="shared")
+    assert [r.content for *_rest, r in store.find_reports_in_range("2026-06-01", "2026-06-01", owner="shared")["2026-06-01"]] == ["b"]
+    assert store.find_reports_in_range("2026-06-02", "2026-06-01") == {}
+    assert store.find_reports_in_range("bad", "2026-06-01") == {}
+
+
+def test_matches_per_day_queries(open_store):
+    store = open_store()
+    for day, span in ((1, 0), (3, 4), (8, 1), (9, 0)):
+        start = f"2026-07-{day:02d}"
+        store.add_report(start, {"content": start, "start_date": start, "end_date": f"2026-07-{day + span:02d}"})
+    days = store.find_reports_in_range("2026-07-01", "2026-07-10")
+    for day, entries in days.items():
+        assert sorted(r.id for *_rest, r in entries) == sorted(r.id for *_rest, r in store.find_reports_for_date(day))
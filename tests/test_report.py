@@ -0,0 +1,46 @@
+import json
+
+from report_store import Report, ReportStore
+
+
+def test_from_dict_parses_dates_once():
+    r = Report.from_dict({"content": "a", "start_date": "2026-03-02", "end_date": "2026-03-04"})
+    assert (r.end - r.start) == 2
+    assert (r.start_date, r.end_date) == ("2026-03-02", "2026-03-04")
+    # 시작일이 없으면 저장 키, 종료일이 없으면 시작일
+    r = Report.from_dict({"content": "b"}, "2026-03-05")
+    assert (r.start_date, r.end_date) == ("2026-03-05", "2026-03-05")
+
+
+def test_unparsable_dates_kept_as_written():
+    r = Report.from_dict({"content": "c", "start_date": "3월 초", "end_date": ""}, "2026-03-01")
+    assert r.start is None and r.end is None
+    assert r.to_dict()["start_date"] == "3월 초"
+
+
+def test_dict_view_and_category_interning():
+    a = Report.from_dict({"content": "x", "category": "".join(["회", "의"]), "start_date": "2026-03-02"})
+    b = Report.from_dict({"content": "y", "category": "회의", "start_date": "2026-03-02"})
+    assert a.category is b.category
+    assert a["content"] == "x" and a.get("missing", 1) == 1 and "location" in a
+    assert dict(a)["start_date"] == "2026-03-02"
+    assert a == dict(a.to_dict())
+
+
+def test_legacy_json_round_trip(tmp_path):
+    legacy = {"personal": {"2026-03-02": [{"content": "old", "category": "", "location": "", "attendees": "",
+                                           "start_date": "2026-03-02", "end_date": ""}]},
+              "shared": {}}
+    path = tmp_path / "data.json"
+    path.write_text(json.dumps(legacy, ensure_ascii=False), encoding="utf-8")
+    store = ReportStore(path, journal=False, save_delay=0, config={})
+    first_id = store.list_reports("2026-03-02")[0].id
+    store.close()
+    # id 없이 저장된 보고서도 다시 읽으면 같은 id
+    store = ReportStore(path, journal=False, save_delay=0, config={})
+    try:
+        r = store.list_reports("2026-03-02")[0]
+        assert r.id == first_id
+        assert (r.content, r.end_date) == ("old", "2026-03-02")
+    finally:
+        store.close()
@@ -0,0 +1,30 @@
+import pytest
+
+
+def test_ids_survive_edits_and_reload(open_store):
+    store = open_store()
+    store.add_report("2026-08-03", {"content": "a", "start_date": "2026-08-03"})
+    store.add_report("2026-08-03", {"content": "b", "start_date": "2026-08-03"})
+    a, b = store.list_reports_for("2026-08-03")
+    store.update_by_id(a.id, {"content": "a2", "start_date": "2026-08-03"})
+    store.move_by_id(b.id, "2026-08-05", new_owner="shared")
+    assert store.locate_by_id(a.id) == ("personal", "2026-08-03", 0)
+    assert store.locate_by_id(b.id)[:2] == ("shared", "2026-08-05")
+    store.save_to_json()
+    store.close()
+
+    store = open_store()
+    assert store.get_by_id(a.id).content == "a2"
+    assert store.get_by_id(b.id).content == "b"
+    assert store.delete_by_id(a.id)
+    assert store.locate_by_id(a.id) is None
+    assert not store.delete_by_id(a.id)
+    with pytest.raises(KeyError):
+        store.get_by_id(a.id)
+
+
+def test_imported_id_is_kept(open_store):
+    store = open_store()
+    store.add_report("2026-08-03", {"id": "fixed-id", "content": "x", "start_date": "2026-08-03"})
+    assert store.get_by_id("fixed-id").content == "x"
+    assert store.locate_by_id("fixed-id") == ("personal", "2026-08-03", 0)
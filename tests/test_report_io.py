@@ -0,0 +1,86 @@
+import io
+
+import pytest
+
+import report_io
+from cli import import_reports
+from report_store import Report, ReportStore
+
+
+def _store(path):
+    return ReportStore(path, journal=False, save_delay=0, config={})
+
+
+def _fields(store):
+    return sorted((ow, d, r.id, r.content, r.category, r.location, r.attendees, r.start_date, r.end_date)
+                  for ow, d, r in store.iter_reports())
+
+
+@pytest.mark.parametrize("fmt", report_io.FORMATS)
+def test_round_trip(tmp_path, fmt):
+    source = _store(tmp_path / "a.json")
+    source.add_report("2026-03-02", {"content": "주간 회의\n안건: 일정, 예산; 기타\\메모", "category": "회의",
+                                     "location": "3층", "attendees": "김, 이", "start_date": "2026-03-02",
+                                     "end_date": "2026-03-04"})
+    source.add_report("2026-03-05", {"content": "가" * 60, "start_date": "2026-03-05"}, owner="shared")
+    buf = io.StringIO(newline="")
+    assert report_io.WRITERS[fmt](buf, source.iter_reports()) == 2
+
+    target = _store(tmp_path / "b.json")
+    records = report_io.READERS[fmt](io.StringIO(buf.getvalue(), newline=""), owner="personal")
+    assert import_reports(target, records) == (2, 0)
+    assert _fields(target) == _fields(source)
+
+    # 같은 파일을 다시 가져오면 id가 같아 모두 건너뜀
+    records = report_io.READERS[fmt](io.StringIO(buf.getvalue(), newline=""), owner="personal")
+    assert import_reports(target, records) == (0, 2)
+    source.close()
+    target.close()
+
+
+def test_ics_folds_long_lines():
+    report = Report.from_dict({"content": "가" * 60, "start_date": "2026-03-05"})
+    buf = io.StringIO()
+    report_io.write_ics(buf, [("personal", "2026-03-05", report)])
+    assert all(len(line.encode("utf-8")) <= 75 for line in buf.getvalue().split("\r\n"))
+
+
+def test_read_jsonl_reports_bad_lines_on_stderr(capsys):
+    lines = io.StringIO('{"content": "a", "start_date": "2026-01-01"}\nnot json\n\n{"content": "no date"}\n')
+    records = list(report_io.read_jsonl(lines, owner="shared"))
+    assert [(ow, d, r["content"]) for ow, d, r in records] == [("shared", "2026-01-01", "a")]
+    out, err = capsys.readouterr()
+    assert out == ""
+    assert "2번째 줄 건너뜀" in err
+
+
+@pytest.mark.parametrize("fmt", report_io.FORMATS)
+def test_round_trip_keeps_ids_with_at_sign(tmp_path, fmt):
+    source = _store(tmp_path / "a.json")
+    for day in ("02", "09", "16"):
+        source.add_report(f"2026-03-{day}", {"id": f"rule1@2026-03-{day}", "content": "회의",
+                                             "start_date": f"2026-03-{day}"})
+    buf = io.StringIO(newline="")
+    report_io.WRITERS[fmt](buf, source.iter_reports())
+
+    target = _store(tmp_path / "b.json")
+    records = report_io.READERS[fmt](io.StringIO(buf.getvalue(), newline=""), owner="personal")
+    assert import_reports(target, records) == (3, 0)
+    assert _fields(target) == _fields(source)
+    source.close()
+    target.close()
+
+
+def test_round_trip_rule_occurrences(tmp_path):
+    source = _store(tmp_path / "a" / "data.json")
+    rule = source.add_rule("weekly", {"content": "주간회의", "start_date": "2026-03-02"}, until="2026-03-30")
+    buf = io.StringIO(newline="")
+    assert report_io.write_ics(buf, source.iter_reports()) == 5
+
+    target = _store(tmp_path / "b" / "data.json")
+    records = report_io.read_ics(io.StringIO(buf.getvalue(), newline=""))
+    assert import_reports(target, records) == (5, 0)
+    assert sorted(r.id for _ow, _d, r in target.iter_reports()) == [
+        f"{rule.id}@2026-03-{day}" for day in ("02", "09", "16", "23", "30")]
+    source.close()
+    target.close()
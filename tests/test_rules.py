@@ -0,0 +1,124 @@
+"""반복 보고서 규칙: 조회한 기간의 항목만 만들고, 항목 하나만 빼거나 따로 저장할 수 있다"""
+
+
+def _weekly(store, **kwargs):
+    return store.add_rule("weekly", {"content": "주간 회의", "category": "회의", "start_date": "2026-03-02"},
+                          **kwargs)
+
+
+def test_occurrences_in_queries(open_store):
+    store = open_store()
+    rule = _weekly(store, until="2026-03-23")
+    found = store.find_reports_for_date("2026-03-09")
+    assert [(ow, d, idx, r.id) for ow, d, idx, r in found] == [("personal", "2026-03-09", -1, f"{rule.id}@2026-03-09")]
+    assert store.find_reports_for_date("2026-03-10") == []
+    assert store.find_reports_for_date("2026-03-30") == []  # until 이후
+    days = store.find_reports_in_range("2026-03-01", "2026-03-31")
+    assert [d for d, entries in days.items() if entries] == ["2026-03-02", "2026-03-09", "2026-03-16", "2026-03-23"]
+    assert store.week_summary_for("2026-03-16")["reports"] == 1
+
+
+def test_skip_and_override_occurrence(open_store):
+    store = open_store()
+    rule = _weekly(store)
+    assert store.delete_by_id(f"{rule.id}@2026-03-09")
+    assert store.find_reports_for_date("2026-03-09") == []
+    assert store.get_rule(rule.id).exceptions
+
+    moved = store.move_by_id(f"{rule.id}@2026-03-16", "2026-03-17",
+                             {"content": "회의 연기", "category": "회의", "start_date": "2026-03-17"})
+    assert store.find_reports_for_date("2026-03-16") == []
+    assert [r.content for *_rest, r in store.find_reports_for_date("2026-03-17")] == ["회의 연기"]
+    assert store.locate_by_id(moved.id)[2] == 0
+    store.save_to_json()
+    store.close()
+
+    store = open_store()
+    assert store.find_reports_for_date("2026-03-09") == []
+    assert [r.content for *_rest, r in store.find_reports_for_date("2026-03-17")] == ["회의 연기"]
+    assert store.unskip_occurrence(rule.id, "2026-03-09")
+    assert [r.id for *_rest, r in store.find_reports_for_date("2026-03-09")] == [f"{rule.id}@2026-03-09"]
+
+
+def test_iter_reports_expands_rules_in_range(open_store):
+    store = open_store()
+    rule = _weekly(store)
+    store.add_report("2026-03-03", {"content": "기타", "start_date": "2026-03-03"})
+    store.skip_occurrence(rule.id, "2026-03-09")
+    rows = [(ow, d, r.id) for ow, d, r in store.iter_reports(start="2026-03-01", end="2026-03-20")]
+    assert [d for _ow, d, _id in rows] == ["2026-03-03", "2026-03-02", "2026-03-16"]
+    assert rows[1][2] == f"{rule.id}@2026-03-02"
+    assert [d for _ow, d, _r in store.iter_reports(start="2026-03-01", end="2026-03-20", rules=False)] == ["2026-03-03"]
+    assert list(store.iter_reports(owner="shared", start="2026-03-01", end="2026-03-20")) == []
+
+
+def test_iter_reports_open_end_stops_at_until_or_horizon(open_store):
+    store = open_store()
+    _weekly(store, until="2026-03-16", owner="shared")
+    assert [d for _ow, d, _r in store.iter_reports(owner="shared")] == ["2026-03-02", "2026-03-09", "2026-03-16"]
+    store.add_rule("monthly", {"content": "월간", "start_date": "2026-01-31"})
+    store.RULE_HORIZON_DAYS = 0
+    # 종료일 없는 규칙은 끝이 없으면 오늘까지만 (31일이 없는 달은 건너뜀)
+    dates = [d for _ow, d, _r in store.iter_reports(owner="personal", start="2026-01-01")]
+    assert dates[:3] == ["2026-01-31", "2026-03-31", "2026-05-31"]
+    assert len(dates) < 100
+
+
+def _journal_store(tmp_path):
+    from report_store import ReportStore
+    return ReportStore(tmp_path / "data.json", journal=True, save_delay=0, config={})
+
+
+def _occurrences(store):
+    return [(d, r.id, r.content) for _ow, d, r in store.iter_reports(start="2026-03-01", end="2026-03-31")]
+
+
+def test_journal_mode_records_rule_changes_in_order(tmp_path):
+    store = _journal_store(tmp_path)
+    rule = _weekly(store)
+    store.save_to_json()
+    store.delete_by_id(f"{rule.id}@2026-03-09")
+    store.update_by_id(f"{rule.id}@2026-03-16", {"content": "회의 (장소 변경)", "start_date": "2026-03-16"})
+    # 저장 전에 중단: 규칙의 예외 날짜도 그 날의 보고서도 남지 않아야 한다
+    assert not store.rules_file.exists()
+    store = _journal_store(tmp_path)
+    assert _occurrences(store) == [(f"2026-03-{day}", f"{rule.id}@2026-03-{day}", "주간 회의")
+                                   for day in ("02", "09", "16", "23", "30")]
+
+    store.update_by_id(f"{rule.id}@2026-03-16", {"content": "회의 (장소 변경)", "start_date": "2026-03-16"})
+    store.save_to_json()
+    expected = _occurrences(store)
+    store.close()
+    store = _journal_store(tmp_path)
+    assert _occurrences(store) == expected
+    assert "회의 (장소 변경)" in [c for _d, _id, c in expected]
+
+    store.compact_journal(wait=True)
+    assert store.rules_file.exists() and not store.journal_file.exists()
+    store.close()
+    store = _journal_store(tmp_path)
+    try:
+        assert _occurrences(store) == expected
+    finally:
+        store.close()
+
+
+def test_stores_in_one_folder_keep_their_own_rules(tmp_path):
+    from report_store import ReportStore
+    main = ReportStore(tmp_path / "data.json", journal=False, save_delay=0, config={})
+    backup = ReportStore(tmp_path / "backup.json", journal=False, save_delay=0, config={})
+    try:
+        rule = _weekly(main)
+        assert backup.list_rules() == []
+        assert main.rules_file.name == "data.rules.json"
+    finally:
+        main.close()
+        backup.close()
+    backup = ReportStore(tmp_path / "backup.json", journal=False, save_delay=0, config={})
+    main = ReportStore(tmp_path / "data.json", journal=False, save_delay=0, config={})
+    try:
+        assert backup.list_rules() == []
+        assert [r.id for r in main.list_rules()] == [rule.id]
+    finally:
+        main.close()
+        backup.close()
@@ -0,0 +1,104 @@
+import json
+
+import pytest
+
+from report_store import ReportStore
+from search_index import NgramIndex, index_grams, ngrams
+
+
+def test_ngrams_korean_and_short_tokens():
+    assert ngrams("주간 회의 A") == {"주간": 1, "회의": 1, "a": 1}
+    assert ngrams("회의록") == {"회의": 1, "의록": 1}
+
+
+def test_single_characters_have_their_own_postings():
+    assert index_grams("회의 회") == ({"회의": 1, "회": 2, "의": 1}, 2)
+    index = NgramIndex()
+    index.add("a", "주간 회의", "personal", "2026-03-02", "", 10, 10)
+    index.add("b", "출장", "personal", "2026-03-03", "", 11, 11)
+    assert index.postings["회"] == {"a": 1}
+    assert [hit[1] for hit in index.search("회")] == ["a"]
+    assert [hit[1] for hit in index.search("회 출")] == []
+
+
+def test_index_filters_and_persists(tmp_path):
+    index = NgramIndex()
+    index.add("a", "분기 예산 회의", "personal", "2026-03-02", "회의", 10, 10)
+    index.add("b", "예산 검토", "shared", "2026-03-05", "", 13, 13)
+    assert [hit[1] for hit in index.search("예산")] in (["a", "b"], ["b", "a"])
+    assert [hit[1] for hit in index.search("예산", owner="shared")] == ["b"]
+    assert [hit[1] for hit in index.search("예산", category="회의")] == ["a"]
+    assert [hit[1] for hit in index.search("예산", lo=12, hi=20)] == ["b"]
+    assert index.search("없는말") == []
+    index.remove("a")
+    path = tmp_path / "search_index.json"
+    index.save(path)
+    loaded = NgramIndex.load(path)
+    assert [hit[1] for hit in loaded.search("예산")] == ["b"]
+    assert not loaded.ensure("b", "예산 검토", "shared", "2026-03-05", "", 13, 13)
+
+
+def test_store_search_follows_edits(open_store):
+    store = open_store()
+    store.add_report("2026-03-02", {"content": "분기 예산 회의", "location": "본관", "start_date": "2026-03-02"})
+    store.add_report("2026-03-05", {"content": "출장 보고", "attendees": "예산팀", "start_date": "2026-03-05"},
+                     owner="shared")
+    assert sorted(r.content for *_rest, r in store.search("예산")) == ["분기 예산 회의", "출장 보고"]
+    assert [r.content for *_rest, r in store.search("본관")] == ["분기 예산 회의"]
+    first = store.search("분기")[0][3]
+    store.update_by_id(first.id, {"content": "연간 계획", "start_date": "2026-03-02"})
+    assert store.search("분기") == []
+    store.save_to_json()
+    store.close()
+
+    store = open_store()
+    assert [(ow, d) for ow, d, _i, _r in store.search("예산", owner="shared")] == [("shared", "2026-03-05")]
+    assert [r.content for *_rest, r in store.search("계획", start="2026-03-01", end="2026-03-02")] == ["연간 계획"]
+    assert store.search("계획", start="2026-03-03", end="2026-03-31") == []
+
+
+def test_store_finds_single_character_queries(open_store):
+    store = open_store()
+    store.add_report("2026-03-02", {"content": "주간 회의", "start_date": "2026-03-02"})
+    store.add_report("2026-03-03", {"content": "출장 보고", "start_date": "2026-03-03"})
+    assert [r.content for *_rest, r in store.search("회")] == ["주간 회의"]
+    assert [r.content for *_rest, r in store.search("보")] == ["출장 보고"]
+
+
+@pytest.mark.parametrize("journal", [False, True])
+def test_index_saved_with_data_is_used_without_rechecking(tmp_path, monkeypatch, journal):
+    store = ReportStore(tmp_path / "data.json", journal=journal, save_delay=0, config={})
+    store.add_report("2026-03-02", {"content": "분기 예산 회의", "start_date": "2026-03-02"})
+    store.save_to_json()
+    if journal:
+        # journal 모드의 세대는 압축할 때 정해진다
+        store.compact_journal(wait=True)
+    store.add_report("2026-03-03", {"content": "출장 보고", "start_date": "2026-03-03"})
+    store.close()
+
+    def fail(*args):
+        raise AssertionError("ensure called")
+    monkeypatch.setattr(NgramIndex, "ensure", fail)
+    store = ReportStore(tmp_path / "data.json", journal=journal, save_delay=0, config={})
+    try:
+        assert [r.content for *_rest, r in store.search("출장")] == ["출장 보고"]
+    finally:
+        store.close()
+
+
+def test_index_is_rechecked_when_data_changed_elsewhere(tmp_path):
+    store = ReportStore(tmp_path / "data.json", journal=False, save_delay=0, config={})
+    store.add_report("2026-03-02", {"content": "분기 예산 회의", "start_date": "2026-03-02"})
+    store.close()
+    # 다른 프로그램이 data.json을 고쳐 쓴 경우: 세대가 맞지 않으므로 보고서마다 다시 확인한다
+    data = json.loads((tmp_path / "data.json").read_text(encoding="utf-8"))
+    data["personal"]["2026-03-02"][0]["content"] = "연간 계획"
+    del data["_generation"]
+    (tmp_path / "data.json").write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+
+    store = ReportStore(tmp_path / "data.json", journal=False, save_delay=0, config={})
+    try:
+        assert store.search("예산") == []
+        assert [r.content for *_rest, r in store.search("계획")] == ["연간 계획"]
+    finally:
+        store.close()
@@ -0,0 +1,100 @@
+import json
+
+from report_store import ReportStore
+from sharded_store import ShardedReportStore
+
+
+def _open(tmp_path, **kwargs):
+    return ShardedReportStore(tmp_path / "shards", json_file=tmp_path / "data.json", config={},
+                              save_delay=0, **kwargs)
+
+
+def test_delete_category_visits_only_shards_using_it(tmp_path, monkeypatch):
+    store = _open(tmp_path)
+    for month in range(1, 7):
+        category = "회의" if month in (2, 5) else "기타"
+        store.add_report(f"2026-{month:02d}-03", {"content": str(month), "category": category,
+                                                  "start_date": f"2026-{month:02d}-03"})
+    store.save_to_json()
+    store.close()
+
+    store = _open(tmp_path)
+    loaded = []
+    ensure = store._ensure_shard
+
+    def _ensure(shard):
+        if shard not in store._loaded:
+            loaded.append(shard)
+        ensure(shard)
+        # 고친 샤드는 다음 샤드를 불러오기 전에 기록되고 내려가야 한다
+        assert len([s for s in store._loaded if s != "misc"]) <= 1
+    monkeypatch.setattr(store, "_ensure_shard", _ensure)
+    try:
+        assert store.delete_category("회의") == 2
+        assert loaded == ["2026-02", "2026-05"]
+        assert not store._dirty and not store._loaded
+        assert store.category_counts() == {"기타": 4}
+        manifest = json.loads((tmp_path / "shards" / "manifest.json").read_text(encoding="utf-8"))
+        assert manifest["shards"]["2026-02"] == {}
+    finally:
+        store.close()
+
+    store = _open(tmp_path)
+    try:
+        assert [r.category for *_rest, r in store.find_reports_for_date("2026-05-03")] == [""]
+    finally:
+        store.close()
+
+
+def test_delete_category_includes_loaded_changes(tmp_path):
+    store = _open(tmp_path)
+    try:
+        store.add_report("2026-03-01", {"content": "a", "category": "회의", "start_date": "2026-03-01"})
+        assert store.delete_category("회의") == 1
+        assert store.category_counts() == {}
+    finally:
+        store.close()
+
+
+def test_migration_leaves_source_untouched_and_shards_by_start(tmp_path):
+    legacy = ReportStore(tmp_path / "data.json", journal=True, save_delay=0, config={})
+    legacy.add_report("2026-01-05", {"content": "a", "start_date": "2026-01-05"})
+    # 저장 키(1월)와 시작일(3월)이 다른 보고서
+    legacy.add_report("2026-01-06", {"content": "b", "start_date": "2026-03-06"})
+    legacy.save_to_json()
+    legacy.compact_journal(wait=True)
+    legacy.close()
+    with open(tmp_path / "data.journal", "a", encoding="utf-8") as f:
+        f.write('{"op": "add", "se')
+    files = {p.name: p.read_bytes() for p in tmp_path.iterdir() if p.is_file()}
+
+    store = _open(tmp_path)
+    try:
+        assert [r.content for *_rest, r in store.find_reports_for_date("2026-03-06")] == ["b"]
+        assert sorted(store._manifest["shards"]) == ["2026-01", "2026-03"]
+    finally:
+        store.close()
+    assert {p.name: p.read_bytes() for p in tmp_path.iterdir() if p.is_file()} == files
+
+
+def test_import_files_reports_under_their_start_month(tmp_path):
+    from cli import import_reports
+    store = _open(tmp_path)
+    try:
+        # 저장 키(1월)와 시작일(3월)이 다른 달인 가져오기 행
+        records = [("personal", "2026-01-31", {"content": "a", "start_date": "2026-03-05", "end_date": "2026-03-06"}),
+                   ("shared", "2026-02-10", {"content": "b", "start_date": "2026-02-10"})]
+        assert import_reports(store, records) == (2, 0)
+        store.add_report("2026-01-20", {"content": "c", "start_date": "2026-04-01"})
+        store.save_to_json()
+    finally:
+        store.close()
+
+    store = _open(tmp_path)
+    try:
+        assert sorted(store._manifest["shards"]) == ["2026-02", "2026-03", "2026-04"]
+        found = store.find_reports_in_range("2026-03-01", "2026-04-30")
+        assert [(ow, d, r.content) for ow, d, _i, r in found["2026-03-05"]] == [("personal", "2026-03-05", "a")]
+        assert [r.content for *_rest, r in found["2026-04-01"]] == ["c"]
+    finally:
+        store.close()
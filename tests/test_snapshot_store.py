@@ -0,0 +1,212 @@
+import pytest
+
+from report_store import Report, ReportStore, _to_ordinal
+from snapshot_store import SnapshotFile, SnapshotReportStore, write_snapshot
+
+
+def _report(content, start, end=None, category=""):
+    return Report.from_dict({"content": content, "category": category, "start_date": start, "end_date": end or start})
+
+
+def test_snapshot_file_index(tmp_path):
+    path = tmp_path / "data.snap"
+    groups = [
+        ("personal", "2026-03-02", [_report("a", "2026-03-02", "2026-03-06", "회의"), _report("b", "2026-03-02")]),
+        ("personal", "2026-03-09", [_report("c", "2026-03-09", category="회의")]),
+        ("shared", "2026-03-03", [_report("d", "2026-03-03")]),
+    ]
+    write_snapshot(path, groups)
+    snap = SnapshotFile(path)
+    try:
+        assert len(snap) == 4 and snap.owners == ["personal", "shared"] and snap.max_span == 4
+        k = snap.find_key("personal", "2026-03-02")
+        _owner, key, first, count = snap.key(k)
+        assert (key, count) == ("2026-03-02", 2)
+        assert [snap.report(i, key).content for i in range(first, first + count)] == ["a", "b"]
+        assert snap.find_key("shared", "2026-03-02") is None
+        day = _to_ordinal("2026-03-05")
+        assert [snap.report(i, "").content for i in snap.overlapping("personal", day, day)] == ["a"]
+        assert sorted(snap.keys_with_category("회의")) == ["2026-03-02", "2026-03-09"]
+    finally:
+        snap.close()
+
+
+def test_bad_magic_rejected(tmp_path):
+    path = tmp_path / "data.snap"
+    path.write_bytes(b"NOTASNAP" + b"\0" * 32)
+    with pytest.raises(ValueError):
+        SnapshotFile(path)
+
+
+def _open(tmp_path):
+    return SnapshotReportStore(tmp_path / "data.snap", json_file=tmp_path / "data.json", config={}, save_delay=0)
+
+
+def test_reopen_decodes_only_queried_keys(tmp_path):
+    store = _open(tmp_path)
+    for day in range(1, 29):
+        store.add_report(f"2026-02-{day:02d}", {"content": str(day), "category": "회의" if day % 2 else "",
+                                                "start_date": f"2026-02-{day:02d}"})
+    store.close()
+
+    store = _open(tmp_path)
+    try:
+        assert store.category_counts() == {"회의": 14}
+        assert not store._materialized
+        assert len(list(store.iter_reports())) == 28
+        assert not store._materialized
+        assert [r.content for *_rest, r in store.find_reports_for_date("2026-02-10")] == ["10"]
+        assert store._materialized == {"2026-02-10"}
+        store.add_report("2026-02-10", {"content": "new", "start_date": "2026-02-10"})
+    finally:
+        store.close()
+
+    store = _open(tmp_path)
+    try:
+        assert [r.content for r in store.list_reports("2026-02-10")] == ["10", "new"]
+        assert len(list(store.iter_reports())) == 29
+    finally:
+        store.close()
+
+
+def test_migration_from_json_keeps_source(tmp_path):
+    legacy = ReportStore(tmp_path / "data.json", journal=False, save_delay=0, config={})
+    legacy.add_report("2026-01-05", {"content": "a", "start_date": "2026-01-05"})
+    legacy.close()
+    source = (tmp_path / "data.json").read_bytes()
+    store = _open(tmp_path)
+    try:
+        assert [r.content for r in store.list_reports("2026-01-05")] == ["a"]
+    finally:
+        store.close()
+    assert (tmp_path / "data.json").read_bytes() == source
+
+
+def _add(store, start, content, category=""):
+    store.add_report(start, {"content": content, "category": category, "start_date": start})
+
+
+def test_edits_append_to_delta_without_rewriting_snapshot(tmp_path):
+    store = _open(tmp_path)
+    _add(store, "2026-03-02", "a", "회의")
+    _add(store, "2026-03-09", "b", "회의")
+    store.close()
+    snapshot = (tmp_path / "data.snap").read_bytes()
+
+    store = _open(tmp_path)
+    try:
+        _add(store, "2026-03-02", "c")
+        store.delete_report("2026-03-09", 0)
+        store.save_to_json()
+        assert (tmp_path / "data.snap").read_bytes() == snapshot
+        assert (tmp_path / "data.snap.delta").exists()
+    finally:
+        store.close()
+    assert (tmp_path / "data.snap").read_bytes() == snapshot
+
+    store = _open(tmp_path)
+    try:
+        assert store._materialized == {"2026-03-02", "2026-03-09"}
+        assert [r.content for r in store.list_reports("2026-03-02")] == ["a", "c"]
+        assert store.list_reports("2026-03-09") == []
+        assert store.category_counts() == {"회의": 1}
+        assert len(list(store.iter_reports())) == 2
+    finally:
+        store.close()
+
+
+def test_delta_is_compacted_into_a_new_snapshot(tmp_path):
+    store = _open(tmp_path)
+    store.DELTA_COMPACT_EVERY = 4
+    try:
+        generations = set()
+        for day in range(2, 9):
+            _add(store, f"2026-03-{day:02d}", str(day))
+            store.save_to_json()
+            generations.add(store._snap.meta["generation"])
+            assert store._delta_count <= 4
+        assert len(generations) > 1
+    finally:
+        store.close()
+
+    store = _open(tmp_path)
+    try:
+        assert [r.content for *_rest, r in store.iter_reports()] == [str(day) for day in range(2, 9)]
+    finally:
+        store.close()
+
+
+def test_stale_and_torn_delta_lines_are_skipped(tmp_path):
+    store = _open(tmp_path)
+    _add(store, "2026-03-02", "a")
+    store.close()
+    store = _open(tmp_path)
+    _add(store, "2026-03-02", "b")
+    store.close()
+    delta = tmp_path / "data.snap.delta"
+    good = delta.read_bytes()
+    stale = b'{"generation": "old", "owner": "personal", "key": "2026-03-02", "reports": []}\n'
+    delta.write_bytes(stale + good + b'{"generation": "')
+
+    store = _open(tmp_path)
+    try:
+        assert [r.content for r in store.list_reports("2026-03-02")] == ["a", "b"]
+    finally:
+        store.close()
+    assert delta.read_bytes() == stale + good
+
+
+def _search_contents(store, query):
+    return sorted(r.content for *_rest, r in store.search(query))
+
+
+def test_search_index_follows_delta_without_rebuilding(tmp_path):
+    store = _open(tmp_path)
+    _add(store, "2026-03-02", "alpha meeting")
+    _add(store, "2026-03-03", "beta review")
+    assert _search_contents(store, "alpha") == ["alpha meeting"]
+    alpha_id = store.list_reports("2026-03-02")[0].id
+    store.close()
+
+    store = _open(tmp_path)
+    _add(store, "2026-03-04", "gamma notes")
+    store.delete_report("2026-03-03", 0)
+    store.close()
+
+    store = _open(tmp_path)
+    try:
+        # 색인이 지금 스냅샷과 함께 저장되어 있으므로 다시 색인하지 않는다
+        assert store._search_builder is None
+        assert _search_contents(store, "gamma") == ["gamma notes"]
+        assert _search_contents(store, "beta") == []
+        assert store.locate_by_id(alpha_id) == ("personal", "2026-03-02", 0)
+    finally:
+        store.close()
+
+
+def test_search_index_is_built_in_background_after_generation_change(tmp_path):
+    store = _open(tmp_path)
+    _add(store, "2026-03-02", "alpha meeting")
+    _add(store, "2026-03-03", "beta review")
+    store.close()
+    store = _open(tmp_path)
+    _add(store, "2026-03-04", "gamma notes")
+    store.delete_report("2026-03-02", 0)
+    store.close()
+    (tmp_path / "data_search_index.gen").unlink()
+
+    store = _open(tmp_path)
+    try:
+        assert store._search_builder is not None
+        assert _search_contents(store, "gamma") == ["gamma notes"]
+        assert _search_contents(store, "alpha") == []
+        assert _search_contents(store, "beta") == ["beta review"]
+        assert store._search_builder is None
+    finally:
+        store.close()
+
+    store = _open(tmp_path)
+    try:
+        assert store._search_builder is None
+    finally:
+        store.close()
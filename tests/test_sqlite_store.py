@@ -0,0 +1,75 @@
+from report_store import ReportStore
+from sqlite_store import SqliteReportStore
+
+
+def _open(tmp_path):
+    return SqliteReportStore(tmp_path / "reports.db", json_file=tmp_path / "data.json", config={})
+
+
+def _plan(store, lo, hi, owner):
+    # _overlapping과 같은 조건의 실행 계획
+    sql = ("SELECT id FROM reports r WHERE r.start_date BETWEEN ? AND ? AND r.end_date >= ?"
+           + (" AND r.owner = ?" if owner else "") + " ORDER BY r.start_date, r.id")
+    params = [lo, hi, lo] + ([owner] if owner else [])
+    return " ".join(row[3] for row in store._conn.execute("EXPLAIN QUERY PLAN " + sql, params))
+
+
+def test_overlapping_uses_bounded_start_index(tmp_path):
+    store = _open(tmp_path)
+    try:
+        assert "idx_reports_start (owner=? AND start_date>? AND start_date<?)" in _plan(store, 1, 2, "shared")
+        assert "idx_reports_start_any (start_date>? AND start_date<?)" in _plan(store, 1, 2, None)
+        span_plan = store._conn.execute("EXPLAIN QUERY PLAN SELECT MAX(end_date - start_date) FROM reports")
+        assert "idx_reports_span" in " ".join(row[3] for row in span_plan)
+    finally:
+        store.close()
+
+
+def test_long_reports_found_and_window_shrinks(tmp_path):
+    store = _open(tmp_path)
+    try:
+        store.add_report("2026-01-01", {"content": "long", "start_date": "2026-01-01", "end_date": "2026-03-31"})
+        store.add_report("2026-03-01", {"content": "day", "start_date": "2026-03-01"}, owner="shared")
+        assert {r.content for *_, r in store.find_reports_for_date("2026-03-01")} == {"long", "day"}
+        assert store._max_span() == 89
+        long_id = store.find_reports_for_date("2026-01-01")[0][3].id
+        store.delete_by_id(long_id)
+        assert store._max_span() == 0
+        assert [r.content for *_, r in store.find_reports_for_date("2026-03-01")] == ["day"]
+    finally:
+        store.close()
+
+
+def test_migration_leaves_source_json_untouched(tmp_path):
+    legacy = ReportStore(tmp_path / "data.json", journal=True, save_delay=0, config={})
+    legacy.add_report("2026-01-05", {"content": "a", "start_date": "2026-01-05"})
+    legacy.save_to_json()
+    legacy.compact_journal(wait=True)
+    legacy.add_report("2026-01-06", {"content": "b", "start_date": "2026-01-06"})
+    legacy.save_to_json()
+    legacy.close()
+    # 마지막 줄이 끊긴 journal: 읽기 전용으로 가져오면 잘라내지 않아야 한다
+    with open(tmp_path / "data.journal", "a", encoding="utf-8") as f:
+        f.write('{"op": "add", "se')
+    files = {p.name: p.read_bytes() for p in tmp_path.iterdir() if p.is_file()}
+
+    store = _open(tmp_path)
+    try:
+        assert sorted(r.content for _o, _d, r in store.iter_reports()) == ["a", "b"]
+    finally:
+        store.close()
+    for name, data in files.items():
+        assert (tmp_path / name).read_bytes() == data, name
+
+
+def test_shares_base_state_and_closes_twice(tmp_path):
+    base = ReportStore(tmp_path / "json" / "data.json", journal=False, save_delay=0, config={})
+    store = _open(tmp_path)
+    try:
+        missing = set(vars(base)) - set(vars(store))
+        assert not missing
+    finally:
+        base.close()
+        store.close()
+    store.close()
+    assert store._closed
@@ -0,0 +1,53 @@
+"""시작 시간: 무거운 모듈은 창을 만든 뒤/처음 필요할 때 불러온다"""
+import subprocess
+import sys
+import types
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def _loaded_after(statement, modules):
+    code = f"import sys\n{statement}\nprint(' '.join(m for m in {modules!r} if m in sys.modules))"
+    out = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+    return out.stdout.split()
+
+
+def test_app_import_defers_tabs_and_calendar():
+    assert _loaded_after("import app", ["tabs", "tkcalendar", "xlsx_export", "sqlite3"]) == []
+
+
+def test_cli_does_not_load_tkinter():
+    assert _loaded_after("import cli", ["tkinter", "app", "tabs"]) == []
+
+
+def test_ensure_tab_builds_once(monkeypatch):
+    import app
+
+    built = []
+
+    class FakeTab:
+        def __init__(self, parent, store, worker=None):
+            built.append(parent)
+            self.dates = []
+
+        def get_frame(self):
+            return types.SimpleNamespace(pack=lambda **kw: None)
+
+        def set_date(self, date):
+            self.dates.append(date)
+
+    monkeypatch.setitem(sys.modules, "tabs", types.SimpleNamespace(PersonalTab=FakeTab))
+    ui = app.ReportApp.__new__(app.ReportApp)
+    ui.personal_tab = None
+    ui._tab_pages = ["page0"]
+    ui._tab_dates = {}
+    ui._store = object()
+    ui.worker = None
+    ui.current_date = "2026-03-02"
+    tab = ui._ensure_tab(0)
+    assert ui._ensure_tab(0) is tab
+    assert built == ["page0"] and tab.dates == ["2026-03-02"]
+    ui.current_date = "2026-03-03"
+    ui._ensure_tab(0)
+    assert tab.dates == ["2026-03-02", "2026-03-03"]
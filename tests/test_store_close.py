@@ -0,0 +1,41 @@
+import threading
+
+from report_store import ReportStore
+
+
+def _saver_threads():
+    return [t for t in threading.enumerate() if t.name == "ReportStoreSaver"]
+
+
+def test_close_flushes_pending_save_and_stops_saver(tmp_path):
+    before = len(_saver_threads())
+    store = ReportStore(tmp_path / "data.json", journal=False, save_delay=60, config={})
+    assert len(_saver_threads()) == before + 1
+    store.add_report("2026-01-05", {"content": "a", "start_date": "2026-01-05"})
+    store.save_to_json()  # 60초 뒤에나 기록될 요청
+    store.close()
+    assert len(_saver_threads()) == before
+    assert store._saver is None
+    store.close()  # 두 번 불러도 된다
+
+    reopened = ReportStore(tmp_path / "data.json", journal=False, save_delay=0, config={})
+    assert [r.content for *_, r in reopened.find_reports_for_date("2026-01-05")] == ["a"]
+
+
+def test_closed_store_does_not_write_at_exit(tmp_path, monkeypatch):
+    registered = []
+    unregistered = []
+    monkeypatch.setattr("report_store.atexit.register", registered.append)
+    monkeypatch.setattr("report_store.atexit.unregister", unregistered.append)
+    store = ReportStore(tmp_path / "data.json", journal=False, save_delay=60, config={})
+    store.close()
+    assert registered == [store.flush]
+    assert unregistered == [store.flush]
+
+
+def test_close_detaches_undo(tmp_path):
+    store = ReportStore(tmp_path / "data.json", journal=False, save_delay=0, config={})
+    log = store.enable_undo()
+    store.close()
+    assert store._listeners == []
+    assert not log.can_undo()
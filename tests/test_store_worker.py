@@ -0,0 +1,194 @@
+"""작업 스레드: 순서대로 실행, 결과는 after 콜백으로, 같은 key의 이전 작업 취소"""
+import threading
+import time
+
+from store_worker import InlineWorker, StoreWorker
+
+
+class FakeRoot:
+    """after로 예약한 콜백을 모아 두었다가 pump()에서 메인 스레드처럼 실행"""
+
+    def __init__(self):
+        self.scheduled = []
+
+    def after(self, ms, callback):
+        self.scheduled.append(callback)
+
+    def pump(self, worker, timeout=5.0):
+        deadline = time.monotonic() + timeout
+        while worker.pending() and time.monotonic() < deadline:
+            callbacks, self.scheduled = self.scheduled, []
+            for callback in callbacks:
+                callback()
+            time.sleep(0.001)
+        assert worker.pending() == 0
+
+
+def _worker():
+    root = FakeRoot()
+    return root, StoreWorker(root)
+
+
+def test_results_delivered_in_submit_order():
+    root, worker = _worker()
+    try:
+        got = []
+        for i in range(20):
+            worker.submit(lambda i=i: i * i, on_done=got.append)
+        root.pump(worker)
+        assert got == [i * i for i in range(20)]
+    finally:
+        worker.close()
+
+
+def test_callbacks_run_on_calling_thread():
+    root, worker = _worker()
+    try:
+        threads = []
+        worker.submit(lambda: threading.current_thread(), on_done=lambda t: threads.append((t, threading.current_thread())))
+        root.pump(worker)
+        (job_thread, done_thread), = threads
+        assert job_thread.name == "StoreWorker"
+        assert done_thread is threading.current_thread()
+    finally:
+        worker.close()
+
+
+def test_error_goes_to_on_error_or_is_printed(capsys):
+    root, worker = _worker()
+    try:
+        errors = []
+
+        def boom():
+            raise RuntimeError("boom")
+
+        worker.submit(boom, on_done=lambda r: errors.append("done"), on_error=errors.append)
+        worker.submit(boom)
+        root.pump(worker)
+        assert len(errors) == 1 and str(errors[0]) == "boom"
+        assert "저장소 작업 실패: boom" in capsys.readouterr().out
+    finally:
+        worker.close()
+
+
+def test_failing_callback_is_reported(capsys):
+    root, worker = _worker()
+    try:
+        got = []
+        worker.submit(lambda: 1, on_done=lambda r: 1 / 0)
+        worker.submit(lambda: 2, on_done=got.append)
+        root.pump(worker)
+        assert got == [2]
+        assert "저장소 작업 결과 처리 실패" in capsys.readouterr().out
+    finally:
+        worker.close()
+
+
+def test_same_key_keeps_only_latest_result():
+    root, worker = _worker()
+    try:
+        gate = threading.Event()
+        ran = []
+        got = []
+
+        def slow(value):
+            gate.wait(5)
+            ran.append(value)
+            return value
+
+        # 첫 작업이 실행 중인 동안 같은 key로 두 번 더 넣는다
+        worker.submit(lambda: slow("a"), on_done=got.append, key="list")
+        worker.submit(lambda: slow("b"), on_done=got.append, key="list")
+        worker.submit(lambda: slow("c"), on_done=got.append, key="list")
+        gate.set()
+        root.pump(worker)
+        assert got == ["c"]
+        # 시작 전에 취소된 b는 실행되지 않는다
+        assert "b" not in ran and "c" in ran
+    finally:
+        worker.close()
+
+
+def test_cancel_by_key_and_other_keys_unaffected():
+    root, worker = _worker()
+    try:
+        gate = threading.Event()
+        got = []
+        worker.submit(lambda: gate.wait(5), key="block")
+        worker.submit(lambda: "x", on_done=got.append, key="x")
+        worker.submit(lambda: "y", on_done=got.append, key="y")
+        worker.cancel("x")
+        worker.cancel("missing")
+        gate.set()
+        root.pump(worker)
+        assert got == ["y"]
+    finally:
+        worker.close()
+
+
+def test_close_drops_queued_jobs_and_rejects_new_ones():
+    root, worker = _worker()
+    gate = threading.Event()
+    started = threading.Event()
+    ran = []
+
+    def first():
+        started.set()
+        gate.wait(5)
+        ran.append("first")
+
+    worker.submit(first)
+    worker.submit(lambda: ran.append("second"))
+    assert started.wait(5)
+    threading.Timer(0.05, gate.set).start()
+    worker.close()
+    assert ran == ["first"]
+    assert not worker._thread.is_alive()
+    worker.submit(lambda: ran.append("late"))
+    time.sleep(0.02)
+    assert ran == ["first"]
+
+
+def test_inline_worker_runs_immediately(capsys):
+    worker = InlineWorker()
+    got = []
+    worker.submit(lambda: 5, on_done=got.append, key="k")
+    assert got == [5]
+    errors = []
+    worker.submit(lambda: 1 / 0, on_error=errors.append)
+    assert isinstance(errors[0], ZeroDivisionError)
+    worker.submit(lambda: 1 / 0)
+    assert "저장소 작업 실패" in capsys.readouterr().out
+    worker.cancel("k")
+    assert worker.pending() == 0
+    worker.close()
+
+
+def test_main_thread_callbacks_from_jobs_run_before_the_result():
+    root, worker = _worker()
+    try:
+        calls = []
+        notify = worker.main_thread(lambda value: calls.append((value, threading.current_thread())))
+        notify("direct")
+        worker.submit(lambda: notify("from job") or "done", on_done=lambda r: calls.append((r, None)))
+        assert calls[0] == ("direct", threading.current_thread())
+        root.pump(worker)
+        assert calls[1:] == [("from job", threading.current_thread()), ("done", None)]
+    finally:
+        worker.close()
+
+
+def test_store_events_from_worker_reach_main_thread(tmp_path):
+    from report_store import ReportStore
+    root, worker = _worker()
+    store = ReportStore(tmp_path / "data.json", journal=False, save_delay=0, config={})
+    try:
+        threads = []
+        store.subscribe(worker.main_thread(lambda e: threads.append(threading.current_thread())))
+        worker.submit(lambda: store.add_report("2026-03-02", {"content": "a", "start_date": "2026-03-02"}))
+        root.pump(worker)
+        assert threads == [threading.current_thread()]
+        assert InlineWorker().main_thread(len) is len
+    finally:
+        worker.close()
+        store.close()
@@ -0,0 +1,146 @@
+"""되돌리기/다시 실행: 저장소 종류와 관계없이, 기록 파일을 쓰면 다시 열어도 이어서 할 수 있다"""
+
+
+def _state(store):
+    return sorted((ow, r.id, r.content, r.start_date) for ow, _d, r in store.iter_reports())
+
+
+def test_undo_redo_each_kind(open_store):
+    store = open_store()
+    log = store.enable_undo()
+    states = [_state(store)]
+    store.add_report("2026-04-01", {"content": "a", "start_date": "2026-04-01"})
+    states.append(_state(store))
+    report = store.list_reports_for("2026-04-01")[0]
+    # 시작일이 다른 달로 바뀌는 수정
+    store.update_by_id(report.id, {"content": "a2", "start_date": "2026-06-01"})
+    states.append(_state(store))
+    store.move_by_id(report.id, "2026-04-10", {"content": "a3", "start_date": "2026-04-10"}, new_owner="shared")
+    states.append(_state(store))
+    store.delete_by_id(report.id)
+    states.append(_state(store))
+
+    assert [log.undo() for _ in range(4)] == ["삭제", "이동", "수정", "추가"]
+    assert _state(store) == states[0]
+    assert log.undo() is None
+    for expected in states[1:]:
+        assert log.redo()
+        assert _state(store) == expected
+    assert not log.can_redo()
+
+
+def test_undo_continues_after_reload(open_store, tmp_path):
+    path = tmp_path / "undo.jsonl"
+    store = open_store()
+    log = store.enable_undo(path=path)
+    store.add_report("2026-04-01", {"content": "a", "start_date": "2026-04-01"})
+    before_edit = _state(store)
+    report = store.list_reports_for("2026-04-01")[0]
+    store.update_by_id(report.id, {"content": "b", "start_date": "2026-04-02"})
+    after_edit = _state(store)
+    store.add_report("2026-04-03", {"content": "c", "start_date": "2026-04-03"})
+    assert log.undo() == "추가"
+    store.save_to_json()
+    store.close()
+
+    store = open_store()
+    log = store.enable_undo(path=path)
+    assert _state(store) == after_edit
+    assert log.redo_label() == "추가"
+    assert log.undo() == "수정"
+    assert _state(store) == before_edit
+    store.save_to_json()
+    store.close()
+
+    store = open_store()
+    log = store.enable_undo(path=path)
+    assert _state(store) == before_edit
+    assert log.redo() == "수정"
+    assert log.redo() == "추가"
+    assert [r.content for r in store.list_reports_for("2026-04-03")] == ["c"]
+
+
+def test_steps_are_bounded_and_log_compacted(open_store, tmp_path):
+    path = tmp_path / "undo.jsonl"
+    store = open_store()
+    log = store.enable_undo(max_steps=3, path=path)
+    for day in range(1, 21):
+        store.add_report(f"2026-05-{day:02d}", {"content": str(day), "start_date": f"2026-05-{day:02d}"})
+    assert len(log._undo) == 3
+    assert len(path.read_text(encoding="utf-8").splitlines()) <= 64
+    while log.undo():
+        pass
+    assert len(_state(store)) == 17
+
+
+def test_group_and_occurrence_override_are_one_step(open_store):
+    store = open_store()
+    rule = store.add_rule("weekly", {"content": "회의", "start_date": "2026-03-02"})
+    log = store.enable_undo()
+    store.update_by_id(f"{rule.id}@2026-03-09", {"content": "회의 (장소 변경)", "start_date": "2026-03-09"})
+    assert [r.content for *_rest, r in store.find_reports_for_date("2026-03-09")] == ["회의 (장소 변경)"]
+    assert log.undo() == "수정"
+    assert [r.id for *_rest, r in store.find_reports_for_date("2026-03-09")] == [f"{rule.id}@2026-03-09"]
+
+    with log.group("정리"):
+        store.add_report("2026-03-10", {"content": "x", "start_date": "2026-03-10"})
+        store.add_report("2026-03-11", {"content": "y", "start_date": "2026-03-11"})
+    assert log.undo() == "정리"
+    assert store.find_reports_in_range("2026-03-10", "2026-03-11") == {"2026-03-10": [], "2026-03-11": []}
+
+
+def test_failed_step_is_rolled_back(open_store, monkeypatch):
+    store = open_store()
+    log = store.enable_undo()
+    with log.group("둘"):
+        store.add_report("2026-03-10", {"content": "x", "start_date": "2026-03-10"})
+        store.add_report("2026-03-11", {"content": "y", "start_date": "2026-03-11"})
+    before = _state(store)
+    first = store.list_reports_for("2026-03-10")[0].id
+    delete_by_id = store.delete_by_id
+
+    def failing(report_id):
+        if report_id == first:
+            raise RuntimeError("boom")
+        return delete_by_id(report_id)
+
+    # 되돌리기는 y부터 지우고 x에서 실패 -> y를 다시 넣어 단계 전체가 적용되지 않은 상태
+    monkeypatch.setattr(store, "delete_by_id", failing)
+    assert log.undo() is None
+    assert _state(store) == before
+    assert not log.can_undo()
+
+
+def test_failed_redo_is_rolled_back(open_store, monkeypatch):
+    store = open_store()
+    log = store.enable_undo()
+    store.add_report("2026-03-10", {"content": "x", "start_date": "2026-03-10"})
+    report = store.list_reports_for("2026-03-10")[0]
+    with log.group("정리"):
+        store.update_by_id(report.id, {"content": "x2", "start_date": "2026-03-10"})
+        store.delete_by_id(report.id)
+    assert log.undo() == "정리"
+    before = _state(store)
+
+    monkeypatch.setattr(store, "delete_by_id", lambda report_id: False)
+    assert log.redo() is None
+    assert _state(store) == before
+
+
+def test_history_does_not_alias_store_reports(open_store):
+    from report_store import Report
+    store = open_store()
+    log = store.enable_undo()
+    store.add_report("2026-03-10", {"content": "a", "start_date": "2026-03-10"})
+    report_id = store.list_reports_for("2026-03-10")[0].id
+    mine = Report(content="b", report_id="caller")
+    store.update_by_id(report_id, mine)
+    assert mine.id == "caller"
+    assert store.get_by_id(report_id) is not mine
+
+    assert log.undo() == "수정"
+    assert log.redo() == "수정"
+    live = store.get_by_id(report_id)
+    recorded = {id(r) for step in list(log._undo) + log._redo for op in step.ops for r in (op[3], op[6])}
+    assert id(live) not in recorded
+    assert live.content == "b"
@@ -0,0 +1,90 @@
+"""VirtualListbox: 보이는 행만 만든다 (화면 없이 가짜 Listbox로 확인)"""
+from virtual_list import VirtualListbox
+
+
+class _FakeListbox:
+    def __init__(self):
+        self.rows = []
+        self.selected = set()
+        self.events = []
+
+    def delete(self, first, last=None):
+        if last is None:
+            del self.rows[first]
+        else:
+            self.rows = []
+
+    def insert(self, index, *labels):
+        if index == "end":
+            self.rows.extend(labels)
+        else:
+            self.rows[index:index] = labels
+
+    def selection_clear(self, first, last=None):
+        self.selected = set()
+
+    def selection_set(self, row):
+        self.selected = {row}
+
+    def curselection(self):
+        return tuple(sorted(self.selected))
+
+    def event_generate(self, sequence, **kw):
+        self.events.append(sequence)
+
+
+class _FakeScrollbar:
+    def set(self, first, last):
+        self.fractions = (first, last)
+
+
+class _Event:
+    def __init__(self, height):
+        self.height = height
+
+
+def _make(rows=5):
+    formatted = []
+
+    def formatter(index, key):
+        formatted.append(index)
+        return f"{index}:{key}"
+    vl = VirtualListbox.__new__(VirtualListbox)
+    vl.formatter = formatter
+    vl._keys, vl._top, vl._rows, vl._selected, vl._select_handlers = [], 0, 1, None, []
+    vl._line_height = 10
+    vl.listbox = _FakeListbox()
+    vl.scrollbar = _FakeScrollbar()
+    vl._on_configure(_Event(rows * 10))
+    return vl, formatted
+
+
+def test_only_visible_rows_are_formatted():
+    vl, formatted = _make(rows=5)
+    vl.set_items(range(10000))
+    assert vl.listbox.rows == ["0:0", "1:1", "2:2", "3:3", "4:4"]
+    assert len(formatted) == 5
+    vl.yview("moveto", "0.5")
+    assert vl.listbox.rows[0] == "5000:5000"
+    assert vl.yview() == (0.5, 0.5005)
+    vl.yview("scroll", "1", "pages")
+    assert vl.listbox.rows[0] == "5005:5005"
+    vl.yview("moveto", "1.0")
+    assert vl.listbox.rows[-1] == "9999:9999"
+    assert len(formatted) == 20
+
+
+def test_selection_uses_full_list_index():
+    vl, _formatted = _make(rows=3)
+    vl.set_items("abcdefgh")
+    vl.selection_set(6)
+    assert vl.curselection() == (6,)
+    assert vl.listbox.selected == set()  # 보이지 않는 행
+    vl.see(6)
+    assert vl.listbox.rows == ["4:e", "5:f", "6:g"]
+    assert vl.listbox.selected == {2}
+    vl._step(1)
+    assert vl.curselection() == (7,)
+    assert vl.listbox.rows[-1] == "7:h" and vl.listbox.events == ["<<ListboxSelect>>"]
+    vl.refresh_row(7)
+    assert vl.listbox.rows == ["5:f", "6:g", "7:h"] and vl.listbox.selected == {2}
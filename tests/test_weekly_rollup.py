@@ -0,0 +1,40 @@
+from report_store import Report
+from weekly_rollup import WeeklyRollup, iso_week_monday, rollup_from_buckets
+
+
+def _report(start, end=None, category=""):
+    return Report.from_dict({"content": "", "category": category, "start_date": start, "end_date": end or start})
+
+
+def test_rollup_counts_each_week_once():
+    rollup = WeeklyRollup()
+    # 2026-03-06(금) ~ 2026-03-10(화): 10주차와 11주차에 걸침
+    long = _report("2026-03-06", "2026-03-10", "출장")
+    rollup.add("personal", long)
+    rollup.add("shared", _report("2026-03-09"))
+    week10 = rollup.summary(iso_week_monday(2026, 10))
+    week11 = rollup.summary(iso_week_monday(2026, 11))
+    assert (week10["reports"], week10["days_covered"], week10["categories"]) == (1, 3, {"출장": 1})
+    assert (week11["reports"], week11["by_owner"]) == (2, {"personal": 1, "shared": 1})
+    assert week11["days"] == {"2026-03-09": 2, "2026-03-10": 1}
+    rollup.remove("personal", long)
+    assert rollup.summary(iso_week_monday(2026, 10))["reports"] == 0
+    assert rollup.summary(iso_week_monday(2026, 11))["days"] == {"2026-03-09": 1}
+
+
+def test_store_summary_matches_range_buckets(open_store):
+    store = open_store()
+    store.add_report("2026-03-06", {"content": "a", "category": "출장", "start_date": "2026-03-06",
+                                    "end_date": "2026-03-10"})
+    store.add_report("2026-03-09", {"content": "b", "start_date": "2026-03-09"}, owner="shared")
+    r = store.list_reports_for("2026-03-09", owner="shared")[0]
+    store.move_by_id(r.id, "2026-03-12", {"content": "b", "category": "회의", "start_date": "2026-03-12"})
+    monday = iso_week_monday(2026, 11)
+    expected = rollup_from_buckets(monday, store.find_reports_in_range("2026-03-09", "2026-03-15"))
+    assert store.week_summary(2026, 11) == expected
+    assert expected["reports"] == 2 and expected["categories"] == {"출장": 1, "회의": 1}
+    store.save_to_json()
+    store.close()
+
+    store = open_store()
+    assert store.week_summary_for("2026-03-11") == expected
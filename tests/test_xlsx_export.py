@@ -0,0 +1,42 @@
+import zipfile
+import xml.etree.ElementTree as ET
+
+from report_store import ReportStore
+from xlsx_export import XlsxStreamWriter, export_week, export_year
+
+NS = {"x": "http://schemas.openxmlformats.org/spreadsheetml/2006/main"}
+
+
+def _rows(path):
+    with zipfile.ZipFile(path) as z:
+        for name in ("[Content_Types].xml", "xl/workbook.xml", "xl/styles.xml"):
+            ET.fromstring(z.read(name))
+        sheet = ET.fromstring(z.read("xl/worksheets/sheet1.xml"))
+    return [["".join(c.itertext()) for c in row.findall("x:c", NS)] for row in sheet.iter(f"{{{NS['x']}}}row")]
+
+
+def test_stream_writer_escapes_and_numbers(tmp_path):
+    path = tmp_path / "out.xlsx"
+    with XlsxStreamWriter(path, "a/b", widths=[10, 20], freeze_rows=1) as writer:
+        writer.write_row(["<제목> & \x01", 3, None])
+        writer.merge(0, 1)
+    assert _rows(path) == [["<제목> & ", "3", ""]]
+    assert not (tmp_path / "out.xlsx.tmp").exists()
+
+
+def test_export_week_and_year(tmp_path):
+    store = ReportStore(tmp_path / "data.json", journal=False, save_delay=0, config={})
+    store.add_report("2026-03-09", {"content": "회의", "category": "회의", "start_date": "2026-03-09",
+                                    "end_date": "2026-03-10"})
+    store.add_report("2026-03-11", {"content": "공통", "start_date": "2026-03-11"}, owner="shared")
+    store.add_report("2026-05-04", {"content": "출장", "start_date": "2026-05-04"})
+    config = {"name": "홍길동", "xlsx_template": {"columns": ["period", "content"]}}
+    path = export_week(store, 2026, 11, config, out_dir=tmp_path / "xlsx")
+    assert path.name == "2026년_11주차_주간업무보고.xlsx"
+    rows = _rows(path)
+    assert rows[0] == ["홍길동 주간업무보고 (2026년 11주차, 2026-03-09 ~ 2026-03-15)"]
+    assert rows[1:] == [["period", "content"], ["2026-03-09 ~ 2026-03-10", "회의"]]
+
+    paths = export_year(store, 2026, config, out_dir=tmp_path / "year")
+    assert [p.name[:10] for p in paths] == ["2026년_11주차", "2026년_19주차"]
+    store.close()
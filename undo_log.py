@@ -0,0 +1,336 @@
+"""보고서 변경 되돌리기/다시 실행
+
+ReportStore.enable_undo()로 켜면 저장소의 변경 알림(ChangeEvent)마다 그 변경 하나를 되돌릴 수 있는
+기록을 남긴다. 보고서 전체를 복사해 두지 않고 바뀐 보고서의 변경 전/후 Report만 들고 있으므로
+(Report는 교체만 되므로 참조를 그대로 보관) 되돌리기는 그 변경 한 건만큼의 일이다.
+저장소에 다시 넣을 때는 복사본을 넘겨 기록이 저장소 안의 Report와 섞이지 않게 한다.
+한 단계의 변경 중 하나가 실패하면 이미 적용한 변경을 거꾸로 되돌려 단계 전체를 없던 일로 한다.
+
+- 단계 수(max_steps)와 대략의 메모리(max_kb)를 넘으면 오래된 단계부터 버린다.
+- path를 주면 단계를 JSON Lines로 덧붙여 기록해 다시 실행해도 되돌릴 수 있다.
+  파일이 단계 수보다 많이 커지면 남은 단계만 다시 쓴다.
+- 여러 변경을 한 단계로 묶으려면 with log.group("카테고리 삭제"): ...
+"""
+import json
+import os
+from collections import deque
+from pathlib import Path
+
+from report_store import Report
+
+
+DEFAULT_MAX_STEPS = 100
+DEFAULT_MAX_KB = 1024
+
+KIND_LABELS = {"added": "추가", "updated": "수정", "moved": "이동", "deleted": "삭제"}
+
+# 보고서/변경 한 건의 고정 크기 어림값 (bytes)
+_REPORT_OVERHEAD = 160
+_OP_OVERHEAD = 120
+
+
+def undo_options(config):
+    """config의 undo 항목 -> enable_undo() 인자 (persist면 data_dir/undo.jsonl에 기록)"""
+    from app_config import data_dir
+    options = config.get("undo") or {}
+    if not isinstance(options, dict):
+        options = {}
+    return {
+        "max_steps": options.get("max_steps", DEFAULT_MAX_STEPS),
+        "max_kb": options.get("max_kb", DEFAULT_MAX_KB),
+        "path": data_dir(config) / "undo.jsonl" if options.get("persist") else None,
+    }
+
+
+def _copy(report):
+    return Report.from_dict(dict(report)) if report is not None else None
+
+
+def _report_size(report):
+    if report is None:
+        return 0
+    return _REPORT_OVERHEAD + len(report.content) + len(report.location) + len(report.attendees)
+
+
+class Step:
+    """되돌리기 한 단계: 변경 목록 [(kind, owner, date, report, old_owner, old_date, old_report)]"""
+    __slots__ = ("label", "ops", "size")
+
+    def __init__(self, label, ops):
+        self.label = label
+        self.ops = ops
+        self.size = sum(_OP_OVERHEAD + _report_size(op[3]) + _report_size(op[6]) for op in ops)
+
+    def to_json(self):
+        return {"label": self.label,
+                "ops": [[kind, owner, date, report.to_dict(), old_owner, old_date,
+                         old.to_dict() if old is not None else None]
+                        for kind, owner, date, report, old_owner, old_date, old in self.ops]}
+
+    @classmethod
+    def from_json(cls, data):
+        ops = []
+        for kind, owner, date, report, old_owner, old_date, old in data["ops"]:
+            ops.append((kind, owner, date, Report.from_dict(report, date),
+                        old_owner, old_date, Report.from_dict(old, old_date) if old is not None else None))
+        return cls(data.get("label", ""), ops)
+
+
+class UndoLog:
+    def __init__(self, store, max_steps=None, max_kb=None, path=None):
+        self.store = store
+        self.max_steps = max_steps or DEFAULT_MAX_STEPS
+        self.max_bytes = (max_kb or DEFAULT_MAX_KB) * 1024
+        self.path = Path(path) if path else None
+        self._undo = deque()   # 오래된 것부터
+        self._redo = []        # 끝이 다음에 다시 실행할 단계
+        self._size = 0
+        self._group = None     # group() 안에서 모으는 변경
+        self._group_label = ""
+        self._group_depth = 0
+        self._applying = False
+        self._lines = 0        # 기록 파일의 줄 수
+        self._listeners = []
+        if self.path is not None:
+            self._load()
+        # 변경과 같은 잠금 안에서 바로 받아야 group() 안의 변경이 한 단계로 묶인다
+        self._unsubscribe = store.subscribe(self._on_change, immediate=True)
+
+    # --- 상태 ---
+    def can_undo(self):
+        return bool(self._undo)
+
+    def can_redo(self):
+        return bool(self._redo)
+
+    def undo_label(self):
+        return self._undo[-1].label if self._undo else None
+
+    def redo_label(self):
+        return self._redo[-1].label if self._redo else None
+
+    def subscribe(self, callback):
+        """단계가 쌓이거나 되돌려질 때마다 callback() (버튼 상태 갱신용). 해제 함수 반환"""
+        self._listeners.append(callback)
+
+        def unsubscribe():
+            if callback in self._listeners:
+                self._listeners.remove(callback)
+        return unsubscribe
+
+    def _notify(self):
+        for callback in list(self._listeners):
+            try:
+                callback()
+            except Exception as e:
+                print(f"되돌리기 상태 알림 실패: {e}")
+
+    def close(self):
+        self._unsubscribe()
+        self._listeners = []
+
+    def clear(self):
+        self._undo.clear()
+        self._redo = []
+        self._size = 0
+        if self.path is not None:
+            self._compact()
+        self._notify()
+
+    # --- 기록 ---
+    def group(self, label):
+        """with 블록 안의 변경을 한 단계로 묶는다 (중첩되면 가장 바깥 블록 기준)"""
+        return _Group(self, label)
+
+    def _begin(self, label):
+        if self._group_depth == 0:
+            self._group = []
+            self._group_label = label
+        self._group_depth += 1
+
+    def _end(self):
+        self._group_depth -= 1
+        if self._group_depth == 0:
+            ops, self._group = self._group, None
+            if ops:
+                self._push(Step(self._group_label, ops))
+
+    def _on_change(self, event):
+        # 반복 규칙 자체의 추가/수정/삭제('rule')는 기록하지 않는다 (항목 빼기/되살리기는 deleted/added)
+        if self._applying or event.kind not in KIND_LABELS:
+            return
+        op = (event.kind, event.owner, event.date, event.report,
+              event.old_owner, event.old_date, event.old_report)
+        if self._group is not None:
+            self._group.append(op)
+        else:
+            self._push(Step(KIND_LABELS.get(event.kind, event.kind), [op]))
+
+    def _push(self, step, record=True):
+        self._undo.append(step)
+        self._size += step.size
+        if self._redo:
+            self._size -= sum(s.size for s in self._redo)
+            self._redo = []
+        self._trim()
+        if record:
+            self._append({"do": step.to_json()})
+            self._notify()
+
+    def _trim(self):
+        while self._undo and (len(self._undo) + len(self._redo) > self.max_steps or self._size > self.max_bytes):
+            self._size -= self._undo.popleft().size
+        while self._redo and (len(self._redo) > self.max_steps or self._size > self.max_bytes):
+            self._size -= self._redo.pop(0).size
+
+    # --- 되돌리기 / 다시 실행 ---
+    def undo(self):
+        """마지막 단계를 되돌린다. 되돌린 단계 이름 (없거나 실패하면 None)"""
+        if not self._undo:
+            return None
+        step = self._undo.pop()
+        if not self._run(step, reverse=True):
+            self._size -= step.size
+            self._append({"drop": 1})
+            self._notify()
+            return None
+        self._redo.append(step)
+        self._append({"undo": 1})
+        self._notify()
+        return step.label
+
+    def redo(self):
+        """되돌린 단계를 다시 실행한다. 다시 실행한 단계 이름 (없거나 실패하면 None)"""
+        if not self._redo:
+            return None
+        step = self._redo.pop()
+        if not self._run(step, reverse=False):
+            self._size -= step.size
+            self._append({"drop_redo": 1})
+            self._notify()
+            return None
+        self._undo.append(step)
+        self._append({"redo": 1})
+        self._notify()
+        return step.label
+
+    def _run(self, step, reverse):
+        if reverse:
+            ops, forward, backward = list(reversed(step.ops)), self._apply_inverse, self._apply
+        else:
+            ops, forward, backward = step.ops, self._apply, self._apply_inverse
+        done = []
+        self._applying = True
+        try:
+            for op in ops:
+                forward(*op)
+                done.append(op)
+        except Exception as e:
+            # 기록 뒤에 다른 곳에서 바뀐 보고서 (가져오기 등): 이미 적용한 변경은 되돌리고 이 단계는 버린다
+            print(f"되돌리기 실패 ({step.label}): {e}")
+            for op in reversed(done):
+                try:
+                    backward(*op)
+                except Exception as e:
+                    print(f"되돌리기 복구 실패 ({step.label}): {e}")
+            return False
+        finally:
+            self._applying = False
+        return True
+
+    def _apply_inverse(self, kind, owner, date, report, old_owner, old_date, old):
+        store = self.store
+        if kind == "added":
+            if not store.delete_by_id(report.id):
+                raise KeyError(report.id)
+        elif kind == "deleted":
+            store.restore_report(date, _copy(report), owner)
+        elif kind == "updated":
+            store.update_by_id(report.id, _copy(old))
+        elif kind == "moved":
+            store.move_by_id(report.id, old_date, _copy(old), new_owner=old_owner)
+
+    def _apply(self, kind, owner, date, report, old_owner, old_date, old):
+        store = self.store
+        if kind == "added":
+            store.restore_report(date, _copy(report), owner)
+        elif kind == "deleted":
+            if not store.delete_by_id(report.id):
+                raise KeyError(report.id)
+        elif kind == "updated":
+            store.update_by_id(report.id, _copy(report))
+        elif kind == "moved":
+            store.move_by_id(report.id, date, _copy(report), new_owner=owner)
+
+    # --- 파일 기록 ---
+    def _append(self, entry):
+        if self.path is None:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            self._lines += 1
+        except Exception as e:
+            print(f"되돌리기 기록 실패: {e}")
+            return
+        if self._lines > max(self.max_steps * 4, 64):
+            self._compact()
+
+    def _load(self):
+        """기록 파일을 읽어 단계를 되살린다 (저장소에는 적용하지 않음)"""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    self._lines += 1
+                    try:
+                        entry = json.loads(line)
+                    except Exception:
+                        # 마지막 줄을 쓰다 끊긴 경우
+                        continue
+                    self._replay(entry)
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            print(f"되돌리기 기록 로드 실패: {e}")
+
+    def _replay(self, entry):
+        if "do" in entry:
+            self._push(Step.from_json(entry["do"]), record=False)
+        elif "undo" in entry and self._undo:
+            self._redo.append(self._undo.pop())
+        elif "redo" in entry and self._redo:
+            self._undo.append(self._redo.pop())
+        elif "drop" in entry and self._undo:
+            self._size -= self._undo.pop().size
+        elif "drop_redo" in entry and self._redo:
+            self._size -= self._redo.pop().size
+
+    def _compact(self):
+        """남은 단계만 다시 쓴다: 되돌릴 단계, 다시 실행할 단계를 차례로 쓰고 그만큼 undo"""
+        lines = [{"do": step.to_json()} for step in self._undo]
+        lines.extend({"do": step.to_json()} for step in reversed(self._redo))
+        lines.extend({"undo": 1} for _ in self._redo)
+        tmp = self.path.with_suffix(".tmp")
+        try:
+            with open(tmp, 'w', encoding='utf-8') as f:
+                for entry in lines:
+                    f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            os.replace(tmp, self.path)
+            self._lines = len(lines)
+        except Exception as e:
+            print(f"되돌리기 기록 정리 실패: {e}")
+
+
+class _Group:
+    def __init__(self, log, label):
+        self.log = log
+        self.label = label
+
+    def __enter__(self):
+        self.log._begin(self.label)
+        return self.log
+
+    def __exit__(self, exc_type, exc, tb):
+        self.log._end()
+        return False
@@ -0,0 +1,171 @@
+import tkinter as tk
+import tkinter.font as tkfont
+
+
+class VirtualListbox(tk.Frame):
+    """화면에 보이는 행만 만드는 목록
+
+    항목 전체는 key 목록으로만 들고 있고, 보이는 범위의 행만 formatter(index, key)로
+    글자를 만들어 안쪽 Listbox에 넣는다. 스크롤하면 그 범위만 다시 채운다.
+    curselection/selection_set/see 등은 전체 목록 기준 index를 쓰므로 tk.Listbox처럼 쓸 수 있다.
+    """
+
+    def __init__(self, parent, formatter, **listbox_options):
+        super().__init__(parent)
+        self.formatter = formatter
+        self._keys = []
+        self._top = 0
+        self._rows = 1
+        self._selected = None
+        self._select_handlers = []
+        listbox_options.setdefault("exportselection", False)
+        self.listbox = tk.Listbox(self, **listbox_options)
+        self.listbox.pack(side="left", fill="both", expand=True)
+        self.scrollbar = tk.Scrollbar(self, command=self.yview)
+        self.scrollbar.pack(side="left", fill="y")
+
+        try:
+            self._line_height = tkfont.Font(font=self.listbox.cget("font")).metrics("linespace") + 1
+        except Exception:
+            self._line_height = 16
+        self.listbox.bind("<Configure>", self._on_configure)
+        self.listbox.bind("<<ListboxSelect>>", self._on_native_select)
+        for seq in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.listbox.bind(seq, self._on_wheel)
+        self.listbox.bind("<Up>", lambda e: self._step(-1))
+        self.listbox.bind("<Down>", lambda e: self._step(1))
+        self.listbox.bind("<Prior>", lambda e: self._step(-self._rows))
+        self.listbox.bind("<Next>", lambda e: self._step(self._rows))
+
+    # --- data ---
+    def set_items(self, keys):
+        """목록 전체 교체 (선택 해제, 맨 위로)"""
+        self._keys = list(keys)
+        self._top = 0
+        self._selected = None
+        self._render()
+
+    def keys(self):
+        return list(self._keys)
+
+    def size(self):
+        return len(self._keys)
+
+    def refresh_row(self, index):
+        """index 행만 다시 만든다 (보이지 않는 행이면 할 일 없음)"""
+        row = index - self._top
+        if not (0 <= row < self._rows) or index >= len(self._keys):
+            return
+        self.listbox.delete(row)
+        self.listbox.insert(row, self.formatter(index, self._keys[index]))
+        if self._selected == index:
+            self.listbox.selection_set(row)
+
+    # --- tk.Listbox 호환 ---
+    def bind(self, sequence=None, func=None, add=None):
+        # <<ListboxSelect>> 등은 안쪽 Listbox에서 발생한다.
+        # 선택 이벤트는 전체 목록 기준 선택 위치를 먼저 갱신한 뒤 넘겨준다
+        if sequence == "<<ListboxSelect>>":
+            if not add:
+                self._select_handlers = []
+            self._select_handlers.append(func)
+            return None
+        return self.listbox.bind(sequence, func, add)
+
+    def event_generate(self, sequence, **kw):
+        return self.listbox.event_generate(sequence, **kw)
+
+    def curselection(self):
+        return () if self._selected is None else (self._selected,)
+
+    def selection_set(self, index):
+        if 0 <= index < len(self._keys):
+            self._selected = index
+            self._sync_selection()
+
+    def selection_clear(self, first=0, last=None):
+        self._selected = None
+        self.listbox.selection_clear(0, tk.END)
+
+    def delete(self, first=0, last=None):
+        self.set_items([])
+
+    def see(self, index):
+        if index < self._top:
+            self._top = index
+        elif index >= self._top + self._rows:
+            self._top = index - self._rows + 1
+        else:
+            return
+        self._render()
+
+    def yview(self, *args):
+        if not args:
+            return self._fractions()
+        if args[0] == "moveto":
+            top = int(float(args[1]) * len(self._keys))
+        elif args[0] == "scroll":
+            step = int(args[1])
+            top = self._top + (step * self._rows if args[2] == "pages" else step)
+        else:
+            return None
+        self._scroll_to(top)
+
+    # --- internals ---
+    def _fractions(self):
+        n = len(self._keys)
+        if not n:
+            return 0.0, 1.0
+        return self._top / n, min(1.0, (self._top + self._rows) / n)
+
+    def _scroll_to(self, top):
+        top = max(0, min(top, len(self._keys) - self._rows))
+        if top != self._top:
+            self._top = top
+            self._render()
+
+    def _render(self):
+        end = min(len(self._keys), self._top + self._rows)
+        labels = [self.formatter(i, self._keys[i]) for i in range(self._top, end)]
+        self.listbox.delete(0, tk.END)
+        if labels:
+            self.listbox.insert(tk.END, *labels)
+        self._sync_selection()
+        self.scrollbar.set(*self._fractions())
+
+    def _sync_selection(self):
+        self.listbox.selection_clear(0, tk.END)
+        if self._selected is not None and self._top <= self._selected < self._top + self._rows:
+            self.listbox.selection_set(self._selected - self._top)
+
+    def _on_configure(self, event):
+        rows = max(1, event.height // self._line_height)
+        if rows != self._rows:
+            self._rows = rows
+            self._top = max(0, min(self._top, len(self._keys) - rows))
+            self._render()
+
+    def _on_native_select(self, event):
+        sel = self.listbox.curselection()
+        if sel:
+            self._selected = self._top + sel[0]
+        for handler in self._select_handlers:
+            handler(event)
+
+    def _on_wheel(self, event):
+        if getattr(event, "num", None) == 4 or getattr(event, "delta", 0) > 0:
+            self._scroll_to(self._top - 3)
+        else:
+            self._scroll_to(self._top + 3)
+        return "break"
+
+    def _step(self, delta):
+        if not self._keys:
+            return "break"
+        current = self._selected if self._selected is not None else self._top - (1 if delta > 0 else 0)
+        index = max(0, min(len(self._keys) - 1, current + delta))
+        self._selected = index
+        self.see(index)
+        self._sync_selection()
+        self.listbox.event_generate("<<ListboxSelect>>")
+        return "break"
@@ -0,0 +1,116 @@
+from datetime import date as _date, timedelta
+
+
+def week_monday(ordinal):
+    """ordinal이 속한 주의 월요일 ordinal (ISO 주: 월~일)"""
+    return ordinal - _date.fromordinal(ordinal).weekday()
+
+
+def iso_week_monday(year, week):
+    """ISO (연도, 주차) -> 월요일 ordinal"""
+    return _date.fromisocalendar(year, week, 1).toordinal()
+
+
+def _week_spans(start, end):
+    """[start, end] 기간을 주 단위로 나눈 (월요일, 주 안의 시작일, 주 안의 종료일) 목록"""
+    monday = week_monday(start)
+    while monday <= end:
+        yield monday, max(start, monday), min(end, monday + 6)
+        monday += 7
+
+
+class _WeekStats:
+    __slots__ = ("reports", "by_owner", "categories", "days")
+
+    def __init__(self):
+        self.reports = 0
+        self.by_owner = {}
+        self.categories = {}
+        self.days = {}  # day ordinal -> 그 날을 포함하는 보고서 수
+
+
+def _bump(counts, key, delta):
+    n = counts.get(key, 0) + delta
+    if n > 0:
+        counts[key] = n
+    else:
+        counts.pop(key, None)
+
+
+class WeeklyRollup:
+    """ISO 주 단위 집계 (보고서 수, owner별 수, 카테고리별 수, 보고서가 있는 날)
+
+    보고서가 들어오고 나갈 때 그 보고서 기간에 걸친 주만 갱신하므로
+    주간 화면을 열거나 넘길 때 전체 기록을 다시 계산하지 않는다.
+    여러 날에 걸친 보고서는 걸친 주마다 한 번씩 세고, 날짜별로는 포함하는 모든 날에 센다.
+    """
+
+    def __init__(self):
+        self._weeks = {}  # monday ordinal -> _WeekStats
+
+    def clear(self):
+        self._weeks = {}
+
+    def add(self, owner, report):
+        self._apply(owner, report, 1)
+
+    def remove(self, owner, report):
+        self._apply(owner, report, -1)
+
+    def _apply(self, owner, report, delta):
+        if report.start is None:
+            return
+        for monday, lo, hi in _week_spans(report.start, report.end):
+            stats = self._weeks.get(monday)
+            if stats is None:
+                if delta < 0:
+                    continue
+                stats = self._weeks[monday] = _WeekStats()
+            stats.reports += delta
+            _bump(stats.by_owner, owner, delta)
+            if report.category:
+                _bump(stats.categories, report.category, delta)
+            for day in range(lo, hi + 1):
+                _bump(stats.days, day, delta)
+            if stats.reports <= 0:
+                del self._weeks[monday]
+
+    def summary(self, monday):
+        """월요일 ordinal의 주 집계를 dict로 반환 (보고서가 없어도 빈 집계)"""
+        return summarize(monday, self._weeks.get(monday))
+
+
+def summarize(monday, stats=None):
+    monday_date = _date.fromordinal(monday)
+    iso_year, iso_week, _ = monday_date.isocalendar()
+    if stats is None:
+        stats = _WeekStats()
+    return {
+        "year": iso_year,
+        "week": iso_week,
+        "start": monday_date.strftime("%Y-%m-%d"),
+        "end": (monday_date + timedelta(days=6)).strftime("%Y-%m-%d"),
+        "reports": stats.reports,
+        "by_owner": dict(stats.by_owner),
+        "categories": dict(sorted(stats.categories.items(), key=lambda kv: (-kv[1], kv[0]))),
+        "days": {_date.fromordinal(d).strftime("%Y-%m-%d"): n for d, n in sorted(stats.days.items())},
+        "days_covered": len(stats.days),
+    }
+
+
+def rollup_from_buckets(monday, buckets):
+    """find_reports_in_range 결과(해당 주 7일)로 한 주 집계를 만든다 (메모리 색인이 없는 저장소용)"""
+    stats = _WeekStats()
+    seen = set()
+    for day_str, entries in buckets.items():
+        day = _date.fromisoformat(day_str).toordinal()
+        for owner, _orig_date, _idx, report in entries:
+            _bump(stats.days, day, 1)
+            if report.id in seen:
+                continue
+            seen.add(report.id)
+            stats.reports += 1
+            _bump(stats.by_owner, owner, 1)
+            if report.category:
+                _bump(stats.categories, report.category, 1)
+    return summarize(monday, stats)
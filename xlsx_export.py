@@ -0,0 +1,282 @@
+import os
+import re
+import zipfile
+from datetime import date as _date, timedelta
+from pathlib import Path
+from xml.sax.saxutils import escape
+
+from report_store import weekly_report_dir
+
+
+# config.json의 xlsx_template에 없는 항목은 이 값을 쓴다
+DEFAULT_TEMPLATE = {
+    "file_name": "{year}년_{week:02d}주차_주간업무보고.xlsx",
+    "sheet_name": "주간업무보고",
+    "title": "{name} 주간업무보고 ({year}년 {week}주차, {start} ~ {end})",
+    "owner": "personal",
+    "header_fill": "#D9E1F2",
+    "columns": [
+        {"field": "period", "header": "기간", "width": 24},
+        {"field": "category", "header": "카테고리", "width": 14},
+        {"field": "content", "header": "내용", "width": 60},
+        {"field": "location", "header": "장소", "width": 14},
+        {"field": "attendees", "header": "참석자", "width": 20},
+    ],
+}
+
+# cellXfs 순서 (styles.xml 참고)
+STYLE_DEFAULT, STYLE_TITLE, STYLE_HEADER, STYLE_BODY = 0, 1, 2, 3
+
+_ILLEGAL_XML = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f]")
+
+_CONTENT_TYPES = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">
+<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>
+<Default Extension="xml" ContentType="application/xml"/>
+<Override PartName="/xl/workbook.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>
+<Override PartName="/xl/worksheets/sheet1.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>
+<Override PartName="/xl/styles.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>
+</Types>"""
+
+_ROOT_RELS = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
+<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="xl/workbook.xml"/>
+</Relationships>"""
+
+_WORKBOOK = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">
+<sheets><sheet name="{sheet_name}" sheetId="1" r:id="rId1"/></sheets>
+</workbook>"""
+
+_WORKBOOK_RELS = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
+<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" Target="worksheets/sheet1.xml"/>
+<Relationship Id="rId2" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" Target="styles.xml"/>
+</Relationships>"""
+
+_STYLES = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<styleSheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
+<fonts count="3">
+<font><sz val="11"/><name val="맑은 고딕"/></font>
+<font><b/><sz val="11"/><name val="맑은 고딕"/></font>
+<font><b/><sz val="14"/><name val="맑은 고딕"/></font>
+</fonts>
+<fills count="3">
+<fill><patternFill patternType="none"/></fill>
+<fill><patternFill patternType="gray125"/></fill>
+<fill><patternFill patternType="solid"><fgColor rgb="{header_fill}"/><bgColor indexed="64"/></patternFill></fill>
+</fills>
+<borders count="2">
+<border><left/><right/><top/><bottom/><diagonal/></border>
+<border><left style="thin"/><right style="thin"/><top style="thin"/><bottom style="thin"/><diagonal/></border>
+</borders>
+<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>
+<cellXfs count="4">
+<xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>
+<xf numFmtId="0" fontId="2" fillId="0" borderId="0" xfId="0" applyFont="1"/>
+<xf numFmtId="0" fontId="1" fillId="2" borderId="1" xfId="0" applyFont="1" applyFill="1" applyBorder="1" applyAlignment="1"><alignment horizontal="center" vertical="center"/></xf>
+<xf numFmtId="0" fontId="0" fillId="0" borderId="1" xfId="0" applyBorder="1" applyAlignment="1"><alignment vertical="top" wrapText="1"/></xf>
+</cellXfs>
+</styleSheet>"""
+
+
+def xlsx_template(config):
+    """config의 xlsx_template을 기본값 위에 덮어쓴 템플릿"""
+    template = dict(DEFAULT_TEMPLATE)
+    custom = config.get("xlsx_template") if config else None
+    if isinstance(custom, dict):
+        template.update({k: v for k, v in custom.items() if v not in (None, "", [], {})})
+    # columns는 필드 이름 문자열 목록으로 줘도 된다
+    template["columns"] = [c if isinstance(c, dict) else {"field": str(c), "header": str(c)}
+                           for c in template["columns"]]
+    return template
+
+
+def _column_letter(n):
+    """0 -> A, 25 -> Z, 26 -> AA"""
+    letters = ""
+    n += 1
+    while n:
+        n, rem = divmod(n - 1, 26)
+        letters = chr(65 + rem) + letters
+    return letters
+
+
+def _argb(color):
+    color = (color or "").lstrip("#")
+    return ("FF" + color if len(color) == 6 else color).upper() or "FFD9E1F2"
+
+
+def _sheet_name(name):
+    # 엑셀 시트 이름은 31자 이하, []:*?/\ 사용 불가
+    name = re.sub(r"[\[\]:*?/\\]", " ", str(name)).strip()
+    return name[:31] or "Sheet1"
+
+
+class XlsxStreamWriter:
+    """시트 하나짜리 .xlsx를 행 단위로 zip에 바로 기록
+
+    workbook 객체를 만들지 않고, 문자열은 공유 문자열표 대신 inline string으로 써서
+    행 수와 관계없이 메모리 사용량이 일정하다. 열 너비와 틀 고정은 시작할 때 정해야 한다.
+    """
+
+    def __init__(self, path, sheet_name="Sheet1", widths=(), freeze_rows=0, header_fill=None):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._tmp = self.path.with_suffix(self.path.suffix + ".tmp")
+        self._zip = zipfile.ZipFile(self._tmp, 'w', zipfile.ZIP_DEFLATED)
+        self._merges = []
+        self._row = 0
+        try:
+            self._zip.writestr("[Content_Types].xml", _CONTENT_TYPES)
+            self._zip.writestr("_rels/.rels", _ROOT_RELS)
+            self._zip.writestr("xl/workbook.xml", _WORKBOOK.format(sheet_name=escape(_sheet_name(sheet_name), {'"': "&quot;"})))
+            self._zip.writestr("xl/_rels/workbook.xml.rels", _WORKBOOK_RELS)
+            self._zip.writestr("xl/styles.xml", _STYLES.format(header_fill=_argb(header_fill)))
+            # 시트는 마지막에 열어 행이 들어오는 대로 압축 스트림에 흘려보낸다
+            self._sheet = self._zip.open("xl/worksheets/sheet1.xml", 'w')
+            self._write('<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+                        '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+                        'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">')
+            if freeze_rows:
+                self._write(f'<sheetViews><sheetView workbookViewId="0"><pane ySplit="{freeze_rows}" '
+                            f'topLeftCell="A{freeze_rows + 1}" activePane="bottomLeft" state="frozen"/>'
+                            '</sheetView></sheetViews>')
+            if widths:
+                self._write("<cols>")
+                for i, width in enumerate(widths, 1):
+                    self._write(f'<col min="{i}" max="{i}" width="{float(width)}" customWidth="1"/>')
+                self._write("</cols>")
+            self._write("<sheetData>")
+        except Exception:
+            self._abort()
+            raise
+
+    def _write(self, text):
+        self._sheet.write(text.encode("utf-8"))
+
+    def write_row(self, values, style=STYLE_DEFAULT):
+        """값 목록을 다음 행으로 기록 (숫자는 숫자 셀, 나머지는 문자열)"""
+        self._row += 1
+        r = self._row
+        cells = []
+        for i, value in enumerate(values):
+            ref = f"{_column_letter(i)}{r}"
+            if value is None or value == "":
+                cells.append(f'<c r="{ref}" s="{style}"/>')
+            elif isinstance(value, (int, float)) and not isinstance(value, bool):
+                cells.append(f'<c r="{ref}" s="{style}"><v>{value}</v></c>')
+            else:
+                text = escape(_ILLEGAL_XML.sub("", str(value)))
+                cells.append(f'<c r="{ref}" s="{style}" t="inlineStr"><is><t xml:space="preserve">{text}</t></is></c>')
+        self._write(f'<row r="{r}">{"".join(cells)}</row>')
+        return r
+
+    def merge(self, first_col, last_col, row=None):
+        """row(기본: 마지막 행)의 first_col~last_col 셀 병합"""
+        row = row or self._row
+        self._merges.append(f"{_column_letter(first_col)}{row}:{_column_letter(last_col)}{row}")
+
+    def close(self):
+        try:
+            self._write("</sheetData>")
+            if self._merges:
+                self._write(f'<mergeCells count="{len(self._merges)}">')
+                for ref in self._merges:
+                    self._write(f'<mergeCell ref="{ref}"/>')
+                self._write("</mergeCells>")
+            self._write("</worksheet>")
+            self._sheet.close()
+            self._zip.close()
+            os.replace(self._tmp, self.path)
+        except Exception:
+            self._abort()
+            raise
+
+    def _abort(self):
+        try:
+            self._zip.close()
+        except Exception:
+            pass
+        try:
+            self._tmp.unlink()
+        except Exception:
+            pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self._abort()
+        return False
+
+
+def _cell_value(field, owner, report):
+    if field == "period":
+        if report.start_date == report.end_date:
+            return report.start_date
+        return f"{report.start_date} ~ {report.end_date}"
+    if field == "owner":
+        return "공통업무" if owner == "shared" else "개인업무"
+    return report.get(field, "")
+
+
+def iter_week_reports(store, monday, owner=None):
+    """월요일(date)부터 7일 동안 걸친 보고서를 (owner, report)로 하나씩 (처음 나오는 날 순서)"""
+    start = monday.strftime("%Y-%m-%d")
+    end = (monday + timedelta(days=6)).strftime("%Y-%m-%d")
+    seen = set()
+    for _day, entries in store.find_reports_in_range(start, end, owner=owner).items():
+        for ow, _orig_date, _idx, report in entries:
+            if report.id not in seen:
+                seen.add(report.id)
+                yield ow, report
+
+
+def export_week(store, year, week, config=None, out_dir=None):
+    """ISO (year, week) 주간보고를 xlsx_template 형식으로 저장하고 파일 경로를 반환"""
+    config = config if config is not None else getattr(store, "config", {}) or {}
+    template = xlsx_template(config)
+    monday = _date.fromisocalendar(year, week, 1)
+    fields = {
+        "name": config.get("name", ""),
+        "year": year,
+        "week": week,
+        "start": monday.strftime("%Y-%m-%d"),
+        "end": (monday + timedelta(days=6)).strftime("%Y-%m-%d"),
+    }
+    out_dir = Path(out_dir) if out_dir else weekly_report_dir(config, "xlsx")
+    path = out_dir / template["file_name"].format(**fields)
+    columns = template["columns"]
+    owner = template.get("owner") or None
+
+    with XlsxStreamWriter(path, template["sheet_name"].format(**fields),
+                          widths=[c.get("width", 12) for c in columns], freeze_rows=2,
+                          header_fill=template.get("header_fill")) as writer:
+        writer.write_row([template["title"].format(**fields)], style=STYLE_TITLE)
+        writer.merge(0, max(len(columns) - 1, 0))
+        writer.write_row([c.get("header", c.get("field", "")) for c in columns], style=STYLE_HEADER)
+        for ow, report in iter_week_reports(store, monday, owner):
+            writer.write_row([_cell_value(c.get("field", ""), ow, report) for c in columns], style=STYLE_BODY)
+    return path
+
+
+def export_year(store, year, config=None, out_dir=None, skip_empty=True):
+    """year의 모든 ISO 주를 주마다 파일 하나로 저장. 한 번에 한 주씩 처리하므로 메모리 사용량이 일정하다
+    skip_empty: 보고서가 없는 주는 건너뜀. 저장한 파일 경로 목록 반환
+    """
+    config = config if config is not None else getattr(store, "config", {}) or {}
+    owner = xlsx_template(config).get("owner") or None
+    weeks = _date(year, 12, 28).isocalendar()[1]  # 12월 28일은 항상 그 해의 마지막 ISO 주
+    paths = []
+    for week in range(1, weeks + 1):
+        if skip_empty:
+            summary = store.week_summary(year, week)
+            count = summary["by_owner"].get(owner, 0) if owner else summary["reports"]
+            if not count:
+                continue
+        paths.append(export_week(store, year, week, config, out_dir))
+    return paths